@@ -1,11 +1,15 @@
 """Config file for gunicorn application."""
 
 import multiprocessing
+import typing
 
 from core.custom_logging import LOGGING_CONFIG
 
 from src.settings import Settings
 
+if typing.TYPE_CHECKING:
+    from gunicorn.arbiter import Arbiter
+
 bind = f"{Settings.SERVER_HOST}:{Settings.SERVER_PORT}"
 workers = Settings.SERVER_WORKERS_COUNT or multiprocessing.cpu_count() * 2 + 1
 worker_class = "uvicorn.workers.UvicornWorker"
@@ -21,3 +25,13 @@ timeout = 30  # seconds, default 60
 graceful_timeout = 30  # default
 logconfig_dict = LOGGING_CONFIG
 proc_name = "FastAPI_Back-end"
+
+
+def when_ready(server: "Arbiter") -> None:
+    """Logs the upper bound of PostgreSQL connections of all workers, to size pools by `Pools metrics` logs."""
+    per_worker = Settings.APP_RDMS_POOL_SIZE + Settings.APP_RDMS_POOL_MAX_OVERFLOW
+    server.log.info(
+        f"PostgreSQL connections: up to {workers * per_worker} to primary and to each of "
+        f"{len(Settings.APP_RDMS_REPLICA_URLS)} replicas ({workers} workers x ({Settings.APP_RDMS_POOL_SIZE} pool size "
+        f"+ {Settings.APP_RDMS_POOL_MAX_OVERFLOW} max overflow)).",
+    )
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from sqlalchemy import Column
 from sqlalchemy.orm import DeclarativeBase
 
+from core.enums import CountStrategy
+
 StrOrUUID = str | uuid.UUID
 StrOrNone = str | None
 ListOfAny = list[typing.Any]
@@ -20,4 +22,5 @@ ModelListOrNone = list[ModelInstance] | None
 ModelColumnInstance = typing.TypeVar("ModelColumnInstance", bound=Column)
 ResultObject = typing.TypeVar("ResultObject", bound=dict[str, None | str | int | float | dict | list])
 DatetimeOrNone = datetime.datetime | None
-CountModelListResult = tuple[int, list[ModelInstance]]
+CountResult = tuple[int | None, CountStrategy]  # Total count and strategy, that was actually used.
+CountModelListResult = tuple[int | None, CountStrategy, list[ModelInstance]]
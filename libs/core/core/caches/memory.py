@@ -0,0 +1,93 @@
+__all__ = ("TTLCache",)
+
+import collections
+import time
+import typing
+
+K = typing.TypeVar("K", bound=typing.Hashable)
+V = typing.TypeVar("V")
+
+
+class TTLCache(typing.Generic[K, V]):
+    """In-process LRU cache with time to live for each entry.
+
+    Designed to be used from a single event loop (one instance per worker), so no locking is involved.
+
+    Examples:
+        >>> cache = TTLCache[str, int](maxsize=2, ttl=60)
+        >>> cache.set(key="a", value=1)
+        >>> cache.get(key="a")
+        1
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float | None = 60.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: collections.OrderedDict[K, tuple[float | None, V]] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of stored entries (including expired, but not evicted yet)."""
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        """Check that key presents in cache and not expired."""
+        return self.get(key=key, default=None) is not None
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries in cache."""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        """Default time to live (in seconds) for entries."""
+        return self._ttl
+
+    def get(self, *, key: K, default: V | None = None) -> V | None:
+        """Retrieve value by key and mark it as recently used.
+
+        Keyword Args:
+            key (K): Cache key.
+            default (V | None): Value that returned in case of miss.
+
+        Returns:
+            (V | None): Cached value or default.
+        """
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return default
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key=key)
+        return value
+
+    def set(self, *, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value, evicts the least recently used entry on overflow.
+
+        Keyword Args:
+            key (K): Cache key.
+            value (V): Value to store.
+            ttl (float | None): Time to live in seconds, default TTL of cache used if not provided.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        self._data[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        self._data.move_to_end(key=key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, *, key: K) -> bool:
+        """Remove entry by key, returns True if entry existed."""
+        return self._data.pop(key, None) is not None
+
+    def delete_where(self, *, predicate: typing.Callable[[K], bool]) -> int:
+        """Remove all entries which keys match predicate, returns number of removed entries."""
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
@@ -0,0 +1,204 @@
+"""In-process cache of hot Redis keys with server-assisted invalidation (Redis 6+ client-side caching).
+
+One dedicated connection per worker enables tracking in broadcasting mode for configured key prefixes and redirects
+invalidation messages to itself:
+    CLIENT ID -> CLIENT TRACKING ON REDIRECT <own id> BCAST PREFIX <prefix> ... -> SUBSCRIBE __redis__:invalidate
+
+Redis then sends names of keys under the prefixes on every change of them (by any client), so cached values are evicted
+exactly, without TTLs and channels of each cache. Values are served from memory only while the connection is alive,
+all of them are dropped when it breaks (messages could be lost).
+"""
+
+__all__ = (
+    "INVALIDATE_CHANNEL",
+    "NearCache",
+    "near_cache",
+)
+
+import asyncio
+import functools
+import itertools
+import typing
+
+import redis.asyncio as aioredis
+import redis.exceptions
+from core.caches.memory import TTLCache
+from core.caches.settings import caches_settings
+from core.custom_logging import get_logger
+from core.db.bases import redis_engine
+
+logger = get_logger(name=__name__)
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+Field = str | None  # Field of a hash or None for a string key.
+
+
+class NearCache:
+    """Cache of Redis strings and hash fields under `prefixes` in worker's memory, invalidated by Redis.
+
+    Notes:
+        Missing keys are cached as well (creation of a key is a change too). Reads in flight, that race with
+        invalidation, aren't stored (see `_generation`).
+
+    Examples:
+        >>> near = NearCache(redis_client=redis_engine, prefixes=["flags:"])
+        >>> asyncio.create_task(near.listen())
+        >>> await near.get(name="flags:signup")  # Redis
+        >>> await near.get(name="flags:signup")  # memory, until `flags:signup` changes
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: aioredis.Redis,
+        prefixes: typing.Iterable[str],
+        enabled: bool = True,
+        maxsize: int = 10_000,
+        ttl: float | None = 300.0,
+        health_check_interval: float = 5.0,
+    ) -> None:
+        self._redis = redis_client
+        self._prefixes = tuple(prefixes)
+        self._enabled = enabled
+        self._local: TTLCache[str, dict[Field, typing.Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._health_check_interval = health_check_interval
+        self._tracking = False
+        self._generation = 0  # Incremented on each invalidation.
+
+    @property
+    def tracking(self) -> bool:
+        """Check that invalidation connection is alive, so values are served from memory."""
+        return self._tracking
+
+    def covers(self, *, name: str) -> bool:
+        """Check that the key is under tracked prefixes."""
+        return self._enabled and name.startswith(self._prefixes)
+
+    async def get(self, *, name: str) -> typing.Any:  # noqa: ANN401
+        """Retrieve value of the string key (from memory if it's cached)."""
+        return await self._get(name=name, field=None, read=functools.partial(self._redis.get, name=name))
+
+    async def hget(self, *, name: str, key: str) -> typing.Any:  # noqa: ANN401
+        """Retrieve value of the hash field (from memory if it's cached)."""
+        return await self._get(name=name, field=key, read=functools.partial(self._redis.hget, name=name, key=key))
+
+    async def mget(self, *, names: list[str]) -> list[typing.Any]:
+        """Retrieve values of the string keys, only missing in memory are requested from Redis (by one MGET)."""
+        missing = object()
+        values = [self._cached(name=name, field=None, default=missing) for name in names]
+        if not (names_to_read := [name for name, value in zip(names, values, strict=True) if value is missing]):
+            return values
+
+        generation = self._generation
+        read = iter(await self._redis.mget(names_to_read))
+        for index, value in enumerate(values):
+            if value is missing:
+                values[index] = next(read)
+                self._store(name=names[index], field=None, value=values[index], generation=generation)
+        return values
+
+    def invalidate(self, *, names: typing.Iterable[str] | None) -> None:
+        """Evict keys from memory (all keys if `names` is None)."""
+        self._generation += 1
+        if names is None:
+            self._local.clear()
+            return
+        for name in names:
+            self._local.delete(key=name)
+
+    async def listen(self) -> None:
+        """Enable tracking and evict keys on invalidation messages (run as background task per worker)."""
+        while self._enabled and self._prefixes:
+            connection = self._connection()
+            try:
+                await self._track(connection=connection)
+                await self._consume(connection=connection)
+            except asyncio.CancelledError:
+                raise
+            except redis.exceptions.RedisError as error:
+                logger.warning(msg=f"{self.__class__.__name__} | listen | {error}")
+            finally:
+                self._tracking = False
+                self.invalidate(names=None)
+                await connection.disconnect()
+            await asyncio.sleep(1)
+
+    async def _get(
+        self,
+        *,
+        name: str,
+        field: Field,
+        read: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:  # noqa: ANN401
+        missing = object()
+        if (value := self._cached(name=name, field=field, default=missing)) is not missing:
+            return value
+        generation = self._generation
+        value = await read()
+        self._store(name=name, field=field, value=value, generation=generation)
+        return value
+
+    def _cached(self, *, name: str, field: Field, default: object) -> typing.Any:  # noqa: ANN401
+        if not self._tracking or not self.covers(name=name):
+            return default
+        return self._local.get(key=name, default={}).get(field, default)
+
+    def _store(self, *, name: str, field: Field, value: typing.Any, generation: int) -> None:  # noqa: ANN401
+        # Value read before the latest invalidation could be outdated already.
+        if not self._tracking or not self.covers(name=name) or generation != self._generation:
+            return
+        if (fields := self._local.get(key=name)) is None:
+            self._local.set(key=name, value={field: value})
+        else:
+            fields[field] = value
+
+    def _connection(self) -> aioredis.Connection:
+        # Dedicated RESP2 connection (invalidations are regular Pub/Sub messages), not taken from the pool.
+        pool = self._redis.connection_pool
+        return pool.connection_class(**{**pool.connection_kwargs, "protocol": 2})
+
+    async def _track(self, *, connection: aioredis.Connection) -> None:
+        await connection.connect()
+        await connection.send_command("CLIENT", "ID")
+        client_id = await connection.read_response()
+        prefixes = itertools.chain.from_iterable(("PREFIX", prefix) for prefix in self._prefixes)
+        await connection.send_command("CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefixes)
+        await connection.read_response()
+        await connection.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await connection.read_response()
+        self.invalidate(names=None)
+        self._tracking = True
+        logger.debug(msg=f"{self.__class__.__name__} | tracking | {self._prefixes}")
+
+    async def _consume(self, *, connection: aioredis.Connection) -> None:
+        ping_sent = False
+        while True:
+            message = await connection.read_response(timeout=self._health_check_interval)
+            if message is None:
+                # Connection could be lost silently, then invalidations are lost too.
+                if ping_sent:
+                    msg = "Invalidation connection doesn't respond."
+                    raise redis.exceptions.TimeoutError(msg)
+                await connection.send_command("PING")
+                ping_sent = True
+                continue
+
+            kind, *data = (_decode(value=item) for item in message)
+            if kind == "pong":
+                ping_sent = False
+            elif kind == "message":
+                # [message, __redis__:invalidate, [keys...]] or None for all keys (e.g. on FLUSHALL).
+                self.invalidate(names=None if data[1] is None else [_decode(value=name) for name in data[1]])
+
+
+def _decode(*, value: typing.Any) -> typing.Any:  # noqa: ANN401
+    return value.decode() if isinstance(value, bytes) else value
+
+
+near_cache = NearCache(
+    redis_client=redis_engine,
+    prefixes=caches_settings.CACHES_NEAR_PREFIXES,
+    enabled=caches_settings.CACHES_NEAR_ENABLED,
+    maxsize=caches_settings.CACHES_NEAR_MAXSIZE,
+    ttl=caches_settings.CACHES_NEAR_TTL_SECONDS,
+)
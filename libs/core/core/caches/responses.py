@@ -0,0 +1,329 @@
+"""Redis cache of read endpoints' responses with tag-based invalidation, stale-while-revalidate and single-flight."""
+
+__all__ = (
+    "CACHE_TAGS_INFO_KEY",
+    "ResponseCache",
+    "mark_written",
+    "response_cache",
+)
+
+import asyncio
+import datetime
+import decimal
+import enum
+import functools
+import hashlib
+import inspect
+import time
+import typing
+import uuid
+from collections.abc import Iterable
+
+import orjson
+from fastapi import BackgroundTasks, Request, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import redis.asyncio as aioredis
+import redis.exceptions
+from core.caches.near import NearCache, near_cache
+from core.caches.settings import caches_settings
+from core.caches.single_flight import SingleFlight
+from core.custom_logging import get_logger
+from core.db.bases import redis_engine
+
+logger = get_logger(name=__name__)
+
+CACHE_TAGS_INFO_KEY = "cache_tags"  # `session.info` key with tags (tables) written in the session.
+Endpoint = typing.Callable[..., typing.Awaitable[typing.Any]]
+# Arguments of endpoints, that don't define the response.
+SKIPPED_TYPES = (AsyncSession, aioredis.Redis, Request, Response, BackgroundTasks)
+SCALAR_TYPES = (str, int, float, bool, uuid.UUID, datetime.date, datetime.time, decimal.Decimal, type(None))
+
+
+def mark_written(*, session: AsyncSession, tags: Iterable[str]) -> None:
+    """Remember tags (tables) written in the session, they are invalidated after commit (see `invalidate_written`)."""
+    session.info.setdefault(CACHE_TAGS_INFO_KEY, set()).update(tags)
+
+
+class ResponseCache:
+    """Redis cache of serialized responses of read endpoints, tagged by tables they read.
+
+    1) Each tag has a version counter in Redis. Versions of endpoint's tags are a part of entry's key, so invalidation
+    is one `INCR` per tag and outdated entries are never read again (they expire by TTL). Versions are read far more
+    often than changed, so they can be served from `NearCache`.
+    2) Entry is fresh for `ttl` seconds, then it is served stale for `stale` seconds, while one request (that holds
+    Redis lock) refreshes it.
+    3) On a miss concurrent requests of the worker await one computation (`SingleFlight`), requests of other workers
+    await the lock holder to store the entry (up to `lock_timeout`).
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: aioredis.Redis,
+        near: NearCache | None = None,
+        enabled: bool = True,
+        ttl: float = 30.0,
+        stale: float = 60.0,
+        lock_timeout: float = 5.0,
+        key_prefix: str = "cache:responses",
+    ) -> None:
+        self._redis = redis_client
+        self._near = near
+        self._enabled = enabled
+        self._ttl = ttl
+        self._stale = stale
+        self._lock_timeout = lock_timeout
+        self._key_prefix = key_prefix
+        self._flight: SingleFlight[str, str] = SingleFlight()
+
+    def tag_key(self, *, tag: str) -> str:
+        """Construct Redis key for version of the tag."""
+        return f"{self._key_prefix}:tags:{tag}"
+
+    def key(self, *, request: Request, scope: str, versions: list[int], values: list[typing.Any]) -> str:
+        """Construct Redis key for the response by path, query, principal's scope, tags' versions and request values.
+
+        Args:
+            request (Request): Current request.
+            scope (str): `public` or authenticated principal's id.
+            versions (list[int]): Current versions of endpoint's tags.
+            values (list[Any]): Canonical values of endpoint's dependencies and bodies (see `canonical_values`).
+        """
+        payload = [request.url.path, sorted(request.query_params.multi_items()), values]
+        digest = hashlib.sha256(orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        return f"{self._key_prefix}:{scope}:{'.'.join(map(str, versions))}:{digest}"
+
+    @classmethod
+    def canonical_values(cls, kwargs: dict[str, typing.Any]) -> list[typing.Any]:
+        """Returns values of endpoint's arguments, that define the response.
+
+        Filtration, Sorting, Pagination, Projection and Searching (per-request values returned by them) are
+        represented by their `shape` and `params` (the same as for statement reuse), bodies by their JSON dump.
+        Sessions, clients, etc. (`SKIPPED_TYPES`) are skipped.
+
+        Raises:
+            TypeError: Value can't be represented, so the response can't be cached.
+        """
+        return [
+            [name, cls._canonical(value=value)]
+            for name, value in sorted(kwargs.items())
+            if not isinstance(value, SKIPPED_TYPES)
+        ]
+
+    @classmethod
+    def _canonical(cls, *, value: typing.Any) -> typing.Any:  # noqa: ANN401
+        if hasattr(value, "shape"):
+            # Position by `page` isn't a part of the shape (it is sought by the repository).
+            parts = (value.shape, getattr(value, "params", None), getattr(value, "page", None))
+            return [cls._canonical(value=part) for part in parts]
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        if isinstance(value, enum.Enum):
+            value = value.value
+        if isinstance(value, SCALAR_TYPES):
+            return value
+        if isinstance(value, list | tuple):
+            return [cls._canonical(value=item) for item in value]
+        if isinstance(value, set | frozenset):
+            return sorted(
+                (cls._canonical(value=item) for item in value), key=lambda item: orjson.dumps(item, default=str)
+            )
+        if isinstance(value, dict):
+            return {str(key): cls._canonical(value=item) for key, item in value.items()}
+        msg = f"{type(value).__name__} can't be a part of the cache key."
+        raise TypeError(msg)
+
+    @staticmethod
+    def scope(*, request: Request, public: bool) -> str:
+        """Returns `public` or authenticated principal's scope of the response."""
+        user = request.scope.get("user")
+        if public or user is None or not getattr(user, "is_authenticated", False):
+            return "public"
+        return f"user:{user.id}"
+
+    async def versions(self, *, tags: Iterable[str]) -> list[int]:
+        """Retrieve current versions of tags (from worker's memory, if tags' keys are in `near` cache)."""
+        keys = [self.tag_key(tag=tag) for tag in tags]
+        raw = await (self._near.mget(names=keys) if self._near else self._redis.mget(keys))
+        return [int(version or 0) for version in raw]
+
+    async def invalidate(self, *, tags: Iterable[str]) -> None:
+        """Invalidate all responses tagged by any of the tags (e.g. after writes to tables)."""
+        tags = list(tags)
+        if not tags:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.incr(name=self.tag_key(tag=tag))
+                await pipe.execute()
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | invalidate | {error}")
+
+    async def invalidate_written(self, *, session: AsyncSession) -> None:
+        """Invalidate tags written in the session (call after commit, see `mark_written`)."""
+        await self.invalidate(tags=session.info.pop(CACHE_TAGS_INFO_KEY, ()))
+
+    async def get_or_compute(
+        self,
+        *,
+        key: str,
+        compute: typing.Callable[[], typing.Awaitable[str]],
+        ttl: float | None = None,
+        stale: float | None = None,
+    ) -> tuple[str, str]:
+        """Retrieve response body from cache or compute it.
+
+        Returns:
+            (tuple[str, str]): Body and cache status: `HIT`, `STALE` or `MISS`.
+        """
+        compute_and_store = functools.partial(
+            self._compute_and_store,
+            key=key,
+            compute=compute,
+            ttl=self._ttl if ttl is None else ttl,
+            stale=self._stale if stale is None else stale,
+        )
+        raw = await self._redis.get(name=key)
+        if raw is not None:
+            fresh_until, _, body = raw.partition("\n")
+            if float(fresh_until) > time.time():
+                return body, "HIT"
+            # Only one request refreshes the entry, others (and requests while it refreshes) get the stale one.
+            if key in self._flight or not await self._lock(key=key):
+                return body, "STALE"
+            return await self._flight.do(key=key, func=functools.partial(compute_and_store, locked=True)), "MISS"
+
+        return await self._flight.do(key=key, func=compute_and_store), "MISS"
+
+    async def _compute_and_store(
+        self,
+        *,
+        key: str,
+        compute: typing.Callable[[], typing.Awaitable[str]],
+        ttl: float,
+        stale: float,
+        locked: bool = False,
+    ) -> str:
+        locked = locked or await self._lock(key=key)
+        if not locked:
+            # Another worker computes the response, wait for it.
+            deadline = time.monotonic() + self._lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                if (raw := await self._redis.get(name=key)) is not None:
+                    return raw.partition("\n")[2]
+
+        try:
+            body = await compute()
+            await self._redis.set(name=key, value=f"{time.time() + ttl}\n{body}", ex=max(1, round(ttl + stale)))
+        finally:
+            if locked:
+                await self._redis.delete(f"{key}:lock")
+        return body
+
+    async def _lock(self, *, key: str) -> bool:
+        return bool(await self._redis.set(name=f"{key}:lock", value=1, nx=True, px=round(self._lock_timeout * 1000)))
+
+    def cached(
+        self,
+        *,
+        tags: Iterable[str],
+        ttl: float | None = None,
+        stale: float | None = None,
+        public: bool = False,
+        response_model: typing.Any = None,  # noqa: ANN401
+    ) -> typing.Callable[[Endpoint], Endpoint]:
+        """Decorator for read endpoints, that caches their JSON responses.
+
+        Responses are serialized by `response_model` the same way as FastAPI does (only its fields, by aliases), as
+        cached responses bypass FastAPI's serialization. Requests with arguments, that can't be a part of the cache
+        key (see `canonical_values`), aren't cached.
+
+        Keyword Args:
+            tags (Iterable[str]): Tables that the endpoint reads, writes to them invalidate responses.
+            ttl (float | None): Time while response is fresh (default from settings).
+            stale (float | None): Time after `ttl` while stale response is served (default from settings).
+            public (bool): Share responses between principals (by default each principal has own responses).
+            response_model (Any): Model of the response (endpoint's return annotation if not set).
+
+        Raises:
+            TypeError: Endpoint has neither `response_model` nor return annotation.
+
+        Examples:
+            >>> router.add_api_route(path="/", endpoint=response_cache.cached(tags=["user"])(list_users))
+        """
+        tags = tuple(tags)
+
+        def decorator(endpoint: Endpoint) -> Endpoint:
+            signature = inspect.signature(endpoint)
+            model = response_model or typing.get_type_hints(endpoint).get("return")
+            if model is None:
+                msg = f"Cached endpoint {endpoint.__name__} requires `response_model` or return annotation."
+                raise TypeError(msg)
+            adapter = TypeAdapter(model)
+            request_name = next(
+                (name for name, param in signature.parameters.items() if param.annotation in (Request, "Request")),
+                None,
+            )
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
+                request: Request = kwargs[request_name] if request_name else kwargs.pop("cache_request")
+                if not self._enabled:
+                    return await endpoint(*args, **kwargs)
+
+                async def compute() -> str:
+                    result = await endpoint(*args, **kwargs)
+                    return adapter.dump_json(
+                        adapter.validate_python(result, from_attributes=True), by_alias=True
+                    ).decode()
+
+                try:
+                    values = self.canonical_values(kwargs=kwargs)
+                except TypeError as error:
+                    logger.debug(msg=f"{self.__class__.__name__} | cached | {endpoint.__name__} isn't cached | {error}")
+                    return await endpoint(*args, **kwargs)
+
+                try:
+                    versions = await self.versions(tags=tags)
+                    key = self.key(
+                        request=request,
+                        scope=self.scope(request=request, public=public),
+                        versions=versions,
+                        values=values,
+                    )
+                    body, status = await self.get_or_compute(key=key, compute=compute, ttl=ttl, stale=stale)
+                except redis.exceptions.RedisError as error:
+                    logger.warning(msg=f"{self.__class__.__name__} | cached | Redis is unavailable | {error}.")
+                    return await endpoint(*args, **kwargs)
+                return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+
+            if request_name is None:
+                # FastAPI provides Request only by parameter, so it is added to the signature of the wrapper.
+                parameters = list(signature.parameters.values())
+                position = next(
+                    (i for i, param in enumerate(parameters) if param.kind == inspect.Parameter.VAR_KEYWORD),
+                    len(parameters),
+                )
+                parameters.insert(
+                    position,
+                    inspect.Parameter("cache_request", kind=inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                )
+                wrapper.__signature__ = signature.replace(parameters=parameters)
+            return wrapper
+
+        return decorator
+
+
+response_cache = ResponseCache(
+    redis_client=redis_engine,
+    near=near_cache,
+    enabled=caches_settings.CACHES_RESPONSES_ENABLED,
+    ttl=caches_settings.CACHES_RESPONSES_TTL_SECONDS,
+    stale=caches_settings.CACHES_RESPONSES_STALE_SECONDS,
+    lock_timeout=caches_settings.CACHES_RESPONSES_LOCK_TIMEOUT_SECONDS,
+    key_prefix=caches_settings.CACHES_RESPONSES_KEY_PREFIX,
+)
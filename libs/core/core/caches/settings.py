@@ -0,0 +1,46 @@
+import functools
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CachesSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        extra="ignore",
+        env_file_encoding="utf-8",
+        env_prefix="",
+        env_nested_delimiter="__",
+    )
+
+    CACHES_RESPONSES_ENABLED: bool = Field(default=True)
+    CACHES_RESPONSES_TTL_SECONDS: float = Field(default=30.0, description="Time while cached response is fresh.")
+    CACHES_RESPONSES_STALE_SECONDS: float = Field(
+        default=60.0,
+        description="Time after `TTL` while stale response is served, until one request refreshes it.",
+    )
+    CACHES_RESPONSES_LOCK_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        description="Time that other workers wait for the one computing missing response, then compute it as well.",
+    )
+    CACHES_RESPONSES_KEY_PREFIX: str = Field(default="cache:responses")
+
+    CACHES_NEAR_ENABLED: bool = Field(
+        default=False, description="Serve hot Redis keys from worker's memory (requires Redis >= 6, CLIENT TRACKING)."
+    )
+    CACHES_NEAR_PREFIXES: list[str] = Field(
+        default=["cache:responses:tags:", "authorization:principals:"],
+        description="Prefixes of Redis keys, that are read far more often than written.",
+    )
+    CACHES_NEAR_MAXSIZE: int = Field(default=10_000, description="Number of Redis keys kept in memory per worker.")
+    CACHES_NEAR_TTL_SECONDS: float = Field(
+        default=300.0, description="Upper bound of time in memory (keys are evicted on change by Redis anyway)."
+    )
+
+
+@functools.lru_cache
+def get_caches_settings() -> CachesSettings:
+    """Default getter with cache for CachesSettings."""
+    return CachesSettings()
+
+
+caches_settings: CachesSettings = get_caches_settings()
@@ -0,0 +1,67 @@
+__all__ = ("SingleFlight",)
+
+import asyncio
+import typing
+
+K = typing.TypeVar("K", bound=typing.Hashable)
+V = typing.TypeVar("V")
+
+
+class SingleFlight(typing.Generic[K, V]):
+    """Coalesces concurrent calls with the same key into one execution, others await its result.
+
+    Designed to be used from a single event loop (one instance per worker), so no locking is involved.
+
+    Examples:
+        >>> flight = SingleFlight[str, int]()
+        >>> await asyncio.gather(flight.do(key="a", func=compute), flight.do(key="a", func=compute))  # one call
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        """Check that call with the key is in flight."""
+        return key in self._calls
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, *, key: K, func: typing.Callable[[], typing.Awaitable[V]]) -> V:
+        """Execute `func` or await the result of the same call in flight.
+
+        Keyword Args:
+            key (K): Key of the call.
+            func (Callable[[], Awaitable[V]]): Coroutine function, that is called once for all concurrent callers.
+
+        Returns:
+            (V): Result of the call (exception of the call is raised for all callers).
+
+        Notes:
+            Cancellation of the caller, that executes `func`, isn't propagated to others: the first of them executes
+            `func` again and the rest await it.
+        """
+        while (future := self._calls.get(key)) is not None:
+            # Unlike `shield`, `wait` neither cancels the call nor raises, when the call is cancelled.
+            await asyncio.wait((future,))
+            if not future.cancelled():
+                return future.result()
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark exception as retrieved, when nobody else awaits the call.
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -3,18 +3,26 @@ __all__ = (
     "NAMING_CONVENTION",
     "Base",
     "async_engine",
+    "async_read_session_factory",
     "async_session_factory",
+    "create_engine",
     "redis_engine",
+    "replica_set",
 )
 
+import uuid
+
 from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import (
     declarative_base,
 )
 
 import redis.asyncio as aioredis
 from core.db.mixins import BaseTableModelMixin
+from core.db.pools import InstrumentedAsyncQueuePool, InstrumentedRedis, InstrumentedRedisPool
+from core.db.routing import READ_ONLY_INFO_KEY, ReplicaSet, RoutingSession
 from core.db.settings import db_settings
 
 NAMING_CONVENTION = {
@@ -26,23 +34,75 @@ NAMING_CONVENTION = {
 }
 CASCADES = {"ondelete": "CASCADE", "onupdate": "CASCADE"}
 
+
+def create_engine(url: URL | str) -> AsyncEngine:
+    """Creates async engine with the pool and asyncpg settings from `db_settings`."""
+    if db_settings.APP_RDMS_PGBOUNCER:
+        # PgBouncer (transaction mode) may run statements on other server connections than they were prepared on.
+        connect_args = {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    else:
+        connect_args = {"prepared_statement_cache_size": db_settings.APP_RDMS_PREPARED_STATEMENT_CACHE_SIZE}
+    return create_async_engine(
+        url=url,
+        echo=db_settings.APP_RDMS_ECHO,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=db_settings.APP_RDMS_POOL_SIZE,
+        max_overflow=db_settings.APP_RDMS_POOL_MAX_OVERFLOW,
+        pool_timeout=db_settings.APP_RDMS_POOL_TIMEOUT_SECONDS,
+        pool_recycle=db_settings.APP_RDMS_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=db_settings.APP_RDMS_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
 Base = declarative_base(cls=BaseTableModelMixin, metadata=MetaData(naming_convention=NAMING_CONVENTION))
-async_engine = create_async_engine(url=db_settings.APP_RDMS_URL, echo=db_settings.APP_RDMS_ECHO)
-async_session_factory = async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False, future=True)
-redis_engine = aioredis.Redis(
-    host=db_settings.REDIS_HOST,
-    port=db_settings.REDIS_PORT,
-    db=db_settings.REDIS_DB,
-    password=db_settings.REDIS_PASSWORD,
-    encoding=db_settings.REDIS_ENCODING,
-    decode_responses=db_settings.REDIS_DECODE_RESPONSES,
-    retry_on_timeout=True,
-    max_connections=db_settings.REDIS_POOL_MAX_CONNECTIONS,
-    client_name="FastAPI_client",
-    username=db_settings.REDIS_USER,
-    ssl=db_settings.REDIS_SECURE,
-    # ssl_keyfile=PROJECT_BASE_DIR / "redis/certs/redis.key",
-    # ssl_certfile=PROJECT_BASE_DIR / "redis/certs/redis.crt",
-    # ssl_cert_reqs="required",
-    # ssl_ca_certs=PROJECT_BASE_DIR / "redis/certs/ca.crt",
+async_engine = create_engine(url=db_settings.APP_RDMS_URL)
+replica_set = ReplicaSet(
+    engines=[create_engine(url=url) for url in db_settings.APP_RDMS_REPLICA_URLS],
+    balancing=db_settings.APP_RDMS_REPLICA_BALANCING,
+    max_lag=db_settings.APP_RDMS_REPLICA_MAX_LAG_SECONDS,
+    check_interval=db_settings.APP_RDMS_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+)
+_session_kwargs = {
+    "bind": async_engine,
+    "class_": AsyncSession,
+    "sync_session_class": RoutingSession.with_replicas(replicas=replica_set),
+    "expire_on_commit": False,
+    "future": True,
+}
+async_session_factory = async_sessionmaker(**_session_kwargs)
+# Sessions for read-only work, their reads go to replicas (see `RoutingSession`) or `READ ONLY` transactions.
+_read_only_options = (
+    {"isolation_level": "SERIALIZABLE", "postgresql_readonly": True, "postgresql_deferrable": True}
+    if db_settings.APP_RDMS_READ_ONLY_DEFERRABLE
+    else {"postgresql_readonly": True}
+)
+async_read_session_factory = async_sessionmaker(
+    **{**_session_kwargs, "bind": async_engine.execution_options(**_read_only_options)},
+    info={READ_ONLY_INFO_KEY: True},
+)
+redis_engine = InstrumentedRedis(
+    connection_pool=InstrumentedRedisPool(
+        connection_class=aioredis.SSLConnection if db_settings.REDIS_SECURE else aioredis.Connection,
+        host=db_settings.REDIS_HOST,
+        port=db_settings.REDIS_PORT,
+        db=db_settings.REDIS_DB,
+        password=db_settings.REDIS_PASSWORD,
+        encoding=db_settings.REDIS_ENCODING,
+        decode_responses=db_settings.REDIS_DECODE_RESPONSES,
+        retry_on_timeout=True,
+        max_connections=db_settings.REDIS_POOL_MAX_CONNECTIONS,
+        timeout=db_settings.REDIS_POOL_TIMEOUT_SECONDS,
+        client_name="FastAPI_client",
+        username=db_settings.REDIS_USER,
+        protocol=db_settings.REDIS_PROTOCOL,
+        # ssl_keyfile=PROJECT_BASE_DIR / "redis/certs/redis.key",
+        # ssl_certfile=PROJECT_BASE_DIR / "redis/certs/redis.crt",
+        # ssl_cert_reqs="required",
+        # ssl_ca_certs=PROJECT_BASE_DIR / "redis/certs/ca.crt",
+    ),
 )
@@ -0,0 +1,28 @@
+"""Callbacks of the session, that run after its transaction is committed."""
+
+__all__ = (
+    "AFTER_COMMIT_INFO_KEY",
+    "after_commit",
+    "run_after_commit",
+)
+
+import typing
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+AFTER_COMMIT_INFO_KEY = "after_commit"  # `session.info` key with callbacks, that run after commit.
+Callback = typing.Callable[[], typing.Awaitable[typing.Any]]
+
+
+def after_commit(*, session: AsyncSession, callback: Callback) -> None:
+    """Remember callback (e.g. invalidation of a cache), it runs only after the session is committed.
+
+    Before commit other requests could read old rows and cache them again, after rollback there is nothing to do.
+    """
+    session.info.setdefault(AFTER_COMMIT_INFO_KEY, []).append(callback)
+
+
+async def run_after_commit(*, session: AsyncSession) -> None:
+    """Run callbacks remembered in the session (call after commit, see `after_commit`)."""
+    for callback in session.info.pop(AFTER_COMMIT_INFO_KEY, ()):
+        await callback()
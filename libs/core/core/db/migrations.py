@@ -0,0 +1,60 @@
+"""Helpers for Alembic migrations."""
+
+__all__ = (
+    "create_search_vector",
+    "create_trigram_index",
+    "drop_search_vector",
+    "drop_trigram_index",
+)
+
+import typing
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from core.db.search import SearchVector, Weight
+
+
+def create_search_vector(
+    *,
+    table_name: str,
+    column_name: str,
+    weights: dict[str, Weight],
+    language: str = "simple",
+) -> None:
+    """Adds a stored generated `tsvector` column (see `search_vector_column`) with a GIN index."""
+    vector = SearchVector(language=language, weights=weights)
+    op.add_column(
+        table_name,
+        sa.Column(column_name, TSVECTOR(), sa.Computed(vector.expression, persisted=True), nullable=True),
+    )
+    op.create_index(op.f(f"ix_{table_name}_{column_name}"), table_name, [column_name], postgresql_using="gin")
+
+
+def drop_search_vector(*, table_name: str, column_name: str) -> None:
+    """Drops a `tsvector` column created by `create_search_vector` together with its index."""
+    op.drop_index(op.f(f"ix_{table_name}_{column_name}"), table_name=table_name, postgresql_using="gin")
+    op.drop_column(table_name, column_name)
+
+
+def create_trigram_index(
+    *,
+    table_name: str,
+    column_name: str,
+    using: typing.Literal["gin", "gist"] = "gin",
+) -> None:
+    """Creates `pg_trgm` extension (if missing) and an index declared by `trigram_index`."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        op.f(f"ix_{table_name}_{column_name}_trgm"),
+        table_name,
+        [column_name],
+        postgresql_using=using,
+        postgresql_ops={column_name: f"{using}_trgm_ops"},
+    )
+
+
+def drop_trigram_index(*, table_name: str, column_name: str) -> None:
+    """Drops an index created by `create_trigram_index` (the extension is kept, other objects may use it)."""
+    op.drop_index(op.f(f"ix_{table_name}_{column_name}_trgm"), table_name=table_name)
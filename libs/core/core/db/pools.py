@@ -0,0 +1,197 @@
+"""Instrumented connection pools of async engines and Redis client."""
+
+__all__ = (
+    "CommandMetrics",
+    "InstrumentedAsyncQueuePool",
+    "InstrumentedRedis",
+    "InstrumentedRedisPool",
+    "PoolMetrics",
+    "log_pools_metrics",
+    "pools_snapshot",
+)
+
+import asyncio
+import dataclasses
+import time
+import typing
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+import redis.asyncio as aioredis
+import redis.exceptions
+from core.custom_logging import get_logger
+
+logger = get_logger(name=__name__)
+
+
+@dataclasses.dataclass
+class PoolMetrics:
+    """Counters of the connection pool since the worker started."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    in_use_max: int = 0
+    overflow_max: int = 0
+
+    def observe(self, *, wait: float, in_use: int, overflow: int, timed_out: bool = False) -> None:
+        """Records one checkout (or timed out attempt) of a connection."""
+        self.checkouts += not timed_out
+        self.timeouts += timed_out
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self.in_use_max = max(self.in_use_max, in_use)
+        self.overflow_max = max(self.overflow_max, overflow)
+
+
+@dataclasses.dataclass
+class CommandMetrics:
+    """Latency of a Redis command since the worker started."""
+
+    count: int = 0
+    seconds_total: float = 0.0
+    seconds_max: float = 0.0
+
+    def observe(self, *, seconds: float) -> None:
+        """Records one execution of the command."""
+        self.count += 1
+        self.seconds_total += seconds
+        self.seconds_max = max(self.seconds_max, seconds)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Pool of async engines, that collects `PoolMetrics` on checkout.
+
+    Wait time includes opening a new connection, when the pool has none idle. Used to size the pool per worker
+    (`APP_RDMS_POOL_SIZE`, `APP_RDMS_POOL_MAX_OVERFLOW`) by data: frequent waits or overflow mean the pool is too
+    small, `in_use_max` far below the pool size means it is too big for the number of workers.
+
+    Examples:
+        >>> create_async_engine(url=url, poolclass=InstrumentedAsyncQueuePool)
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Current state and counters of the pool."""
+        return {
+            "size": self.size(),
+            "in_use": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            **dataclasses.asdict(self.metrics),
+        }
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics  # Keep counters when the pool is recreated (e.g. on `dispose`).
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            self._observe(started=started, timed_out=True)
+            raise
+        self._observe(started=started)
+        return entry
+
+    def _observe(self, *, started: float, timed_out: bool = False) -> None:
+        self.metrics.observe(
+            wait=time.perf_counter() - started,
+            in_use=self.checkedout(),
+            overflow=max(0, self.overflow()),
+            timed_out=timed_out,
+        )
+
+
+class InstrumentedRedisPool(aioredis.BlockingConnectionPool):
+    """Redis connection pool, that collects `PoolMetrics` on checkout and `CommandMetrics` of `InstrumentedRedis`.
+
+    When all `max_connections` are in use, commands wait for a free connection up to `timeout` (saturation shows as
+    wait time), then fail with `ConnectionError` (counted as timeout).
+    """
+
+    def __init__(self, **kwargs: typing.Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self.metrics = PoolMetrics()
+        self.commands: dict[str, CommandMetrics] = {}
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Current state and counters of the pool and latency of commands."""
+        return {
+            "size": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "idle": len(self._available_connections),
+            **dataclasses.asdict(self.metrics),
+            "commands": {name: dataclasses.asdict(metrics) for name, metrics in sorted(self.commands.items())},
+        }
+
+    async def get_connection(self, *args: typing.Any, **kwargs: typing.Any) -> aioredis.Connection:  # noqa: ANN401
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except redis.exceptions.ConnectionError:
+            self._observe(started=started, timed_out=True)
+            raise
+        self._observe(started=started)
+        return connection
+
+    def _observe(self, *, started: float, timed_out: bool = False) -> None:
+        self.metrics.observe(
+            wait=time.perf_counter() - started,
+            in_use=len(self._in_use_connections),
+            overflow=0,
+            timed_out=timed_out,
+        )
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """Redis client, that records latency of commands into its `InstrumentedRedisPool`.
+
+    Examples:
+        >>> InstrumentedRedis(connection_pool=InstrumentedRedisPool(host="localhost", max_connections=100))
+    """
+
+    async def execute_command(self, *args: typing.Any, **options: typing.Any) -> typing.Any:  # noqa: ANN401
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            if isinstance(self.connection_pool, InstrumentedRedisPool):
+                metrics = self.connection_pool.commands.setdefault(str(args[0]).upper(), CommandMetrics())
+                metrics.observe(seconds=time.perf_counter() - started)
+
+
+def pools_snapshot(
+    *,
+    engines: list[AsyncEngine],
+    redis_client: aioredis.Redis | None = None,
+) -> dict[str, dict[str, typing.Any]]:
+    """Returns snapshots of instrumented pools of the engines by host (and of Redis client as `redis`)."""
+    snapshots = {
+        f"{engine.url.host}:{engine.url.port}": engine.sync_engine.pool.snapshot()
+        for engine in engines
+        if isinstance(engine.sync_engine.pool, InstrumentedAsyncQueuePool)
+    }
+    if redis_client is not None and isinstance(redis_client.connection_pool, InstrumentedRedisPool):
+        snapshots["redis"] = redis_client.connection_pool.snapshot()
+    return snapshots
+
+
+async def log_pools_metrics(
+    *,
+    engines: list[AsyncEngine],
+    redis_client: aioredis.Redis | None = None,
+    interval: float,
+) -> None:
+    """Logs snapshots of pools every `interval` seconds (run as background task per worker)."""
+    while interval > 0:
+        await asyncio.sleep(interval)
+        logger.info(msg=f"Pools metrics | {pools_snapshot(engines=engines, redis_client=redis_client)}")
@@ -5,33 +5,75 @@ __all__ = (
     "ExtendedRepository",
 )
 
+import functools
+import hashlib
+import itertools
 import typing
-from collections.abc import Iterable
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
 
+import orjson
 from fastapi import status
-from sqlalchemy import BinaryExpression, delete, func, insert, select, update
+from sqlalchemy import (
+    BigInteger,
+    BinaryExpression,
+    Column,
+    Integer,
+    Select,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import Insert
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
-from sqlalchemy.engine import ChunkedIteratorResult, CursorResult
+from sqlalchemy.engine import ChunkedIteratorResult, CursorResult, Dialect, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.annotations import (
     CountModelListResult,
+    CountResult,
+    DictStrOfAny,
     ModelInstance,
     ModelListOrNone,
     ModelOrNone,
     ModelType,
+    StrOrNone,
     StrOrUUID,
 )
+from core.caches.responses import CACHE_TAGS_INFO_KEY, mark_written
+from core.caches.single_flight import SingleFlight
+from core.custom_logging import get_logger
+from core.db.bases import redis_engine
+from core.db.routing import READ_ONLY_INFO_KEY
+from core.db.settings import db_settings
+from core.db.statements import Explain, statement_cache
 from core.dependencies.body.filtration import Filtration
 from core.dependencies.body.pagination import Pagination
 from core.dependencies.body.projection import Projection
 from core.dependencies.body.searching import Searching
 from core.dependencies.body.sorting import Sorting
-from core.enums import JSENDStatus
+from core.enums import CountStrategy, JSENDStatus
 from core.exceptions import BackendError
+from redis.exceptions import RedisError
+
+_logger = get_logger(name=__name__)
+T = typing.TypeVar("T")
+read_flight: SingleFlight[typing.Hashable, typing.Any] = SingleFlight()  # Reads in flight of all repositories.
+PG_CLASS = table("pg_class", column("oid"), column("reltuples"), schema="pg_catalog")
 
 
 class BaseRepository:
+    max_query_parameters: typing.ClassVar[int] = 32767  # asyncpg (PostgreSQL protocol) limit for bind parameters.
+
     def __init__(
         self,
         *,
@@ -39,11 +81,15 @@ class BaseRepository:
         use_unique: bool = True,
         use_flush: bool = True,
         use_safe: bool = True,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        use_single_flight: bool = False,
     ) -> None:
         self._model = model
         self._use_unique = use_unique  # Deduplicate result of rows or joined objects (for O2M, M2M joins).
         self._use_flush = use_flush  # Automatically send to object to db, but not committing (PK, FK checked).
         self._use_safe = use_safe  # return `None` instead of raise on scalar convertion.
+        self._count_strategy = count_strategy  # Default strategy for the total count in `count_and_get_many`.
+        self._use_single_flight = use_single_flight  # Coalesce identical concurrent reads into one query.
 
     @property
     def model(self) -> ModelType:
@@ -61,27 +107,249 @@ class BaseRepository:
     def use_safe(self) -> bool:
         return self._use_safe
 
+    @property
+    def count_strategy(self) -> CountStrategy:
+        return self._count_strategy
+
+    @property
+    def use_single_flight(self) -> bool:
+        return self._use_single_flight
+
+    async def coalesce(
+        self,
+        *,
+        session: AsyncSession,
+        method: str,
+        args: typing.Hashable,
+        func: typing.Callable[[], typing.Awaitable[T]],
+    ) -> T:
+        """Runs the read once for concurrent callers with the same (bind, model, method, args), if `use_single_flight`.
+
+        Objects loaded by the leader's session are merged (without loading) into the session of each other caller.
+        Only read-only sessions (see `READ_ONLY_INFO_KEY`) are coalesced, others read by themselves, so they see their
+        own changes. Sessions routed to different databases (replicas with different lags, the primary) don't share
+        reads.
+
+        Notes:
+            Coalescing is per worker, ORM objects can't be shared between processes (see `ResponseCache` for
+            responses).
+        """
+        if not self.use_single_flight or not session.info.get(READ_ONLY_INFO_KEY):
+            return await func()
+        if session.info.get(CACHE_TAGS_INFO_KEY) or session.new or session.dirty:
+            return await func()
+
+        bind = session.get_bind(mapper=self.model)
+        result = await read_flight.do(key=(bind, self.model, method, args), func=func)
+        if isinstance(result, list):
+            return [await self._merge(session=session, obj=obj) for obj in result]
+        return await self._merge(session=session, obj=result)
+
+    @staticmethod
+    async def _merge(*, session: AsyncSession, obj: typing.Any) -> typing.Any:  # noqa: ANN401
+        if obj is None or obj in session:
+            return obj
+        return await session.merge(obj, load=False)
+
+    def _mark_written(self, *, session: AsyncSession) -> None:
+        """Remembers the table as written in the session, so cached responses tagged by it are invalidated."""
+        mark_written(session=session, tags=(self.model.__tablename__,))
+
+    def batched(self, *, data: Iterable[dict[str, typing.Any]]) -> Iterator[tuple[dict[str, typing.Any], ...]]:
+        """Splits rows into batches with the same keys and less than `max_query_parameters` bind parameters.
+
+        Rows are grouped by their keys, so batches (and objects returned by batched writes) don't keep the input order.
+        """
+        groups: dict[tuple[str, ...], list[dict[str, typing.Any]]] = {}
+        for row in data:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for keys, rows in groups.items():
+            yield from itertools.batched(rows, max(1, self.max_query_parameters // max(1, len(keys))))
+
     async def create_one(self, *, session: AsyncSession, data: dict[str, typing.Any]) -> None:
         insert_statement = insert(self.model).values(**data)
         result = await session.execute(statement=insert_statement)
+        self._mark_written(session=session)
         await session.flush() if self.use_flush else ...
         return result
 
     async def create_many(self, *, session: AsyncSession, data: Iterable[dict[str, typing.Any]]) -> ModelListOrNone:
-        insert_statement = postgresql_insert(self.model).values(list(data)).returning(self.model)
-        statement = select(self.model).from_statement(insert_statement).execution_options(populate_existing=True)
-        result: ChunkedIteratorResult = await session.execute(statement=statement)
+        objects: list[ModelInstance] = []
+        for batch in self.batched(data=data):
+            insert_statement = postgresql_insert(self.model).values(batch).returning(self.model)
+            statement = select(self.model).from_statement(insert_statement).execution_options(populate_existing=True)
+            result: ChunkedIteratorResult = await session.execute(statement=statement)
+            result.unique() if self.use_unique else ...
+            objects.extend(result.scalars().all())
+        self._mark_written(session=session)
         await session.flush()
-        result.unique() if self.use_unique else ...
-        objects: ModelListOrNone = result.scalars().all()
         return objects
 
+    async def copy_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Iterable[dict[str, typing.Any]] | AsyncIterable[dict[str, typing.Any]],
+        columns: Sequence[str] | None = None,
+        conflict_target: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+    ) -> int:
+        """Streams rows into the table with binary `COPY` (asyncpg `copy_records_to_table`).
+
+        Rows are consumed lazily, so any number of rows can be loaded without holding them in memory. With
+        `conflict_target` rows are copied into a temporary table first and merged by `INSERT ... ON CONFLICT`.
+        `COPY` bypasses SQLAlchemy, so values are converted by column types and omitted columns with Python-side
+        defaults (e.g. `id`) are filled per row (see `_copy_columns` and `_copy_record`).
+
+        Args:
+            session: SQLAlchemy AsyncSession (asyncpg driver).
+            data: iterable or async iterable of rows.
+            columns: columns to load (columns of the first row, in the table order, by default), omitted columns
+                with Python-side defaults are loaded as well.
+            conflict_target: unique columns for the merge, plain `COPY` (that fails on duplicates) if not set.
+            update_fields: columns to overwrite on conflict (all `columns` except `conflict_target` by default),
+                an empty sequence to skip conflicting rows.
+
+        Returns:
+            int: number of copied (or merged) rows.
+        """
+        rows = self._aiter_rows(data=data)
+        if (first_row := await anext(rows, None)) is None:
+            return 0
+        columns = self._copy_columns(first_row=first_row, columns=columns)
+        self._mark_written(session=session)
+        connection = await session.connection()
+        record = self._copy_record(columns=columns, dialect=connection.dialect)
+
+        async def records() -> AsyncIterator[tuple[typing.Any, ...]]:
+            yield record(first_row)
+            async for row in rows:
+                yield record(row)
+
+        raw_connection = await connection.get_raw_connection()
+        # The asyncpg adapter begins its transaction lazily (on the first statement), `COPY` on the driver connection
+        # must run inside the session's transaction.
+        if raw_connection.dbapi_connection._transaction is None:
+            await raw_connection.dbapi_connection._start_transaction()
+        driver_connection = raw_connection.driver_connection
+        if not conflict_target:
+            copy_status: str = await driver_connection.copy_records_to_table(
+                self.model.__table__.name,
+                records=records(),
+                columns=columns,
+                schema_name=self.model.__table__.schema,
+            )
+            return int(copy_status.split()[-1])
+
+        temporary_name = f"copy_{uuid.uuid4().hex}"
+        preparer = connection.dialect.identifier_preparer
+        columns_names = ", ".join(preparer.quote(name) for name in columns)
+        # Only loaded columns with the same types, but without constraints, so omitted NOT NULL columns don't fail.
+        await connection.execute(
+            statement=text(
+                f"CREATE TEMPORARY TABLE {temporary_name} ON COMMIT DROP AS "  # noqa: S608
+                f"SELECT {columns_names} FROM {preparer.format_table(self.model.__table__)} WITH NO DATA",
+            ),
+        )
+        await driver_connection.copy_records_to_table(temporary_name, records=records(), columns=columns)
+
+        insert_statement = self._copy_merge_statement(
+            temporary_name=temporary_name,
+            columns=columns,
+            conflict_target=conflict_target,
+            update_fields=update_fields,
+        )
+        result: CursorResult = await connection.execute(statement=insert_statement)
+        await connection.execute(statement=text(f"DROP TABLE {temporary_name}"))
+        return result.rowcount
+
+    def _copy_columns(self, *, first_row: dict[str, typing.Any], columns: Sequence[str] | None) -> list[str]:
+        """Columns for `COPY`: passed ones (or of the first row) and the rest with Python-side defaults.
+
+        Python-side defaults aren't known to the database, so omitted `id` would fail NOT NULL of `COPY` and one
+        default value would be bound for all rows of `INSERT ... SELECT`.
+        """
+        table_columns = self.model.__table__.columns
+        names = list(columns or (c.name for c in table_columns if c.name in first_row))
+        return names + [c.name for c in table_columns if c.name not in names and self._python_default(column=c)]
+
+    def _copy_record(
+        self,
+        *,
+        columns: Sequence[str],
+        dialect: Dialect,
+    ) -> typing.Callable[[dict[str, typing.Any]], tuple[typing.Any, ...]]:
+        """Returns converter of a row into `COPY` record.
+
+        Omitted values are filled by Python-side defaults (per row), all values are processed by column types (e.g.
+        JSON is serialized).
+        """
+        table_columns = self.model.__table__.columns
+        defaults = {name: self._python_default(column=table_columns[name]) for name in columns}
+        processors = {name: table_columns[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns}
+
+        def record(row: dict[str, typing.Any]) -> tuple[typing.Any, ...]:
+            values = []
+            for name in columns:
+                value = default() if name not in row and (default := defaults[name]) else row.get(name)
+                values.append(value if value is None or (process := processors[name]) is None else process(value))
+            return tuple(values)
+
+        return record
+
+    @staticmethod
+    def _python_default(*, column: Column) -> typing.Callable[[], typing.Any] | None:
+        """Returns factory of the column's Python-side default (scalar or callable), None for SQL and server ones."""
+        default = column.default
+        if default is None or not (default.is_scalar or default.is_callable):
+            return None
+        if default.is_callable:
+            return functools.partial(default.arg, None)  # SQLAlchemy wraps callables to accept execution context.
+        return lambda: default.arg
+
+    def _copy_merge_statement(
+        self,
+        *,
+        temporary_name: str,
+        columns: Sequence[str],
+        conflict_target: Sequence[str],
+        update_fields: Sequence[str] | None,
+    ) -> Insert:
+        """Builds `INSERT ... SELECT ... ON CONFLICT` of copied rows from the temporary table into the model's table."""
+        temporary_table = table(temporary_name, *(column(name) for name in columns))
+        keys = [temporary_table.c[name] for name in conflict_target]
+        # Postgres can't update the same row twice in one statement, so the last copied row for each key wins.
+        rows_statement = select(*temporary_table.c).distinct(*keys).order_by(*keys, literal_column("ctid").desc())
+        insert_statement = postgresql_insert(self.model).from_select(columns, rows_statement)
+        fields = update_fields if update_fields is not None else [n for n in columns if n not in conflict_target]
+        if fields:
+            return insert_statement.on_conflict_do_update(
+                index_elements=conflict_target,
+                set_={name: insert_statement.excluded[name] for name in fields},
+            )
+        return insert_statement.on_conflict_do_nothing(index_elements=conflict_target)
+
+    @staticmethod
+    async def _aiter_rows(
+        *,
+        data: Iterable[dict[str, typing.Any]] | AsyncIterable[dict[str, typing.Any]],
+    ) -> AsyncIterator[dict[str, typing.Any]]:
+        if isinstance(data, AsyncIterable):
+            async for row in data:
+                yield row
+        else:
+            for row in data:
+                yield row
+
     async def get_by_attr(self, *, session: AsyncSession, attr_name: str, attr_value: StrOrUUID) -> ModelOrNone:
-        statement = select(self.model).where(getattr(self.model, attr_name) == attr_value)
-        result: ChunkedIteratorResult = await session.execute(statement=statement)
-        result.unique() if self.use_unique else ...
-        data: ModelOrNone = result.scalar_one_or_none() if self.use_safe else result.scalar_one()
-        return data
+        async def read() -> ModelOrNone:
+            statement = select(self.model).where(getattr(self.model, attr_name) == attr_value)
+            result: ChunkedIteratorResult = await session.execute(statement=statement)
+            result.unique() if self.use_unique else ...
+            data: ModelOrNone = result.scalar_one_or_none() if self.use_safe else result.scalar_one()
+            return data
+
+        return await self.coalesce(session=session, method="get_by_attr", args=(attr_name, str(attr_value)), func=read)
 
     async def get_one(self, *, session: AsyncSession, id: StrOrUUID) -> ModelOrNone:
         return await self.get_by_attr(session=session, attr_name="id", attr_value=id)
@@ -96,7 +364,12 @@ class BaseRepository:
         return objects
 
     async def get_many(self, *, session: AsyncSession, ids: list[StrOrUUID]) -> ModelListOrNone:
-        return await self.get_where(session=session, filtration=[self.model.id.in_(ids)])
+        return await self.coalesce(
+            session=session,
+            method="get_many",
+            args=tuple(sorted(map(str, ids))),
+            func=functools.partial(self.get_where, session=session, filtration=[self.model.id.in_(ids)]),
+        )
 
     async def count_and_get_many(
         self,
@@ -107,36 +380,384 @@ class BaseRepository:
         filtration: Filtration,
         projection: Projection,
         searching: Searching,
+        count_strategy: CountStrategy | None = None,
+        rows: bool = False,
     ) -> CountModelListResult:
-        select_statement = (
+        """Returns the total count, the count strategy actually used (see `count`) and one page of objects.
+
+        Statements are reused by the shape of the dependencies (see `StatementCache`), request values are passed as
+        bound parameters. The total count is `None` for `CountStrategy.FIRST_PAGE` when the `nextToken` is present.
+
+        With `rows`, only columns of the `projection` are selected and returned as `Row` tuples, without ORM
+        instances and identity map bookkeeping (for read-only lists, see `Pagination.paginate_rows`).
+        """
+        if pagination.page and pagination.page > 1:
+            if searching.rank is not None:
+                raise BackendError(message="Search results ordered by rank can't be paginated by `page`.")
+            token = await self.seek_page(
+                session=session,
+                sorting=sorting,
+                pagination=pagination,
+                filtration=filtration,
+                searching=searching,
+            )
+            if token is None:
+                total, count_strategy = await self.count(
+                    session=session,
+                    filtration=filtration,
+                    searching=searching,
+                    count_strategy=count_strategy,
+                    is_first_page=False,
+                )
+                return total, count_strategy, []
+            pagination = pagination.seek(token=token)
+        if searching.rank is not None and pagination.shape:
+            raise BackendError(message="Search results ordered by rank can't be paginated by `nextToken`.")
+
+        shape = (filtration.shape, searching.shape, sorting.shape, projection.shape, pagination.shape)
+        select_statement = statement_cache.get_or_build(
+            key=(self.model, "count_and_get_many", rows, *shape),
+            builder=functools.partial(
+                self._build_page_statement,
+                sorting=sorting,
+                pagination=pagination,
+                filtration=filtration,
+                projection=projection,
+                searching=searching,
+                rows=rows,
+            ),
+        )
+
+        total, count_strategy = await self.count(
+            session=session,
+            filtration=filtration,
+            searching=searching,
+            count_strategy=count_strategy,
+            is_first_page=not pagination.shape,
+        )
+        params = {**filtration.params, **searching.params, **pagination.params}
+        select_result: ChunkedIteratorResult = await session.execute(statement=select_statement, params=params)
+        objects: list[ModelInstance] | list[Row]
+        if rows:
+            objects = select_result.all()
+        else:
+            select_result.unique() if self.use_unique else ...
+            objects = select_result.scalars().all()
+        if pagination.backward:
+            objects.reverse()  # fetched in reversed order, from the cursor backward
+        return total, count_strategy, objects
+
+    async def seek_page(
+        self,
+        *,
+        session: AsyncSession,
+        sorting: Sorting,
+        pagination: Pagination,
+        filtration: Filtration,
+        searching: Searching,
+    ) -> StrOrNone:
+        """Returns cursor of the latest object of the page before `pagination.page` (see `Pagination.seek`).
+
+        Page boundaries (cursors of every `limit`-th object) are sampled by one query and cached in Redis per query
+        shape, values and limit, so jumping to page N is a keyset query instead of `OFFSET N * limit`. Returns None
+        when the page is beyond the last object (it is empty).
+
+        Raises:
+            BackendError: Page is beyond `APP_RDMS_PAGINATION_MAX_PAGES` sampled boundaries (use `nextToken`).
+        """
+        if pagination.page - 1 > db_settings.APP_RDMS_PAGINATION_MAX_PAGES:
+            raise BackendError(
+                message=f"Pages after {db_settings.APP_RDMS_PAGINATION_MAX_PAGES + 1} can't be sought by `page`, "
+                "use `nextToken`.",
+            )
+        boundaries = await self._get_page_boundaries(
+            session=session,
+            sorting=sorting,
+            pagination=pagination,
+            filtration=filtration,
+            searching=searching,
+        )
+        if pagination.page - 2 >= len(boundaries):
+            return None
+        return boundaries[pagination.page - 2]
+
+    async def _get_page_boundaries(
+        self,
+        *,
+        session: AsyncSession,
+        sorting: Sorting,
+        pagination: Pagination,
+        filtration: Filtration,
+        searching: Searching,
+    ) -> list[str]:
+        statement = statement_cache.get_or_build(
+            key=(self.model, "page_boundaries", filtration.shape, searching.shape, sorting.shape),
+            builder=functools.partial(
+                self._build_boundaries_statement,
+                sorting=sorting,
+                filtration=filtration,
+                searching=searching,
+            ),
+        )
+        params = {
+            **filtration.params,
+            **searching.params,
+            "pagination_limit": pagination.limit,
+            "pagination_max_pages": db_settings.APP_RDMS_PAGINATION_MAX_PAGES,
+        }
+        query_hash = self._statement_hash(session=session, statement=statement, params=params)
+        key = f"pagination:{self.model.__tablename__}:{query_hash}"
+
+        try:
+            if (cached := await redis_engine.get(name=key)) is not None:
+                return orjson.loads(cached)
+        except RedisError as error:
+            _logger.warning(msg=f"{self.__class__.__name__} | _get_page_boundaries | Redis is unavailable | {error}.")
+
+        result: ChunkedIteratorResult = await session.execute(statement=statement, params=params)
+        # Rows have attributes named as sorted columns, so cursors are created the same way as from objects.
+        boundaries = [pagination.create_token(obj=row) for row in result.all()]
+        try:
+            await redis_engine.set(
+                name=key,
+                value=orjson.dumps(boundaries),
+                ex=db_settings.APP_RDMS_PAGINATION_BOUNDARIES_TTL_SECONDS,
+            )
+        except RedisError as error:
+            _logger.warning(msg=f"{self.__class__.__name__} | _get_page_boundaries | Redis is unavailable | {error}.")
+        return boundaries
+
+    def _build_boundaries_statement(
+        self,
+        *,
+        sorting: Sorting,
+        filtration: Filtration,
+        searching: Searching,
+    ) -> Select:
+        """Selects sorted columns of every `limit`-th object (the latest object of each page)."""
+        numbered = (
+            select(
+                *(getattr(self.model, name).label(name) for name, _ in sorting.shape),
+                func.row_number().over(order_by=sorting.query).label("row_number"),
+            )
+            .where(*filtration)
+            .where(*searching)
+            .subquery()
+        )
+        limit = bindparam(key="pagination_limit", type_=Integer)
+        return (
+            select(*(numbered.c[name] for name, _ in sorting.shape))
+            .where(numbered.c.row_number % limit == 0)
+            .order_by(numbered.c.row_number)
+            .limit(bindparam(key="pagination_max_pages", type_=Integer))
+        )
+
+    def _build_page_statement(
+        self,
+        *,
+        sorting: Sorting,
+        pagination: Pagination,
+        filtration: Filtration,
+        projection: Projection,
+        searching: Searching,
+        rows: bool = False,
+    ) -> Select:
+        ranking = [searching.rank.desc()] if searching.rank is not None else []
+        if rows:
+            select_statement = select(*projection.columns)
+        else:
+            select_statement = select(self.model).options(projection.query).execution_options(populate_existing=True)
+        select_statement = select_statement.order_by(
+            *ranking,
+            *(sorting.reversed_query if pagination.backward else sorting.query),
+        ).limit(bindparam(key="pagination_limit", value=pagination.limit))
+        select_statement = select_statement.where(*filtration).where(*searching)
+        if pagination.shape:
+            select_statement = select_statement.where(pagination.get_query(next_token=pagination.next_token))
+        return select_statement
+
+    async def stream_many(
+        self,
+        *,
+        session: AsyncSession,
+        sorting: Sorting,
+        filtration: Filtration,
+        projection: Projection,
+        searching: Searching,
+        yield_per: int = 1000,
+    ) -> AsyncIterator[ModelInstance]:
+        """Streams all matching objects through a server-side cursor, fetching them by `yield_per` rows.
+
+        Notes:
+            The cursor is open while iterating, so the `session` must outlive the iteration (for responses, open
+            it inside the streamed generator). `Projection` must not use joined eager loading of collections.
+        """
+        statement = (
             select(self.model)
             .options(projection.query)
+            .where(*filtration)
+            .where(*searching)
             .order_by(*sorting.query)
-            .limit(pagination.limit)
-            .execution_options(populate_existing=True)
+            .execution_options(yield_per=yield_per)
         )
-        count_statement = select(func.count(self.model.id)).select_from(self.model).where(*filtration).where(*searching)
-        select_statement = select_statement.where(*filtration).where(*searching)
-
-        next_token = pagination.next_token
-        if pagination.next_token:
-            select_statement = select_statement.where(pagination.get_query(next_token=next_token))
+        result = await session.stream_scalars(statement=statement)
+        async for partition in result.partitions():
+            for obj in partition:  # Session's identity map is weak-referencing, so yielded rows can be collected.
+                yield obj
 
-        async with session.begin_nested():
-            count_result: ChunkedIteratorResult = await session.execute(statement=count_statement)
-            select_result: ChunkedIteratorResult = await session.execute(statement=select_statement)
-
-        total: int = count_result.scalar()  # number of counted results.
-        select_result.unique() if self.use_unique else ...
-        objects: list[ModelInstance] = select_result.scalars().all()
-        return total, objects
+    async def count(
+        self,
+        *,
+        session: AsyncSession,
+        filtration: Filtration | list[BinaryExpression],
+        searching: Searching | list[BinaryExpression] | None = None,
+        count_strategy: CountStrategy | None = None,
+        is_first_page: bool = True,
+    ) -> CountResult:
+        """Counts objects matching the filters with the given strategy (repository default if not set).
+
+        Returns the total and the strategy actually used: `CACHED` and `ESTIMATED` fall back to `EXACT` count, when
+        Redis is unavailable or the table has no statistics yet.
+        """
+        count_strategy = count_strategy or self.count_strategy
+        if count_strategy == CountStrategy.FIRST_PAGE and not is_first_page:
+            return None, count_strategy
+
+        searching = searching or []
+        if isinstance(filtration, Filtration) and isinstance(searching, Searching):
+            statement = statement_cache.get_or_build(
+                key=(self.model, "count", filtration.shape, searching.shape),
+                builder=functools.partial(self._build_count_statement, filtration=filtration, searching=searching),
+            )
+            params = {**filtration.params, **searching.params}
+        else:
+            statement = self._build_count_statement(filtration=filtration, searching=searching)
+            params = {}
+
+        match count_strategy:
+            case CountStrategy.CACHED:
+                return await self._count_cached(session=session, statement=statement, params=params)
+            case CountStrategy.ESTIMATED:
+                return await self._count_estimated(session=session, statement=statement, params=params)
+            case _:
+                return await self._count_exact(session=session, statement=statement, params=params), count_strategy
+
+    def _build_count_statement(
+        self,
+        *,
+        filtration: Filtration | list[BinaryExpression],
+        searching: Searching | list[BinaryExpression],
+    ) -> Select:
+        return select(func.count()).select_from(self.model).where(*filtration).where(*searching)
+
+    async def _count_exact(self, *, session: AsyncSession, statement: Select, params: DictStrOfAny) -> int:
+        result: ChunkedIteratorResult = await session.execute(statement=statement, params=params)
+        return result.scalar_one()
+
+    @staticmethod
+    def _statement_hash(*, session: AsyncSession, statement: Select, params: DictStrOfAny) -> str:
+        """Returns hash of the statement's SQL and parameters (for cache keys)."""
+        compiled = statement.compile(dialect=session.bind.dialect)
+        return hashlib.sha256(
+            orjson.dumps(
+                [str(compiled), compiled.construct_params(params=params)],
+                default=str,
+                option=orjson.OPT_SORT_KEYS,
+            ),
+        ).hexdigest()
+
+    async def _count_cached(self, *, session: AsyncSession, statement: Select, params: DictStrOfAny) -> CountResult:
+        query_hash = self._statement_hash(session=session, statement=statement, params=params)
+        key = f"count:{self.model.__tablename__}:{query_hash}"
+
+        try:
+            if (cached := await redis_engine.get(name=key)) is not None:
+                return int(cached), CountStrategy.CACHED
+        except RedisError as error:
+            _logger.warning(msg=f"{self.__class__.__name__} | _count_cached | Redis is unavailable | {error}.")
+            return await self._count_exact(session=session, statement=statement, params=params), CountStrategy.EXACT
+
+        total = await self._count_exact(session=session, statement=statement, params=params)
+        try:
+            await redis_engine.set(name=key, value=total, ex=db_settings.APP_RDMS_COUNT_CACHE_TTL_SECONDS)
+        except RedisError as error:
+            _logger.warning(msg=f"{self.__class__.__name__} | _count_cached | Redis is unavailable | {error}.")
+        return total, CountStrategy.CACHED
+
+    async def _count_estimated(self, *, session: AsyncSession, statement: Select, params: DictStrOfAny) -> CountResult:
+        if statement.whereclause is None:
+            reltuples_statement = select(cast(PG_CLASS.c.reltuples, BigInteger)).where(
+                PG_CLASS.c.oid == func.to_regclass(self.model.__table__.fullname),
+            )
+            result = await session.execute(statement=reltuples_statement)
+            # `reltuples` is -1 (or the row is missing) until the table has been vacuumed or analyzed.
+            if (estimate := result.scalar_one_or_none()) is not None and estimate >= 0:
+                return estimate, CountStrategy.ESTIMATED
+            return await self._count_exact(session=session, statement=statement, params=params), CountStrategy.EXACT
+
+        rows_statement = select(self.model.id).where(statement.whereclause)
+        result = await session.execute(statement=Explain(statement=rows_statement), params=params)
+        plan = result.scalar_one()
+        plan = orjson.loads(plan) if isinstance(plan, str | bytes) else plan
+        return int(plan[0]["Plan"]["Plan Rows"]), CountStrategy.ESTIMATED
 
     async def update_one(self, *, session: AsyncSession, id: StrOrUUID, data: dict[str, typing.Any]) -> bool:
         statement = update(self.model).where(self.model.id == id).values(**data)
-        result = await session.execute(statement=statement)
-        return result.rowcount() > 0
+        result: CursorResult = await session.execute(statement=statement)
+        self._mark_written(session=session)
+        return result.rowcount > 0
 
-    async def update_many(self): ...  # noqa: ANN201
+    async def update_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Iterable[dict[str, typing.Any]],
+        key: str = "id",
+        returning: bool = False,
+    ) -> list[ModelInstance] | int:
+        """Updates many rows with different values by `UPDATE ... FROM (VALUES ...)`, one statement per batch.
+
+        Args:
+            session: SQLAlchemy AsyncSession.
+            data: rows to update, each must contain the `key` column.
+            key: column used to match rows in the table.
+            returning: return updated objects instead of the number of updated rows.
+
+        Returns:
+            list[ModelInstance] | int: updated objects or the number of updated rows.
+        """
+        objects: list[ModelInstance] = []
+        rowcount = 0
+        for batch in self.batched(data=data):
+            names = list(batch[0])
+            if key not in names:
+                msg = f"Each row for `update_many` must contain `{key}`."
+                raise ValueError(msg)
+            values_clause = values(
+                *(column(name, self.model.__table__.c[name].type) for name in names),
+                name="data",
+            ).data([tuple(row[name] for name in names) for row in batch])
+            update_statement = (
+                update(self.model)
+                .where(getattr(self.model, key) == values_clause.c[key])
+                .values({name: values_clause.c[name] for name in names if name != key})
+                .execution_options(synchronize_session=False)
+            )
+            if returning:
+                statement = (
+                    select(self.model)
+                    .from_statement(update_statement.returning(self.model))
+                    .execution_options(populate_existing=True)
+                )
+                result: ChunkedIteratorResult = await session.execute(statement=statement)
+                result.unique() if self.use_unique else ...
+                objects.extend(result.scalars().all())
+            else:
+                cursor_result: CursorResult = await session.execute(statement=update_statement)
+                rowcount += cursor_result.rowcount
+        self._mark_written(session=session)
+        await session.flush() if self.use_flush else ...
+        return objects if returning else rowcount
 
     async def delete_one(self, *, session: AsyncSession, id: StrOrUUID) -> CursorResult:
         return await self.delete_where(session=session, filtration=[self.model.id == id])
@@ -146,6 +767,7 @@ class BaseRepository:
     ) -> CursorResult:
         delete_statement = delete(self.model).where(*filtration)
         result: CursorResult = await session.execute(statement=delete_statement)
+        self._mark_written(session=session)
         await session.flush()
         return result
 
@@ -154,14 +776,72 @@ class BaseRepository:
 
 
 class ExtendedRepository(BaseRepository):
-    async def create_or_update(self): ...  # noqa: ANN201
+    def __init__(self, *, conflict_target: Sequence[str] = ("id",), **kwargs: typing.Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self._conflict_target = tuple(conflict_target)  # Default unique columns for `ON CONFLICT (...)`.
+
+    @property
+    def conflict_target(self) -> tuple[str, ...]:
+        return self._conflict_target
+
+    async def create_or_update(
+        self,
+        *,
+        session: AsyncSession,
+        values: dict[str, typing.Any],
+        conflict_target: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+    ) -> ModelInstance:
+        """Inserts one object or updates the existing one with the same `conflict_target` columns."""
+        objects = await self.create_or_update_many(
+            session=session,
+            data=[values],
+            conflict_target=conflict_target,
+            update_fields=update_fields,
+            returning=True,
+        )
+        if not objects:  # Conflicting row was kept, as there was nothing to update.
+            obj, _ = await self.create_or_get(session=session, values=values, conflict_target=conflict_target)
+            return obj
+        return objects[0]
+
+    async def create_or_get(
+        self,
+        *,
+        session: AsyncSession,
+        values: dict[str, typing.Any],
+        conflict_target: Sequence[str] | None = None,
+    ) -> tuple[ModelInstance, bool]:
+        """Inserts one object or gets the existing one with the same `conflict_target` columns.
+
+        Returns:
+            tuple[ModelInstance, bool]: object and flag if it was created.
+        """
+        conflict_target = tuple(conflict_target or self.conflict_target)
+        insert_statement = (
+            postgresql_insert(self.model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_target)
+            .returning(self.model)
+        )
+        statement = select(self.model).from_statement(insert_statement).execution_options(populate_existing=True)
+        result: ChunkedIteratorResult = await session.execute(statement=statement)
+        result.unique() if self.use_unique else ...
+        if obj := result.scalar_one_or_none():
+            self._mark_written(session=session)
+            await session.flush() if self.use_flush else ...
+            return obj, True
 
-    async def create_or_get(self): ...  # noqa: ANN201
+        statement = select(self.model).where(*(getattr(self.model, name) == values[name] for name in conflict_target))
+        result = await session.execute(statement=statement)
+        result.unique() if self.use_unique else ...
+        return result.scalar_one(), False
 
     async def create_one_and_return(self, *, session: AsyncSession, values: dict[str, typing.Any]) -> ModelInstance:
         insert_statement = postgresql_insert(self.model).values(**values).returning(self.model)
         statement = select(self.model).from_statement(insert_statement).execution_options(populate_existing=True)
         result: ChunkedIteratorResult = await session.execute(statement=statement)
+        self._mark_written(session=session)
         await session.flush()
         result.unique() if self.use_unique else ...
         obj: ModelInstance = result.scalar_one()
@@ -181,12 +861,70 @@ class ExtendedRepository(BaseRepository):
             select(self.model).from_statement(statement=update_statement).execution_options(populate_existing=True)
         )
         result: ChunkedIteratorResult = await session.execute(statement=statement)
+        self._mark_written(session=session)
         await session.flush()
         result.unique() if self.use_unique else ...
         obj: ModelOrNone = result.scalar_one_or_none()
         return obj
 
-    async def create_or_update_many(self): ...  # noqa: ANN201
+    async def create_or_update_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Iterable[dict[str, typing.Any]],
+        conflict_target: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+        returning: bool = False,
+    ) -> list[ModelInstance] | int:
+        """Upserts many rows by `INSERT ... ON CONFLICT DO UPDATE`, one statement per batch.
+
+        Args:
+            session: SQLAlchemy AsyncSession.
+            data: rows to insert or update.
+            conflict_target: unique columns that identify existing rows (repository's `conflict_target` by default).
+            update_fields: columns to overwrite on conflict (all passed columns except `conflict_target` by default),
+                an empty sequence to skip conflicting rows.
+            returning: return inserted/updated objects instead of the number of affected rows.
+
+        Returns:
+            list[ModelInstance] | int: affected objects (grouped by keys of rows, see `batched`, so not in the input
+                order) or the number of affected rows.
+        """
+        conflict_target = tuple(conflict_target or self.conflict_target)
+        # Postgres can't update the same row twice in one statement, so the last row for each key wins.
+        unique_data: dict[tuple[typing.Any, ...], dict[str, typing.Any]] = {}
+        for index, row in enumerate(data):
+            key = tuple(row.get(name) for name in conflict_target)
+            unique_data[key if None not in key else (None, index)] = row
+
+        objects: list[ModelInstance] = []
+        rowcount = 0
+        for batch in self.batched(data=unique_data.values()):
+            insert_statement = postgresql_insert(self.model).values(batch)
+            fields = update_fields if update_fields is not None else [n for n in batch[0] if n not in conflict_target]
+            if fields:
+                insert_statement = insert_statement.on_conflict_do_update(
+                    index_elements=conflict_target,
+                    set_={name: insert_statement.excluded[name] for name in fields},
+                )
+            else:
+                insert_statement = insert_statement.on_conflict_do_nothing(index_elements=conflict_target)
+
+            if returning:
+                statement = (
+                    select(self.model)
+                    .from_statement(insert_statement.returning(self.model))
+                    .execution_options(populate_existing=True)
+                )
+                result: ChunkedIteratorResult = await session.execute(statement=statement)
+                result.unique() if self.use_unique else ...
+                objects.extend(result.scalars().all())
+            else:
+                cursor_result: CursorResult = await session.execute(statement=insert_statement)
+                rowcount += cursor_result.rowcount
+        self._mark_written(session=session)
+        await session.flush() if self.use_flush else ...
+        return objects if returning else rowcount
 
     async def get_by_id_or_not_found(
         self, *, session: AsyncSession, id: StrOrUUID, message: str = "Not found."
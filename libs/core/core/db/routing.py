@@ -0,0 +1,165 @@
+"""Routing of read-only sessions to read replicas with lag-aware fallback to the primary."""
+
+__all__ = (
+    "READ_ONLY_INFO_KEY",
+    "ReplicaSet",
+    "RoutingSession",
+)
+
+import asyncio
+import itertools
+import typing
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Mapper, Session
+from sqlalchemy.orm.context import FromStatement
+from sqlalchemy.sql.dml import UpdateBase
+
+from core.custom_logging import get_logger
+from core.enums import ReplicaBalancing
+
+logger = get_logger(name=__name__)
+
+READ_ONLY_INFO_KEY = "read_only"  # `session.info` key, that allows routing of session's reads to replicas.
+LAG_STATEMENT = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END",
+)
+
+
+class ReplicaSet:
+    """Read replicas with balancing and replication lag monitoring (one instance per worker).
+
+    Replica is bypassed while its lag is unknown (before the first check or when it is unreachable) or over `max_lag`,
+    when no replica is available reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        *,
+        engines: list[AsyncEngine],
+        balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+        max_lag: float = 5.0,
+        check_interval: float = 1.0,
+    ) -> None:
+        self._engines = engines
+        self._balancing = balancing
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._lags: dict[AsyncEngine, float | None] = dict.fromkeys(engines)
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        """Check that any replica is configured."""
+        return bool(self._engines)
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        return self._engines
+
+    @property
+    def lags(self) -> dict[AsyncEngine, float | None]:
+        return self._lags
+
+    def available(self) -> list[AsyncEngine]:
+        """Returns replicas with known lag under `max_lag`."""
+        return [engine for engine in self._engines if (lag := self._lags[engine]) is not None and lag <= self._max_lag]
+
+    def choose(self) -> AsyncEngine | None:
+        """Returns replica for the next read-only session or None (use the primary)."""
+        engines = self.available()
+        if not engines:
+            return None
+        if self._balancing == ReplicaBalancing.LEAST_CONNECTIONS:
+            return min(engines, key=lambda engine: getattr(engine.sync_engine.pool, "checkedout", int)())
+        return engines[next(self._counter) % len(engines)]
+
+    async def check_lag(self, *, engine: AsyncEngine) -> float | None:
+        """Retrieve replication lag of the replica in seconds (None if it is unreachable)."""
+        try:
+            async with asyncio.timeout(self._check_interval), engine.connect() as connection:
+                return float((await connection.execute(statement=LAG_STATEMENT)).scalar_one())
+        except Exception as error:
+            logger.warning(msg=f"{self.__class__.__name__} | check_lag | {engine.url.host} | {error!r}")
+            return None
+
+    async def refresh(self) -> None:
+        """Check lag of all replicas."""
+        lags = await asyncio.gather(*(self.check_lag(engine=engine) for engine in self._engines))
+        self._lags.update(zip(self._engines, lags, strict=True))
+
+    async def monitor(self) -> None:
+        """Refresh lags every `check_interval` (run as background task per worker)."""
+        while self._engines:
+            await self.refresh()
+            await asyncio.sleep(self._check_interval)
+
+    async def dispose(self) -> None:
+        """Closes connections to replicas."""
+        await asyncio.gather(*(engine.dispose() for engine in self._engines))
+
+
+class RoutingSession(Session):
+    """Session, that routes reads of read-only sessions (see `READ_ONLY_INFO_KEY`) to a replica.
+
+    Replica is chosen once per session (so its reads are consistent), writes always go to the primary and the session
+    sticks to the primary after the first write (so it reads own writes). DML is detected also inside ORM
+    `select(...).from_statement(...)`. Textual SQL and raw connections are considered writes, as they can't be
+    inspected.
+
+    Examples:
+        >>> async_sessionmaker(bind=async_engine, sync_session_class=RoutingSession.with_replicas(replicas=replicas))
+    """
+
+    replicas: typing.ClassVar[ReplicaSet | None] = None
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self._replica: AsyncEngine | None = None
+        self._routed = False
+        self._written = False
+
+    @classmethod
+    def with_replicas(cls, *, replicas: ReplicaSet) -> type[typing.Self]:
+        """Returns subclass, that routes reads to the replicas."""
+        return type(cls.__name__, (cls,), {"replicas": replicas})
+
+    @property
+    def has_writes(self) -> bool:
+        """Check that the session wrote or has pending changes (so it has to be committed)."""
+        return self._written or bool(self.new or self.dirty or self.deleted)
+
+    def connection(
+        self,
+        bind_arguments: dict[str, typing.Any] | None = None,
+        execution_options: typing.Any = None,  # noqa: ANN401
+    ) -> Connection:
+        """Raw connection can't be inspected, so it is taken from the primary and the session is considered written."""
+        self._written = True
+        return super().connection(bind_arguments=bind_arguments, execution_options=execution_options)
+
+    def get_bind(
+        self,
+        mapper: Mapper[typing.Any] | None = None,
+        clause: typing.Any = None,  # noqa: ANN401
+        **kwargs: typing.Any,  # noqa: ANN401
+    ) -> Engine:
+        if self._flushing or self._is_write(clause=clause):
+            self._written = True
+        if self._written or not self.replicas or not self.info.get(READ_ONLY_INFO_KEY):
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+        if not self._routed:
+            self._replica, self._routed = self.replicas.choose(), True
+        if self._replica is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        return self._replica.sync_engine
+
+    @staticmethod
+    def _is_write(*, clause: typing.Any) -> bool:  # noqa: ANN401
+        if isinstance(clause, FromStatement):
+            clause = clause.element  # e.g. `select(User).from_statement(insert(User).returning(User))`
+        return isinstance(clause, UpdateBase | TextClause) or getattr(clause, "is_dml", False)
@@ -0,0 +1,68 @@
+"""Full-text search on stored generated `tsvector` columns and trigram (`pg_trgm`) indexes."""
+
+__all__ = (
+    "SEARCH_VECTOR_INFO_KEY",
+    "SearchVector",
+    "search_vector_column",
+    "trigram_index",
+)
+
+import typing
+
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import MappedColumn, mapped_column
+
+SEARCH_VECTOR_INFO_KEY = "search_vector"
+Weight = typing.Literal["A", "B", "C", "D"]
+
+
+class SearchVector(BaseModel):
+    """Declaration of a stored `tsvector`: text search configuration and the weight of each source column.
+
+    Give each column its own weight to allow searching by a subset of columns (through `ts_filter`).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    language: str = Field(default="simple", description="Text search configuration, e.g. `simple`, `english`.")
+    weights: dict[str, Weight] = Field(default=..., description="Source column name => weight (A is the highest).")
+
+    @property
+    def expression(self) -> str:
+        """SQL expression of the generated column."""
+        return " || ".join(
+            f"""setweight(to_tsvector('{self.language}'::regconfig, coalesce("{name}", '')), '{weight}')"""
+            for name, weight in self.weights.items()
+        )
+
+
+def search_vector_column(*, weights: dict[str, Weight], language: str = "simple") -> MappedColumn:
+    """Declares a stored generated `tsvector` column, that `Searching` picks up by the column's `info`.
+
+    Notes:
+        Exclude the column from the mapper (`__mapper_args__ = {"exclude_properties": [...]}`) to not load it with
+        objects, and create a GIN index on it.
+    """
+    vector = SearchVector(language=language, weights=weights)
+    return mapped_column(
+        TSVECTOR,
+        Computed(sqltext=vector.expression, persisted=True),
+        nullable=True,
+        info={SEARCH_VECTOR_INFO_KEY: vector},
+    )
+
+
+def trigram_index(table_name: str, column_name: str, *, using: typing.Literal["gin", "gist"] = "gin") -> Index:
+    """Declares `pg_trgm` index for similarity (`%`) and `LIKE`/`ILIKE` lookups by the column (for `__table_args__`).
+
+    Notes:
+        Requires `pg_trgm` extension (see `core.db.migrations.create_trigram_index`).
+    """
+    return Index(
+        f"ix_{table_name}_{column_name}_trgm",
+        column_name,
+        postgresql_using=using,
+        postgresql_ops={column_name: f"{using}_trgm_ops"},
+    )
@@ -5,6 +5,8 @@ from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy.engine.url import URL
 
+from core.enums import ReplicaBalancing
+
 
 class DBSettings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -24,6 +26,55 @@ class DBSettings(BaseSettings):
     APP_RDMS_URL: URL | str | None = Field(
         default=None, description="This url will be constructed from other settings."
     )
+    APP_RDMS_COUNT_CACHE_TTL_SECONDS: int = Field(
+        default=60, description="TTL of cached total counts for `CountStrategy.CACHED`."
+    )
+    APP_RDMS_STATEMENT_CACHE_SIZE: int = Field(
+        default=512, description="Number of statement shapes (filters, sorting, projection) kept per worker."
+    )
+    APP_RDMS_PAGINATION_BOUNDARIES_TTL_SECONDS: int = Field(
+        default=300, description="TTL of sampled page boundaries used to seek by `page`."
+    )
+    APP_RDMS_PAGINATION_MAX_PAGES: int = Field(
+        default=1000, description="Number of page boundaries sampled to seek by `page` (deeper pages are rejected)."
+    )
+    APP_RDMS_REPLICA_URLS: list[str] = Field(
+        default_factory=list, description="URLs of read replicas for read-only sessions (primary only if empty)."
+    )
+    APP_RDMS_REPLICA_BALANCING: ReplicaBalancing = Field(default=ReplicaBalancing.ROUND_ROBIN)
+    APP_RDMS_REPLICA_MAX_LAG_SECONDS: float = Field(
+        default=5.0, description="Replicas lagging behind the primary more than this are bypassed."
+    )
+    APP_RDMS_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = Field(
+        default=1.0, description="Interval of checking replication lag of replicas (per worker)."
+    )
+    APP_RDMS_READ_ONLY_DEFERRABLE: bool = Field(
+        default=False,
+        description=(
+            "Read-only sessions on the primary use `SERIALIZABLE READ ONLY DEFERRABLE` transactions (consistent "
+            "snapshot without serialization failures, may wait for it at start), otherwise `READ ONLY`."
+        ),
+    )
+    APP_RDMS_POOL_SIZE: int = Field(default=5, description="Connections kept open per worker (and per replica).")
+    APP_RDMS_POOL_MAX_OVERFLOW: int = Field(default=10, description="Connections opened over `POOL_SIZE` at peaks.")
+    APP_RDMS_POOL_TIMEOUT_SECONDS: float = Field(default=30.0, description="Time to wait for a free connection.")
+    APP_RDMS_POOL_RECYCLE_SECONDS: int = Field(
+        default=-1, description="Connections older than this are reopened on checkout (-1 to never recycle)."
+    )
+    APP_RDMS_POOL_PRE_PING: bool = Field(default=False, description="Test connections on checkout.")
+    APP_RDMS_POOL_METRICS_INTERVAL_SECONDS: float = Field(
+        default=0.0, description="Interval of logging pool metrics per worker (0 to disable)."
+    )
+    APP_RDMS_PREPARED_STATEMENT_CACHE_SIZE: int = Field(
+        default=100, description="Prepared statements cached per connection by asyncpg dialect."
+    )
+    APP_RDMS_PGBOUNCER: bool = Field(
+        default=False,
+        description=(
+            "Compatibility with PgBouncer in transaction mode: no prepared statement caches and unique statement "
+            "names (prepared statements can't be reused on other server connections)."
+        ),
+    )
 
     REDIS_SECURE: bool = Field(default=True)
     REDIS_HOST: str = Field(default="0.0.0.0")
@@ -34,6 +85,13 @@ class DBSettings(BaseSettings):
     REDIS_DECODE_RESPONSES: bool = Field(default=True)
     REDIS_ENCODING: str = Field(default="utf-8")
     REDIS_POOL_MAX_CONNECTIONS: int = Field(default=100)
+    REDIS_POOL_TIMEOUT_SECONDS: float = Field(
+        default=5.0, description="Time to wait for a free connection, when all `REDIS_POOL_MAX_CONNECTIONS` are in use."
+    )
+    REDIS_POOL_WARMUP_CONNECTIONS: int = Field(default=4, description="Connections opened per worker on startup.")
+    REDIS_PROTOCOL: int = Field(
+        default=2, description="RESP version: 3 for RESP3 (Redis >= 6). Replies are parsed by hiredis if installed."
+    )
 
     @model_validator(mode="after")
     def after_constructor(self) -> Self:
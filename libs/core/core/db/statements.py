@@ -0,0 +1,82 @@
+"""Custom SQL statements and helpers for them."""
+
+__all__ = (
+    "Explain",
+    "StatementCache",
+    "statement_cache",
+)
+
+import typing
+from collections.abc import Callable, Hashable
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
+
+from core.caches.memory import TTLCache
+from core.db.settings import db_settings
+
+T = typing.TypeVar("T")
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON) <statement>` that keeps bound parameters of the wrapped statement."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Executable) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kwargs: typing.Any) -> str:  # noqa: ANN401
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+class StatementCache:
+    """LRU of built statements by their shape.
+
+    Shape is everything that changes SQL text (fields, operators, sort order, projected columns), while values are
+    passed as bound parameters on execution. So the same statement object is reused for every request with the same
+    shape, and SQLAlchemy finds its compiled form in the engine's compiled cache.
+    """
+
+    def __init__(self, *, maxsize: int = 512) -> None:
+        self._statements: TTLCache[Hashable, typing.Any] = TTLCache(maxsize=maxsize, ttl=None)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get_or_build(self, *, key: Hashable, builder: Callable[[], T]) -> T:
+        """Returns cached statement for the shape `key` or builds and caches a new one."""
+        if (statement := self._statements.get(key=key)) is not None:
+            self._hits += 1
+            return statement
+        self._misses += 1
+        statement = builder()
+        self._statements.set(key=key, value=statement)
+        return statement
+
+    def info(self) -> dict[str, int]:
+        """Hit/miss counters and current size of the cache."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._statements),
+            "maxsize": self._statements.maxsize,
+        }
+
+    def clear(self) -> None:
+        self._statements.clear()
+        self._hits = self._misses = 0
+
+
+statement_cache = StatementCache(maxsize=db_settings.APP_RDMS_STATEMENT_CACHE_SIZE)
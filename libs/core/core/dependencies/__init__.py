@@ -1,4 +1,11 @@
-__all__ = ("AsyncSessionDependency", "RedisDependency", "get_async_session", "get_redis")
+__all__ = (
+    "AsyncReadSessionDependency",
+    "AsyncSessionDependency",
+    "RedisDependency",
+    "get_async_read_session",
+    "get_async_session",
+    "get_redis",
+)
 
 import typing
 
@@ -7,8 +14,10 @@ from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import redis.asyncio as aioredis
+from core.caches.responses import CACHE_TAGS_INFO_KEY, response_cache
 from core.custom_logging import get_logger
-from core.db.bases import async_session_factory, redis_engine
+from core.db.bases import async_read_session_factory, async_session_factory, redis_engine
+from core.db.hooks import AFTER_COMMIT_INFO_KEY, run_after_commit
 
 logger = get_logger(name=__name__)
 
@@ -16,13 +25,21 @@ logger = get_logger(name=__name__)
 async def get_async_session() -> typing.AsyncGenerator[AsyncSession, None]:  # pragma: no cover
     """Creates FastAPI dependency for generation of SQLAlchemy AsyncSession.
 
+    Session checks out a connection on the first statement and is committed only if it wrote, otherwise `close`
+    releases the connection (handlers, that don't use the session, don't touch the pool at all). Caches are invalidated
+    only after commit (see `mark_written` and `after_commit`).
+
     Yields:
         AsyncSession: SQLAlchemy AsyncSession.
     """
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            info = session.info
+            if info.get(CACHE_TAGS_INFO_KEY) or info.get(AFTER_COMMIT_INFO_KEY) or session.sync_session.has_writes:
+                await session.commit()
+                await response_cache.invalidate_written(session=session)
+                await run_after_commit(session=session)
         except IntegrityError as error:
             await session.rollback()
             raise error
@@ -33,15 +50,27 @@ async def get_async_session() -> typing.AsyncGenerator[AsyncSession, None]:  # p
             await session.close()
 
 
-async def get_redis() -> typing.AsyncGenerator[aioredis.Redis, None]:
-    async with redis_engine.client() as conn:
-        try:
-            yield conn
-        except aioredis.RedisError as error:
-            logger.warning(msg=error)
-        finally:
-            await conn.aclose()
+async def get_async_read_session() -> typing.AsyncGenerator[AsyncSession, None]:  # pragma: no cover
+    """Creates FastAPI dependency for generation of read-only SQLAlchemy AsyncSession.
+
+    Reads go to a read replica or to `READ ONLY` transaction on the primary, the session is never committed.
+
+    Yields:
+        AsyncSession: SQLAlchemy AsyncSession.
+    """
+    async with async_read_session_factory() as session:
+        yield session
+
+
+async def get_redis() -> aioredis.Redis:
+    """Creates FastAPI dependency, that returns the shared Redis client (it takes pooled connections per command).
+
+    Returns:
+        Redis: Shared Redis client.
+    """
+    return redis_engine
 
 
 AsyncSessionDependency = typing.Annotated[AsyncSession, Depends(get_async_session)]
+AsyncReadSessionDependency = typing.Annotated[AsyncSession, Depends(get_async_read_session)]
 RedisDependency = typing.Annotated[aioredis.Redis, Depends(get_redis)]
@@ -0,0 +1,126 @@
+"""Compact signed cursors (`nextToken`) for keyset pagination.
+
+Token layout (URL-safe base64 without padding):
+    <version: 1 byte> <payload: msgpack [sort shape hash, [values...]]> <HMAC-SHA256 of version + payload: 16 bytes>
+
+Values are positional (in order of the sorting), so field names and orders aren't stored: they come from the request
+`sorting`, and the sort shape hash guarantees that the token was issued for the same sorting.
+"""
+
+__all__ = (
+    "CURSOR_VERSION",
+    "decode_cursor",
+    "encode_cursor",
+)
+
+import base64
+import datetime
+import decimal
+import enum
+import hashlib
+import hmac
+import uuid
+
+import msgpack
+
+from core.annotations import ListOfAny
+from core.dependencies.settings import dependencies_settings
+from core.exceptions import BackendError
+
+CURSOR_VERSION = 1
+_DIGEST_SIZE = 16
+_SHAPE_HASH_SIZE = 8
+_EPOCH = datetime.datetime(1970, 1, 1)  # noqa: DTZ001
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class _ExtType(enum.IntEnum):
+    UUID = 1
+    DATETIME = 2
+    DATE = 3
+    DECIMAL = 4
+
+
+def _default(obj: object) -> msgpack.ExtType:
+    """Packs types that msgpack doesn't support natively."""
+    if isinstance(obj, uuid.UUID):
+        return msgpack.ExtType(_ExtType.UUID, obj.bytes)
+    if isinstance(obj, datetime.datetime):
+        # Microseconds since epoch (UTC for aware datetime) and UTC offset in seconds (None for naive datetime).
+        offset = obj.utcoffset()
+        microseconds = (obj.replace(tzinfo=None) - (offset or datetime.timedelta()) - _EPOCH) // _MICROSECOND
+        data = [microseconds, None if offset is None else int(offset.total_seconds())]
+        return msgpack.ExtType(_ExtType.DATETIME, msgpack.packb(data))
+    if isinstance(obj, datetime.date):
+        return msgpack.ExtType(_ExtType.DATE, msgpack.packb(obj.toordinal()))
+    if isinstance(obj, decimal.Decimal):
+        return msgpack.ExtType(_ExtType.DECIMAL, str(obj).encode())
+    msg = f"Object of type {obj.__class__.__name__} can't be stored in cursor."
+    raise TypeError(msg)
+
+
+def _ext_hook(code: int, data: bytes) -> object:
+    """Unpacks types packed by `_default`."""
+    match code:
+        case _ExtType.UUID:
+            return uuid.UUID(bytes=data)
+        case _ExtType.DATETIME:
+            microseconds, offset = msgpack.unpackb(data)
+            value = _EPOCH + datetime.timedelta(microseconds=microseconds)
+            if offset is None:
+                return value
+            return value.replace(tzinfo=datetime.UTC).astimezone(datetime.timezone(datetime.timedelta(seconds=offset)))
+        case _ExtType.DATE:
+            return datetime.date.fromordinal(msgpack.unpackb(data))
+        case _ExtType.DECIMAL:
+            return decimal.Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _shape_hash(shape: tuple[tuple[str, str], ...]) -> bytes:
+    """Returns short hash of sorted columns with directions."""
+    return hashlib.blake2b(repr(shape).encode(), digest_size=_SHAPE_HASH_SIZE).digest()
+
+
+def _sign(data: bytes, secret_key: str) -> bytes:
+    """Returns truncated HMAC-SHA256 signature of the data."""
+    return hmac.new(secret_key.encode(), data, hashlib.sha256).digest()[:_DIGEST_SIZE]
+
+
+def encode_cursor(
+    values: ListOfAny,
+    shape: tuple[tuple[str, str], ...],
+    secret_key: str | None = None,
+) -> str:
+    """Encodes values of the latest object (in order of `shape`) into the signed cursor."""
+    secret_key = secret_key or dependencies_settings.DEPENDENCIES_PAGINATION_SECRET_KEY
+    data = bytes((CURSOR_VERSION,)) + msgpack.packb([_shape_hash(shape=shape), values], default=_default)
+    return base64.urlsafe_b64encode(data + _sign(data=data, secret_key=secret_key)).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    token: str,
+    shape: tuple[tuple[str, str], ...],
+    secret_key: str | None = None,
+) -> ListOfAny:
+    """Decodes and verifies the cursor, returns values in order of `shape`.
+
+    Raises:
+        BackendError: token is malformed, tampered, has unknown version or was issued for another sorting.
+    """
+    secret_key = secret_key or dependencies_settings.DEPENDENCIES_PAGINATION_SECRET_KEY
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except ValueError as error:
+        raise BackendError(message="Invalid `nextToken`.") from error
+
+    data, signature = raw[:-_DIGEST_SIZE], raw[-_DIGEST_SIZE:]
+    if len(raw) <= _DIGEST_SIZE or not hmac.compare_digest(signature, _sign(data=data, secret_key=secret_key)):
+        raise BackendError(message="Invalid `nextToken`.")
+    if data[0] != CURSOR_VERSION:
+        raise BackendError(message="Unsupported `nextToken` version, start pagination from the beginning.")
+
+    shape_hash, values = msgpack.unpackb(data[1:], ext_hook=_ext_hook)
+    if shape_hash != _shape_hash(shape=shape) or len(values) != len(shape):
+        raise BackendError(message="`nextToken` doesn't match `sorting`, start pagination from the beginning.")
+    return values
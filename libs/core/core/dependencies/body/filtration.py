@@ -1,12 +1,25 @@
+import copy
+import functools
+import operator
 import typing
 from collections.abc import Iterator
 
 from fastapi import Body, Request
-from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_validator
-from sqlalchemy import BinaryExpression
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    SkipValidation,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+from sqlalchemy import BinaryExpression, bindparam
 from sqlalchemy.orm import ColumnProperty, InstrumentedAttribute
 
-from core.annotations import ModelType, SchemaType, StrOrNone
+from core.annotations import DictStrOfAny, ModelType, SchemaType, StrOrNone
 from core.dependencies.settings import dependencies_settings
 from core.enums import FOps
 from core.exceptions import BackendError
@@ -32,13 +45,20 @@ def get_sqlalchemy_where_operations_mapper(operation_type: FOps) -> str:
         operation_type.ILIKE: "icontains",
         operation_type.STARTSWITH: "startswith",
         operation_type.ENDSWITH: "endswith",
-        operation_type.ISNULL: "isnull",
-        operation_type.NOT_NULL: "notnull",
+        operation_type.ISNULL: "is_",
+        operation_type.NOT_NULL: "is_not",
     }
 
     return operations_map.get(operation_type, "__eq__")
 
 
+def get_filter_field(fltr: typing.Any) -> str | None:  # noqa: ANN401
+    """Discriminator of raw filters: returns the field name of a filter (by alias or name)."""
+    if isinstance(fltr, dict):
+        return fltr.get("f", fltr.get("field"))
+    return None
+
+
 class QueryFilter(BaseModel, typing.Generic[TypeA]):
     """Query parser for Filters."""
 
@@ -106,6 +126,7 @@ class Filtration:
         self.schema = schema
         self.filters: list[F] = filters
         self.filters_mapping = self.collect_filtering()
+        self.filters_adapter = self.collect_filters_adapter()
         self.aliases_mapping = self.schema.collect_aliases()
 
     @property
@@ -113,6 +134,16 @@ class Filtration:
         """Returns SQLAlchemy ready query."""
         return self._filtration
 
+    @property
+    def shape(self) -> tuple[tuple[str, FOps], ...]:
+        """Returns filtered columns with operations, that define SQL of the query (values are bound parameters)."""
+        return self._shape
+
+    @property
+    def params(self) -> DictStrOfAny:
+        """Returns values of bound parameters for the query."""
+        return self._params
+
     def __iter__(self) -> Iterator[BinaryExpression]:
         """Returns iterable for SQLAlchemy query."""
         yield from self.query
@@ -121,7 +152,8 @@ class Filtration:
         self,
         request: Request,
         filtration: typing.Annotated[
-            list[FiltrationRequest] | None,
+            # Documented by `FiltrationRequest`, but validated once by `filters_adapter` in `parse_query_filters`.
+            SkipValidation[list[FiltrationRequest]] | None,
             Body(
                 alias="filtration",
                 title="Filtration",
@@ -141,15 +173,25 @@ class Filtration:
             ),
         ] = None,
     ) -> typing.Self:
-        """Dependency method."""
+        """Dependency method, returns a copy of the dependency with the request's filters."""
         result: list[BinaryExpression] = []
+        shape: list[tuple[str, FOps]] = []
+        params: DictStrOfAny = {}
         if filtration:
             query_filters_list = self.parse_query_filters(filters_list=filtration)
-            result.extend(op for op in self.construct_sqlalchemy_operation(query_filters=query_filters_list))
+            for shape_item, operation, operation_params in self.construct_sqlalchemy_operation(
+                query_filters=query_filters_list,
+            ):
+                result.append(operation)
+                shape.append(shape_item)
+                params.update(operation_params)
 
         request.state.filtration = result
-        self._filtration = result
-        return self
+        state = copy.copy(self)  # The dependency is shared by concurrent requests.
+        state._filtration = result
+        state._shape = tuple(shape)
+        state._params = params
+        return state
 
     def collect_filtering(self) -> dict[str, type[QueryFilter[TypeValue]] | None]:
         """Method that collects filters dynamically."""
@@ -168,41 +210,66 @@ class Filtration:
 
         return fields
 
-    def parse_query_filters(self, filters_list: list[FiltrationRequest]) -> list[QueryFilter[list[str] | StrOrNone]]:
-        """Parse and dump query filters from request."""
-        query_filters_list: list[QueryFilter[list[str] | StrOrNone]] = []
+    def collect_filters_adapter(self) -> TypeAdapter[list[QueryFilter[TypeValue]]] | None:
+        """Method that builds an adapter of the discriminated (by field name) union of per-field filter models."""
+        models = [
+            typing.Annotated[model, Tag(name)] for name, model in self.filters_mapping.items() if model is not None
+        ]
+        if not models:
+            return None
+        union = functools.reduce(operator.or_, models)
+        return TypeAdapter(list[typing.Annotated[union, Discriminator(get_filter_field)]])
+
+    def parse_query_filters(self, filters_list: list[DictStrOfAny]) -> list[QueryFilter[list[str] | StrOrNone]]:
+        """Validate raw query filters from request in one pass by `filters_adapter`.
+
+        Filters by fields that are absent in the schema are skipped.
+        """
+        if isinstance(filters_list, list):
+            filters_list = [
+                fltr
+                for fltr in filters_list
+                if not isinstance(fltr, dict) or get_filter_field(fltr=fltr) in self.filters_mapping
+            ]
+        if not filters_list:
+            return []
+        if self.filters_adapter is None:
+            raise self._parse_error(fltr=filters_list[0])
         try:
-            for fltr in filters_list:
-                fltr_adptr = TypeAdapter(QueryFilter[FilterValue])
-                fltr_schema = fltr_adptr.validate_python(fltr.model_dump())
-                if fltr_schema.field in self.filters_mapping:
-                    try:
-                        filter_model = self.filters_mapping[fltr_schema.field]
-                        query_filters_list.append(filter_model.model_validate(fltr.model_dump()))
-                    except Exception as error:
-                        raise BackendError(
-                            data={"Parsed filter (DEBUG)": fltr_schema.model_dump()}
-                            if dependencies_settings.DEPENDENCIES_DEBUG
-                            else None,
-                            message=f"Can't parse filter value of '{fltr_schema.field}'. Check validity of "
-                            f"filter Object{{}} or a possibility filtering by this field.",
-                        ) from error
+            return self.filters_adapter.validate_python(filters_list)
         except ValidationError as error:
-            raise BackendError(
-                data={"Parsed JSON (DEBUG)": filters_list} if dependencies_settings.DEPENDENCIES_DEBUG else None,
-                message="Invalid 'filters' Array[Filter{}]. Every filter should be an Object{} with three fields: "
-                "'field' or 'f', 'operator' or 'o', 'value' or 'v'.",
-            ) from error
-        return query_filters_list
+            location = error.errors(include_url=False)[0]["loc"]
+            index = location[0] if location and isinstance(location[0], int) else None
+            raise self._parse_error(fltr=None if index is None else filters_list[index]) from error
+
+    @staticmethod
+    def _parse_error(fltr: typing.Any) -> BackendError:  # noqa: ANN401
+        """Error of the filter that can't be parsed (a raw item of the request body)."""
+        return BackendError(
+            data={"Parsed filter (DEBUG)": fltr} if dependencies_settings.DEPENDENCIES_DEBUG else None,
+            message=f"Can't parse filter value of '{get_filter_field(fltr=fltr)}'. Check validity of filter "
+            f"Object{{}} or a possibility filtering by this field.",
+        )
 
     def construct_sqlalchemy_operation(
         self,
         query_filters: list[QueryFilter[list[str] | StrOrNone]],
-    ) -> typing.Generator[BinaryExpression, None, None]:
-        """Pydantic to SQLAlchemy filter mapping & query builder."""
+    ) -> typing.Generator[tuple[tuple[str, FOps], BinaryExpression, DictStrOfAny], None, None]:
+        """Pydantic to SQLAlchemy filter mapping & query builder.
+
+        Values are placed into bound parameters named by position (`filtration_<N>`), so queries with the same
+        columns and operations have the same SQL.
+        """
+        position = 0
         for filter_schema in query_filters:
             column = getattr(self.model, self.aliases_mapping.get(filter_schema.field), None)
             if isinstance(column, InstrumentedAttribute) and isinstance(column.property, ColumnProperty):
                 selected_operation = get_sqlalchemy_where_operations_mapper(operation_type=filter_schema.operation)
-                operation: BinaryExpression = getattr(column, selected_operation)(filter_schema.value)
-                yield operation
+                shape_item = (column.key, filter_schema.operation)
+                if filter_schema.operation in (FOps.ISNULL, FOps.NOT_NULL):
+                    yield shape_item, getattr(column, selected_operation)(None), {}
+                    continue
+                name = f"filtration_{position}"
+                value = bindparam(key=name, value=filter_schema.value)
+                yield shape_item, getattr(column, selected_operation)(value), {name: filter_schema.value}
+                position += 1
@@ -1,11 +1,11 @@
-import base64
-import json
+import copy
+import math
 import operator
 import typing
 
 from fastapi import Body, Request
 from pydantic import Field
-from sqlalchemy import and_, or_
+from sqlalchemy import Row, and_, bindparam, or_, tuple_
 from sqlalchemy.sql.elements import ColumnElement
 
 from core.annotations import (
@@ -18,7 +18,9 @@ from core.annotations import (
     StrOrNone,
 )
 from core.custom_logging import get_logger
-from core.helpers import ExtendedJSONDecoder, ExtendedJSONEncoder
+from core.dependencies.body.cursors import decode_cursor, encode_cursor
+from core.enums import CountStrategy
+from core.exceptions import BackendError
 from core.schemas.requests import BaseRequestSchema
 from core.schemas.responses import PaginationResponseSchema
 
@@ -29,6 +31,13 @@ class PaginationRequestSchema(BaseRequestSchema):
     """RequestSchema for pagination."""
 
     next_token: StrOrNone = Field(default=None, description="nextToken from a previous result.", alias="nextToken")
+    prev_token: StrOrNone = Field(default=None, description="prevToken from a previous result.", alias="prevToken")
+    page: int | None = Field(
+        default=None,
+        ge=1,
+        description="Seek to the (approximate) page without `nextToken`, e.g. for scroll bars. Page boundaries are "
+        "sampled once and cached for a while, so pages may shift if objects are created or deleted meanwhile.",
+    )
     limit: int = Field(default=100, ge=1, le=1000, description="Number of records to return per request.")
 
 
@@ -65,35 +74,120 @@ class Pagination:
             ),
         ] = None,
     ) -> typing.Self:
-        """Dependency method."""
+        """Dependency method, returns a copy of the dependency with the request's pagination."""
         if not pagination:
             pagination = PaginationRequestSchema()
         if not request.state.sorting:
             msg = "You can't use Pagination without `Sorting`."
             raise NotImplementedError(msg)
 
-        self.next_token = pagination.next_token
-        self.limit = pagination.limit
-        request.state.pagination = self
-        self.request = request
-        return self
+        if sum(bool(value) for value in (pagination.next_token, pagination.prev_token, pagination.page)) > 1:
+            raise BackendError(message="Use only one of `nextToken`, `prevToken` or `page`.")
+
+        state = copy.copy(self)  # The dependency is shared by concurrent requests.
+        state.request = request
+        state.limit = pagination.limit
+        state.page = pagination.page
+        # `prevToken` fetches the page before the cursor: sorting and comparisons are reversed, then objects flipped.
+        state.backward = bool(pagination.prev_token)
+        state = state.seek(token=pagination.prev_token or pagination.next_token)
+        request.state.pagination = state
+        return state
+
+    def seek(self, token: StrOrNone) -> typing.Self:
+        """Returns a copy positioned at the cursor: the page starts after it (or ends before it for `prevToken`)."""
+        positioned = copy.copy(self)
+        positioned.next_token = token
+        positioned._next_token_fields = self.read_next_token(next_token=token) or []
+        positioned._shape = tuple((field["field"], field["order"]) for field in positioned._next_token_fields)
+        positioned._params = {
+            f"pagination_{index}": field["value"] for index, field in enumerate(positioned._next_token_fields)
+        }
+        positioned._params["pagination_limit"] = self.limit
+        return positioned
+
+    @property
+    def shape(self) -> tuple[tuple[str, str], ...]:
+        """Returns fields and orders from `nextToken`, that define SQL of the query (values are bound parameters)."""
+        return self._shape
+
+    @property
+    def params(self) -> DictStrOfAny:
+        """Returns values of bound parameters for the query (`nextToken` values and limit)."""
+        return self._params
 
     def paginate(
         self,
         objects: list[ModelInstance],
-        total: int,
+        total: int | None,
+        count_strategy: CountStrategy,
     ) -> PaginationResponseSchema[SchemaInstance]:
-        """Returns paginated ResponseSchema from the list of objects."""
-        _logger.debug(msg=f"Pagination | paginate | {objects=}, {total=}).")
-        next_token = self.create_next_token(latest_object=objects[-1] if objects else None, objects_count=len(objects))
+        """Returns paginated ResponseSchema from the list of objects and the total counted by `count_strategy`.
+
+        Pass the strategy returned by `BaseRepository.count_and_get_many`, it is the one actually used for the total.
+        """
+        _logger.debug(msg=f"Pagination | paginate | {objects=}, {total=}, {count_strategy=}).")
+        next_token, prev_token = self.create_tokens(objects=objects)
 
         return PaginationResponseSchema[self.schema](
             objects=(self.schema.from_model(obj=obj) for obj in objects),  # type: ignore
             limit=self.limit,
             total_count=total,
+            total_count_strategy=count_strategy,
             next_token=next_token,
+            prev_token=prev_token,
+            page=self.page,
+            pages=math.ceil(total / self.limit) if total is not None else None,
         )
 
+    def paginate_rows(
+        self,
+        rows: list[Row],
+        total: int | None,
+        count_strategy: CountStrategy,
+    ) -> PaginationResponseSchema[DictStrOfAny]:
+        """Returns paginated ResponseSchema from rows (see `BaseRepository.count_and_get_many(rows=True)`).
+
+        Rows become dicts keyed by aliases of the schema without its validation, so values must already have
+        response types (e.g. not for computed or converted fields).
+        """
+        _logger.debug(msg=f"Pagination | paginate_rows | {len(rows)=}, {total=}, {count_strategy=}).")
+        next_token, prev_token = self.create_tokens(objects=rows)
+        aliases = self._row_aliases(fields=rows[0]._fields) if rows else {}
+
+        return PaginationResponseSchema[DictStrOfAny](
+            objects=[{aliases[key]: value for key, value in row._mapping.items()} for row in rows],
+            limit=self.limit,
+            total_count=total,
+            total_count_strategy=count_strategy,
+            next_token=next_token,
+            prev_token=prev_token,
+            page=self.page,
+            pages=math.ceil(total / self.limit) if total is not None else None,
+        )
+
+    def _row_aliases(self, fields: tuple[str, ...]) -> dict[str, str]:
+        """Returns response alias (by the schema) of each row field."""
+        schema_fields = self.schema.model_fields
+        return {name: (schema_fields[name].alias or name) if name in schema_fields else name for name in fields}
+
+    def create_tokens(self, objects: list[ModelInstance] | list[Row]) -> tuple[StrOrNone, StrOrNone]:
+        """Returns next_token and prev_token for the page of objects."""
+        first_object, latest_object = (objects[0], objects[-1]) if objects else (None, None)
+        if self.backward:
+            # Objects before the cursor: there are always objects after, before - only if the page is full.
+            next_token = self.create_token(obj=latest_object) if objects else None
+            prev_token = self.create_prev_token(first_object=first_object, objects_count=len(objects))
+        else:
+            next_token = self.create_next_token(latest_object=latest_object, objects_count=len(objects))
+            prev_token = self.create_token(obj=first_object) if objects and self.shape else None
+        return next_token, prev_token
+
+    def create_token(self, obj: ModelInstance) -> str:
+        """Returns cursor of the object by the current `sorting`."""
+        shape = self.request.state.sorting.shape
+        return encode_cursor(values=[getattr(obj, field) for field, _ in shape], shape=shape)
+
     def create_next_token(self, latest_object: ModelOrNone, objects_count: int) -> StrOrNone:
         """Generate next_token for subsequent requests."""
         _logger.debug(msg=f"Pagination | create_next_token | {latest_object=}, {objects_count=}.")
@@ -101,54 +195,65 @@ class Pagination:
             next_token = None
             _logger.debug(msg=f"Pagination | create_next_token | {objects_count=} < {self.limit=} => {next_token=}.")
         else:
-            next_token_struct = [
-                {
-                    "field": sort_field.element.key,
-                    "value": getattr(latest_object, sort_field.element.key),
-                    "order": str(sort_field.expression).split()[-1].lower(),
-                }
-                for sort_field in self.request.state.sorting.query
-            ]
-            data: str = json.dumps(next_token_struct, cls=ExtendedJSONEncoder)
-            _logger.debug(msg=f"Pagination | create_next_token | {data=}.")
-            next_token: str = base64.urlsafe_b64encode(data.encode(encoding="utf-8")).decode(encoding="utf-8")
+            next_token = self.create_token(obj=latest_object)
             _logger.debug(msg=f"Pagination | create_next_token | {next_token=}.")
         return next_token
 
+    def create_prev_token(self, first_object: ModelOrNone, objects_count: int) -> StrOrNone:
+        """Generate prev_token for requests of the previous page (after `prevToken` request)."""
+        _logger.debug(msg=f"Pagination | create_prev_token | {first_object=}, {objects_count=}.")
+        if objects_count < self.limit:
+            return None
+        return self.create_token(obj=first_object)
+
     def read_next_token(self, next_token: StrOrNone) -> list[DictStrOfAny] | None:
-        """Read & parse next_token from request."""
+        """Read & verify next_token from request, returns fields with values and orders of the current `sorting`.
+
+        Orders are reversed for `prevToken`.
+
+        Raises:
+            BackendError: next_token is tampered or doesn't match the current `sorting`.
+        """
         _logger.debug(msg=f"Pagination | read_next_token | {next_token=}.")
         if not next_token:
             return None
 
-        try:
-            next_token_bytes: bytes = base64.urlsafe_b64decode(next_token.encode("utf-8"))
-            _logger.debug(msg=f"Pagination | read_next_token | {next_token_bytes=}.")
-            next_token: list[DictStrOfAny] = json.loads(next_token_bytes, cls=ExtendedJSONDecoder)
-        except Exception as error:
-            _logger.warning(msg=f"Pagination | read_next_token | Error parsing `nextToken` | {error}")
-            next_token = None
-
-        _logger.debug(msg=f"Pagination | read_next_token | {next_token=}.")
-        return next_token
+        shape = self.request.state.sorting.shape
+        values = decode_cursor(token=next_token, shape=shape)
+        reverse = {"asc": "desc", "desc": "asc"} if self.backward else {"asc": "asc", "desc": "desc"}
+        next_token_fields = [
+            {"field": field, "value": value, "order": reverse[order]}
+            for (field, order), value in zip(shape, values, strict=True)
+        ]
+        _logger.debug(msg=f"Pagination | read_next_token | {next_token_fields=}.")
+        return next_token_fields
 
     def get_query(self, next_token: StrOrNone) -> ColumnElement[bool] | None:
         """Returns SQLAlchemy ready query for pagination."""
         _logger.debug(msg=f"Pagination | get_next_query | {next_token=}.")
-        next_token = self.read_next_token(next_token=next_token)
+        if next_token == self.next_token:
+            next_token = self._next_token_fields  # already verified in `__call__`
+        else:
+            next_token = self.read_next_token(next_token=next_token)
         if not next_token:
             return None
 
+        columns = [getattr(self.model, field["field"]) for field in next_token]
+        values = [bindparam(key=f"pagination_{index}", value=field["value"]) for index, field in enumerate(next_token)]
+        operations = [operator.gt if field["order"] == "asc" else operator.lt for field in next_token]
+
+        if len(set(operations)) == 1:
+            # Same direction for all fields: row-value comparison `(a, b, id) > (x, y, z)`, that Postgres executes as
+            # a range scan of the composite index.
+            if len(columns) == 1:
+                return operations[0](columns[0], values[0])
+            return operations[0](tuple_(*columns), tuple_(*values))
+
+        # Mixed directions: `(a > x) OR (a = x AND b < y) OR ...`.
         pagination_conditions = []
         previous_conditions = []
-        for next_token_field in next_token:
-            field, value, order = (
-                next_token_field["field"],
-                next_token_field["value"],
-                next_token_field["order"],
-            )
-            operation = operator.gt if order == "asc" else operator.lt
-            pagination_conditions.append(and_(*previous_conditions, operation(getattr(self.model, field), value)))
-            previous_conditions.append(getattr(self.model, field) == value)
+        for column, value, operation in zip(columns, values, operations, strict=True):
+            pagination_conditions.append(and_(*previous_conditions, operation(column, value)))
+            previous_conditions.append(column == value)
 
         return or_(*pagination_conditions)
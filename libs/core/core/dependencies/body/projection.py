@@ -1,13 +1,15 @@
 __all__ = ("Projection",)
+import copy
 import enum
 import typing
 
 from fastapi import Body, Request
 from pydantic import Field
-from sqlalchemy.orm import Load, undefer
+from sqlalchemy.orm import InstrumentedAttribute, Load, undefer
 from sqlalchemy.orm.strategy_options import _AbstractLoad
 
 from core.annotations import ModelType, SchemaType
+from core.caches.memory import TTLCache
 from core.custom_logging import get_logger
 from core.schemas.requests import BaseRequestSchema
 
@@ -39,12 +41,28 @@ class Projection:
         self.model = model
         self.schema = schema
         self.aliases_mapping = self.schema.collect_aliases()
+        # Loader options and columns depend only on requested fields and sorting, so they are built once per
+        # combination.
+        self._options: TTLCache[
+            typing.Hashable,
+            tuple[Load | _AbstractLoad, tuple[InstrumentedAttribute, ...]],
+        ] = TTLCache(maxsize=128, ttl=None)
 
     @property
     def query(self) -> Load | _AbstractLoad:
         return self._projection
 
-    async def __call__(  # noqa: PLR0912
+    @property
+    def columns(self) -> tuple[InstrumentedAttribute, ...]:
+        """Returns model columns, that the projection loads (to select rows without ORM instances)."""
+        return self._columns
+
+    @property
+    def shape(self) -> typing.Hashable:
+        """Returns requested fields, mode and sorted fields, that define SQL of the query."""
+        return self._shape
+
+    async def __call__(
         self,
         request: Request,
         projection: typing.Annotated[
@@ -69,17 +87,39 @@ class Projection:
             ),
         ] = None,
     ) -> typing.Self:
+        """Dependency method, returns a copy of the dependency with the request's projection."""
         if not request.state.sorting:
             msg = "You can't use Projection without `Sorting`."
             raise NotImplementedError(msg)
+
+        raw_sorting = tuple(request.state.sorting.raw_sorting)
+        if not projection:
+            shape = (None, None, raw_sorting)
+        else:
+            fields = projection.fields if isinstance(projection.fields, str) else tuple(projection.fields)
+            shape = (projection.mode, fields, raw_sorting)
+
+        result = self._options.get(key=shape)
+        if result is None:
+            result = (
+                self.build(request=request, projection=projection),
+                self.build_columns(request=request, projection=projection),
+            )
+            self._options.set(key=shape, value=result)
+
+        state = copy.copy(self)  # The dependency is shared by concurrent requests.
+        state._projection, state._columns = result
+        state._shape = shape
+        request.state.projection = state
+        return state
+
+    def build(self, request: Request, projection: ProjectionRequest | None) -> Load | _AbstractLoad:
+        """Builds SQLAlchemy loader options for the projection."""
         if not projection:
             _logger.debug(
-                msg=f"Projection | __call__ | Projection not provided, using `undefer({self._wildcard_symbol})`.",
+                msg=f"Projection | build | Projection not provided, using `undefer({self._wildcard_symbol})`.",
             )
-            result = undefer(self._wildcard_symbol)
-            request.state.projection = result
-            self._projection = result
-            return self
+            return undefer(self._wildcard_symbol)
 
         if projection.fields in (self._wildcard_symbol, [self._wildcard_symbol]):
             return self.handle_wildcard_projection(request=request, projection=projection)
@@ -87,7 +127,7 @@ class Projection:
         match projection.mode:
             case ProjectionMode.INCLUDE:
                 _logger.debug(
-                    msg=f"Projection | __call__ | {projection.mode=}, running `load_only` on {projection.fields} + "
+                    msg=f"Projection | build | {projection.mode=}, running `load_only` on {projection.fields} + "
                     f"{request.state.sorting.raw_sorting}.",
                 )
                 results = []
@@ -101,8 +141,8 @@ class Projection:
                 else:
                     result = Load(entity=self.model).load_only(self.model.id)
             case ProjectionMode.EXCLUDE:
-                _logger.debug(msg=f"Projection | __call__ | {projection.mode=}, running exclude flow.")
-                _logger.debug("Projection | __call__ | Including `id` to response.")
+                _logger.debug(msg=f"Projection | build | {projection.mode=}, running exclude flow.")
+                _logger.debug("Projection | build | Including `id` to response.")
                 result = undefer(self.model.id)
                 for field in projection.fields:
                     field_name = self.aliases_mapping.get(field, "...")
@@ -110,32 +150,53 @@ class Projection:
                         attr = getattr(self.model, field_name)
                         if attr.primary_key or field_name in request.state.sorting.raw_sorting:
                             _logger.debug(
-                                msg=f"Projection | __call__ | Skipping `{field_name}` because it's PK or included "
+                                msg=f"Projection | build | Skipping `{field_name}` because it's PK or included "
                                 f"in sorting.",
                             )
                             continue
-                        _logger.debug(msg=f"Projection | __call__ | Excluding `{attr}` from response.")
+                        _logger.debug(msg=f"Projection | build | Excluding `{attr}` from response.")
                         result = result.defer(attr)
             case _:
                 result = ...
 
-        self._projection = result
-        request.state.projection = self
-        return self
+        return result
 
-    def handle_wildcard_projection(self, request: Request, projection: ProjectionRequest) -> typing.Self:
+    def build_columns(
+        self,
+        request: Request,
+        projection: ProjectionRequest | None,
+    ) -> tuple[InstrumentedAttribute, ...]:
+        """Builds model columns for the projection: the same columns, that loader options load (PK is always loaded)."""
+        mapper = self.model.__mapper__
+        column_names = [attr.key for attr in mapper.column_attrs]
+        primary_keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        raw_sorting = request.state.sorting.raw_sorting
+        fields = [self.aliases_mapping.get(field, "...") for field in projection.fields] if projection else []
+
+        if not projection or projection.fields in (self._wildcard_symbol, [self._wildcard_symbol]):
+            include_all = not projection or projection.mode == ProjectionMode.INCLUDE
+            names = column_names if include_all else [*primary_keys, *raw_sorting]
+        elif projection.mode == ProjectionMode.INCLUDE:
+            names = [*primary_keys, *fields, *raw_sorting]
+        else:
+            excluded = set(fields) - {*primary_keys, *raw_sorting}
+            names = [name for name in column_names if name not in excluded]
+
+        return tuple(getattr(self.model, name) for name in dict.fromkeys(names) if name in column_names)
+
+    def handle_wildcard_projection(self, request: Request, projection: ProjectionRequest) -> Load | _AbstractLoad:
         _logger.debug(
-            msg=f"Projection | __call__ | {projection.fields=}, running wildcard ({self._wildcard_symbol}) flow.",
+            msg=f"Projection | wildcard | {projection.fields=}, running wildcard ({self._wildcard_symbol}) flow.",
         )
         match projection.mode:
             case ProjectionMode.INCLUDE:
                 _logger.debug(
-                    msg=f"Projection | __call__ | {projection.mode=}, using `undefer({self._wildcard_symbol})`.",
+                    msg=f"Projection | wildcard | {projection.mode=}, using `undefer({self._wildcard_symbol})`.",
                 )
                 result = undefer(self._wildcard_symbol)
             case ProjectionMode.EXCLUDE:
                 _logger.debug(
-                    msg=f"Projection | __call__ | {projection.mode=}, using `load_only` by fields from sorting.",
+                    msg=f"Projection | wildcard | {projection.mode=}, using `load_only` by fields from sorting.",
                 )
                 result = []
                 # Fields, that used in sorting cannot be excluded from result.
@@ -147,6 +208,4 @@ class Projection:
             case _:
                 result = ...
 
-        self._projection = result
-        request.state.projection = self
-        return self
+        return result
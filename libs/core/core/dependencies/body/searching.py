@@ -1,12 +1,16 @@
+import copy
 import enum
 import typing
 
 from fastapi import Body, Request
 from pydantic import Field
-from sqlalchemy import TextClause, text
+from sqlalchemy import Column, ColumnElement, Float, String, and_, bindparam, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
 
-from core.annotations import ModelColumnInstance, ModelType, SchemaType
+from core.annotations import DictStrOfAny, ModelColumnInstance, ModelType, SchemaType
 from core.custom_logging import get_logger
+from core.db.search import SEARCH_VECTOR_INFO_KEY, SearchVector
+from core.dependencies.settings import dependencies_settings
 from core.schemas.requests import BaseRequestSchema
 
 _logger = get_logger(name=__name__)
@@ -16,6 +20,8 @@ class SearchingMode(str, enum.Enum):
     WEB = "WEB"
     PHRASE = "PHRASE"
     PLAIN = "PLAIN"
+    TRIGRAM = "TRIGRAM"  # Fuzzy search by `pg_trgm` similarity, ranked by similarity.
+    PREFIX = "PREFIX"  # Case-insensitive prefix (autocomplete) search, uses `pg_trgm` index.
 
 
 class SearchingRequest(BaseRequestSchema):
@@ -29,6 +35,17 @@ class SearchingRequest(BaseRequestSchema):
         default_factory=list,
         description="Fields for searching. If multiple provided, it used with `OR` logic.",
     )
+    rank: bool = Field(
+        default=False,
+        description="Order results by relevance (`ts_rank` or similarity) before `sorting`. Always enabled for "
+        "`TRIGRAM` mode. Can't be used with `nextToken`.",
+    )
+    threshold: float | None = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description="Minimal similarity for `TRIGRAM` mode (server's default if not provided).",
+    )
 
 
 class Searching:
@@ -42,6 +59,12 @@ class Searching:
         self.schema = schema
         self.aliases_mapping = self.schema.collect_aliases()
         self.available_columns_names = [col.key for col in available_columns or []]
+        # Stored `tsvector` columns declared by `search_vector_column`.
+        self.vectors: list[tuple[Column, SearchVector]] = [
+            (column, column.info[SEARCH_VECTOR_INFO_KEY])
+            for column in self.model.__table__.columns
+            if SEARCH_VECTOR_INFO_KEY in column.info
+        ]
 
     async def __call__(
         self,
@@ -72,12 +95,17 @@ class Searching:
             ),
         ] = None,
     ) -> typing.Self:
-        search_queries: list[TextClause] = []
+        """Dependency method, returns a copy of the dependency with the request's search conditions."""
+        search_queries: list[ColumnElement[bool]] = []
+        state = copy.copy(self)  # The dependency is shared by concurrent requests.
+        state._rank = None
+        state._shape = ()
+        state._params = {}
 
         if not searching:
             _logger.debug(msg=f"{self.__class__.__name__} | __call__ | {searching=}. Skipped.")
-            self._searching = search_queries
-            return self
+            state._searching = search_queries
+            return state
 
         _logger.debug(
             msg=f'{self.__class__.__name__} | __call__ | text="{searching.text}", mode={searching.mode}, '
@@ -85,22 +113,113 @@ class Searching:
         )
         search_mode = self.get_postgresql_search_method(mode=searching.mode)
 
+        columns_names = []
         for field in searching.fields:
             column_name = self.aliases_mapping.get(field, field)
             if hasattr(self.model, column_name) and column_name in self.available_columns_names:
-                column = getattr(self.model, column_name)
-                query = text(f"to_tsvector({column.name}) @@ {search_mode}(:query)").params(query=searching.text)
-                search_queries.append(query)
+                columns_names.append(column_name)
+
+        if columns_names and searching.mode in (SearchingMode.TRIGRAM, SearchingMode.PREFIX):
+            condition, state._rank, state._params = self.get_trigram_condition(
+                searching=searching,
+                columns_names=columns_names,
+            )
+            search_queries.append(condition)
+            state._shape = (searching.mode, tuple(columns_names), state._rank is not None)
+        elif columns_names:
+            language = bindparam(key="searching_language", value=searching.language, type_=REGCONFIG)
+            query = getattr(func, search_mode)(language, bindparam(key="searching_query", value=searching.text))
+            document, condition = self.get_document(columns_names=columns_names, language=language, query=query)
+            search_queries.append(condition)
+            state._rank = func.ts_rank(document, query) if searching.rank else None
+            state._shape = (search_mode, searching.language, tuple(columns_names), searching.rank)
+            state._params = {"searching_query": searching.text, "searching_language": searching.language}
+
+        state._searching = search_queries
+        request.state.searching = state
+        return state
+
+    def get_document(
+        self,
+        columns_names: list[str],
+        language: ColumnElement,
+        query: ColumnElement,
+    ) -> tuple[ColumnElement, ColumnElement[bool]]:
+        """Returns `tsvector` document for columns and the search condition against it.
+
+        Uses stored vector of the same language that covers all columns (GIN index), limited by `ts_filter` to
+        weights of the requested columns. Without such vector, the document is built on the fly (sequential scan).
+        """
+        for column, vector in self.vectors:
+            if vector.language != language.value or not set(columns_names) <= vector.weights.keys():
+                continue
+            condition = column.bool_op("@@")(query)
+            weights = sorted({vector.weights[name] for name in columns_names})
+            if set(weights) == set(vector.weights.values()):
+                return column, condition
+            # Index narrows rows by the whole vector, then only lexemes of requested columns are checked.
+            document = func.ts_filter(column, literal_column(f"""'{{{",".join(weights)}}}'::"char"[]"""))
+            return document, and_(condition, document.bool_op("@@")(query))
 
-        self._searching = search_queries
-        request.state.searching = self
-        return self
+        _logger.debug(
+            msg=f"{self.__class__.__name__} | get_document | No stored vector for {columns_names} in "
+            f'"{language.value}", building it on the fly.',
+        )
+        columns = [getattr(self.model, name) for name in columns_names]
+        document = func.to_tsvector(language, func.concat_ws(" ", *columns))
+        return document, document.bool_op("@@")(query)
+
+    def get_trigram_condition(
+        self,
+        searching: SearchingRequest,
+        columns_names: list[str],
+    ) -> tuple[ColumnElement[bool], ColumnElement | None, DictStrOfAny]:
+        """Returns condition, similarity rank and parameters for `TRIGRAM` and `PREFIX` modes.
+
+        Both are expressed by operators, that `pg_trgm` GIN/GiST indexes support (`%` and `ILIKE`).
+        """
+        columns = [getattr(self.model, name) for name in columns_names]
+        text_param = bindparam(key="searching_text", value=searching.text, type_=String)
+        similarity = func.greatest(*(func.similarity(column, text_param) for column in columns))
+        params: DictStrOfAny = {"searching_text": searching.text}
+
+        if searching.mode == SearchingMode.TRIGRAM:
+            threshold = searching.threshold
+            if threshold is None:
+                threshold = dependencies_settings.DEPENDENCIES_SEARCHING_TRIGRAM_THRESHOLD
+            params["searching_threshold"] = threshold
+            condition = and_(
+                or_(*(column.bool_op("%")(text_param) for column in columns)),
+                similarity >= bindparam(key="searching_threshold", value=threshold, type_=Float),
+            )
+            return condition, similarity, params
+
+        escaped = searching.text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["searching_pattern"] = f"{escaped}%"
+        pattern_param = bindparam(key="searching_pattern", value=params["searching_pattern"], type_=String)
+        condition = or_(*(column.ilike(pattern_param, escape="\\") for column in columns))
+        return condition, similarity if searching.rank else None, params
 
     @property
-    def query(self) -> list[TextClause]:
+    def query(self) -> list[ColumnElement[bool]]:
         return self._searching
 
-    def __iter__(self) -> typing.Iterator[list[TextClause]]:
+    @property
+    def rank(self) -> ColumnElement | None:
+        """Returns `ts_rank` expression if ordering by relevance was requested."""
+        return self._rank
+
+    @property
+    def shape(self) -> tuple[typing.Any, ...]:
+        """Returns search method and columns, that define SQL of the query (text is a bound parameter)."""
+        return self._shape
+
+    @property
+    def params(self) -> dict[str, str]:
+        """Returns values of bound parameters for the query."""
+        return self._params
+
+    def __iter__(self) -> typing.Iterator[ColumnElement[bool]]:
         yield from self.query
 
     def get_postgresql_search_method(self, mode: SearchingMode) -> str:
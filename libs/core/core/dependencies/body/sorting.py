@@ -1,7 +1,9 @@
+import copy
 import typing
 
 from fastapi import Body, Request
-from sqlalchemy import UnaryExpression
+from sqlalchemy import Index, UnaryExpression, UniqueConstraint
+from sqlalchemy.sql.schema import ColumnCollectionConstraint
 
 from core.annotations import ModelColumnInstance, ModelType, SchemaType
 from core.custom_logging import get_logger
@@ -18,18 +20,41 @@ class Sorting:
         schema: SchemaType,
         default_sorting: list[str] | None = None,
         available_columns: list[ModelColumnInstance] | None = None,
+        *,
+        verify_index: bool = False,
     ) -> None:
         self.model = model
         self.schema = schema
         self.aliases_mapping = self.schema.collect_aliases()
         self._default_sorting = default_sorting or ["-id"]  # If no provided, sort by `id` DESC.
         self.available_columns_names = [col.key for col in available_columns or []]
+        # Sort expressions don't depend on request values, so they are built once: (<column>, <asc|desc>) => expression.
+        self._orderings: dict[tuple[str, str], UnaryExpression] = {
+            (name, ordering_method): getattr(getattr(self.model, name), ordering_method)()
+            for name in self.available_columns_names
+            if hasattr(self.model, name)
+            for ordering_method in ("asc", "desc")
+        }
+        # Log a warning (once per sorting) when no B-tree index matches sorting, so keyset pagination sorts rows.
+        self.verify_index = verify_index
+        self._verified_shapes: set[tuple[tuple[str, str], ...]] = set()
 
     @property
     def query(self) -> list[UnaryExpression]:
         """Returns SQLAlchemy ready query for sorting."""
         return self._sorting
 
+    @property
+    def reversed_query(self) -> list[UnaryExpression]:
+        """Returns SQLAlchemy ready query for sorting in the opposite direction (for `prevToken`)."""
+        reverse = {"asc": "desc", "desc": "asc"}
+        return [self._orderings[(name, reverse[ordering_method])] for name, ordering_method in self._shape]
+
+    @property
+    def shape(self) -> tuple[tuple[str, str], ...]:
+        """Returns sorted columns with directions, that define SQL of the query."""
+        return self._shape
+
     @property
     def raw_sorting(self) -> list[str]:
         """Returns sorting query for usage inside projection."""
@@ -53,7 +78,7 @@ class Sorting:
             ),
         ] = None,
     ) -> typing.Self:
-        """Dependency method."""
+        """Dependency method, returns a copy of the dependency with the request's sorting."""
         _logger.debug(msg=f"{self.__class__.__name__} | __call__ | {sorting=}.")
         if not sorting:
             _logger.debug(
@@ -69,18 +94,57 @@ class Sorting:
 
         raw_sorting = []
         result = []
+        shape = []
         for column in sorting:
             raw_column = column.strip().removeprefix("-").removeprefix("+")
             # retrieve real column name by alias, or skip (by default)
             raw_column = self.aliases_mapping.get(raw_column, raw_column)
-            if hasattr(self.model, raw_column) and raw_column in self.available_columns_names:
+            ordering_method = "desc" if column.startswith("-") else "asc"  # Choose method to use: .acs() OR .desc()
+            ordering = self._orderings.get((raw_column, ordering_method))  # e.g. Model.<raw_column>.desc()
+            if ordering is not None:
                 raw_sorting.append(raw_column)
-                ordering_method = "desc" if column.startswith("-") else "asc"  # Choose method to use: .acs() OR .desc()
-                col_attr = getattr(self.model, raw_column)  # e.g. Get model attribute dynamically: Model.<raw_column>
-                result.append(getattr(col_attr, ordering_method)())  # e.g. Model.<raw_column>.desc()
+                result.append(ordering)
+                shape.append((raw_column, ordering_method))
+
+        # The dependency is shared by concurrent requests, so the request's sorting is kept by its copy.
+        state = copy.copy(self)
+        state._sorting = result
+        state._raw_sorting = raw_sorting
+        state._shape = tuple(shape)
+        if self.verify_index and state.shape not in self._verified_shapes:
+            self._verified_shapes.add(state.shape)
+            if self.find_index(shape=state.shape) is None:
+                _logger.warning(
+                    msg=f"{self.__class__.__name__} | __call__ | No index matches sorting {state.shape} of "
+                    f'"{self.model.__tablename__}", pagination will sort rows.',
+                )
+        _logger.debug(msg=f"{self.__class__.__name__} | __call__ | {state.query=}, {state.raw_sorting=}.")
+        request.state.sorting = state
+        return state
+
+    def find_index(self, shape: tuple[tuple[str, str], ...]) -> Index | ColumnCollectionConstraint | None:
+        """Returns B-tree index (or primary key / unique constraint) of the model's table, that matches sorting.
 
-        self._sorting = result
-        self._raw_sorting = raw_sorting
-        _logger.debug(msg=f"{self.__class__.__name__} | __call__ | {self.query=}, {self.raw_sorting=}.")
-        request.state.sorting = self
-        return self
+        Index matches if its columns start with sorted columns, or if it is unique and sorted columns start with its
+        columns (the rest of sorted columns doesn't change the order). Directions are not checked: B-tree index is
+        scanned backward for the opposite direction.
+        """
+        table, mapped_columns = self.model.__table__, self.model.__mapper__.columns
+        if any(name not in mapped_columns for name, _ in shape):
+            return None
+        columns = [mapped_columns[name].name for name, _ in shape]
+        candidates = [
+            table.primary_key,
+            *(constraint for constraint in table.constraints if isinstance(constraint, UniqueConstraint)),
+            *table.indexes,
+        ]
+        for candidate in candidates:
+            if (candidate.kwargs.get("postgresql_using") or "btree") != "btree":
+                continue
+            index_columns = [column.name for column in candidate.columns]
+            if not index_columns:
+                continue
+            unique = not isinstance(candidate, Index) or candidate.unique
+            if index_columns[: len(columns)] == columns or (unique and columns[: len(index_columns)] == index_columns):
+                return candidate
+        return None
@@ -8,6 +8,7 @@ from fastapi import Depends, Request, Response
 
 import redis.asyncio as aioredis
 from core.custom_logging import get_logger
+from core.db.bases import redis_engine
 from core.dependencies import get_redis
 from core.enums import RatePeriod
 from core.exceptions import RateLimitError
@@ -19,6 +20,7 @@ __all__ = (
     "Rate",
     "SlidingWindowRateLimiter",
     "TokenBucketRateLimiter",
+    "load_rate_limiters_scripts",
 )
 
 logger = get_logger(name=__name__)
@@ -95,11 +97,19 @@ class Rate:
 
 
 class BaseRedisRateLimiter(abc.ABC):
-    """Base realization for limiter, adapted to Redis."""
+    """Base realization for limiter, adapted to Redis.
+
+    Every limiter keeps its Redis logic inside a Lua script (`lua_script`), which is executed via EVALSHA, so each check
+    is a single atomic round trip to Redis.
+    """
+
+    lua_script: typing.ClassVar[str]
 
     def __init__(self, rate: Rate, key_prefix: str = "limiter") -> None:
         self._rate = rate
         self._key_prefix = key_prefix
+        # SHA1 calculated once, script loaded into Redis lazily (on NOSCRIPT) or at startup via `load_script`.
+        self._script = redis_engine.register_script(script=self.lua_script)
 
     @abc.abstractmethod
     async def __call__(
@@ -121,6 +131,18 @@ class BaseRedisRateLimiter(abc.ABC):
         """Return limiter's key prefix."""
         return self._key_prefix
 
+    @classmethod
+    async def load_script(cls, redis_client: aioredis.Redis) -> str:
+        """Load limiter's Lua script into Redis scripts cache.
+
+        Args:
+            redis_client (aioredis.Redis): Async client instance for Redis.
+
+        Returns:
+            (str): SHA1 of the loaded script.
+        """
+        return await redis_client.script_load(cls.lua_script)
+
     def key(self, *, request: Request, now: pendulum.DateTime, previous: bool = False) -> str:
         """Construct key for Redis.
 
@@ -177,6 +199,15 @@ class BaseRedisRateLimiter(abc.ABC):
 
 
 class FixedWindowRateLimiter(BaseRedisRateLimiter):
+    # KEYS[1] - window key; ARGV[1] - key expiration in milliseconds.
+    lua_script = """
+local counter = redis.call("INCR", KEYS[1])
+if counter == 1 then
+    redis.call("PEXPIRE", KEYS[1], ARGV[1])
+end
+return counter
+"""
+
     async def __call__(
         self,
         *,
@@ -201,12 +232,14 @@ class FixedWindowRateLimiter(BaseRedisRateLimiter):
         now = self.now()
         key = self.key(request=request, now=now)
 
-        # === Redis logic starts ===
-        counter: int = await redis_client.incr(name=key)
         expiration = self.expiration(now=now)
-        if counter == 1:
-            await redis_client.expire(name=key, time=expiration)
-        # === Redis logic ends ===
+        counter = int(
+            await self._script(
+                keys=[key],
+                args=[max(int(expiration.total_seconds() * 1000), 1)],
+                client=redis_client,
+            ),
+        )
 
         rate_limit_headers = self.get_and_update_headers(
             request=request,
@@ -248,6 +281,25 @@ class FixedWindowRateLimiter(BaseRedisRateLimiter):
 
 
 class SlidingWindowRateLimiter(BaseRedisRateLimiter):
+    # KEYS[1] - current window key, KEYS[2] - previous window key;
+    # ARGV[1] - limit, ARGV[2] - weight of the previous window, ARGV[3] - key expiration in milliseconds.
+    # Returns {status, count, weight}: 0 - exceeded by count, 1 - exceeded by weight, 2 - accepted.
+    lua_script = """
+local limit = tonumber(ARGV[1])
+local count = tonumber(redis.call("GET", KEYS[1]) or "0")
+if count >= limit then
+    return {0, count, "0"}
+end
+local previous_count = tonumber(redis.call("GET", KEYS[2]) or "0")
+local weight = previous_count * tonumber(ARGV[2]) + count
+if weight >= limit then
+    return {1, count, tostring(weight)}
+end
+redis.call("INCR", KEYS[1])
+redis.call("PEXPIRE", KEYS[1], ARGV[3])
+return {2, count, tostring(weight)}
+"""
+
     async def __call__(
         self,
         request: Request,
@@ -256,21 +308,23 @@ class SlidingWindowRateLimiter(BaseRedisRateLimiter):
     ) -> None:
         now = self.now()
         key = self.key(request=request, now=now)
+        prev_key = self.key(request=request, now=now, previous=True)
+        prev_percentage = (now.timestamp() % self.rate.seconds) / self.rate.seconds
+        expiration = (self.current_window_start(now=now) + datetime.timedelta(seconds=self.rate.seconds * 2)) - now
 
-        # === Redis logic starts ===
-        count = int(await redis_client.get(name=key) or 0)
-        if int(count) >= self.rate.number:
+        status, count, weight_count = await self._script(
+            keys=[key, prev_key],
+            args=[self.rate.number, 1 - prev_percentage, max(int(expiration.total_seconds() * 1000), 1)],
+            client=redis_client,
+        )
+        count, weight_count = int(count), float(weight_count)
+        if int(status) == 0:
             rate_limit_headers = self.get_and_update_headers(request=request, response=response, hits=count)
             raise RateLimitError(
                 message=f"Request limit exceeded for this quota: '{self.rate}'.",
                 headers=rate_limit_headers,
             )
 
-        prev_key = self.key(request=request, now=now, previous=True)
-        prev_count = int(await redis_client.get(name=prev_key) or 0)
-        prev_percentage = (now.timestamp() % self.rate.seconds) / self.rate.seconds
-        weight_count = prev_count * (1 - prev_percentage) + count
-
         rate_limit_headers = self.get_and_update_headers(
             request=request,
             response=response,
@@ -284,13 +338,6 @@ class SlidingWindowRateLimiter(BaseRedisRateLimiter):
                 headers=rate_limit_headers,
             )
 
-        expiration = (self.current_window_start(now=now) + datetime.timedelta(seconds=self.rate.seconds * 2)) - now
-        pipe = redis_client.pipeline(transaction=False)
-        pipe.incr(name=key)
-        pipe.expire(name=key, time=expiration.seconds)
-        await pipe.execute()
-        # === Redis Logic ends ===
-
     def get_and_update_headers(
         self,
         *,
@@ -322,6 +369,22 @@ class SlidingWindowRateLimiter(BaseRedisRateLimiter):
 
 
 class TokenBucketRateLimiter(BaseRedisRateLimiter):
+    # KEYS[1] - bucket key; ARGV[1] - now (unix seconds), ARGV[2] - capacity, ARGV[3] - refill period in seconds,
+    # ARGV[4] - key expiration in milliseconds. Returns remaining tokens or -1 when the bucket is empty.
+    lua_script = """
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[3])
+local latest_reset_time = tonumber(redis.call("HGET", KEYS[1], "latest_reset_time") or (now - period))
+if now - latest_reset_time >= period then
+    redis.call("HSET", KEYS[1], "counter", ARGV[2], "latest_reset_time", now)
+elseif tonumber(redis.call("HGET", KEYS[1], "counter") or "0") <= 0 then
+    return -1
+end
+local remaining = redis.call("HINCRBY", KEYS[1], "counter", -1)
+redis.call("PEXPIRE", KEYS[1], ARGV[4])
+return remaining
+"""
+
     async def __call__(
         self,
         request: Request,
@@ -331,24 +394,28 @@ class TokenBucketRateLimiter(BaseRedisRateLimiter):
         now = self.now()
         key = self.key(request=request, now=now)
 
-        # === Redis Logic starts ===
-        data: dict[str, str] = await redis_client.hgetall(name=key)
-        latest_reset_time = data.get(
-            "latest_reset_time",
-            (now - datetime.timedelta(seconds=self.rate.seconds)).timestamp(),
+        remaining = int(
+            await self._script(
+                keys=[key],
+                args=[
+                    int(now.timestamp()),
+                    self.rate.number,
+                    self.rate.seconds,
+                    max(int(self.expiration(now=now).total_seconds() * 1000), 1),
+                ],
+                client=redis_client,
+            ),
         )
-        if (now - pendulum.from_timestamp(timestamp=int(latest_reset_time))).seconds >= self.rate.seconds:
-            await redis_client.hset(
-                name=key,
-                mapping={"counter": self.rate.number, "latest_reset_time": int(now.timestamp())},
-            )
-        else:
-            current_counter = int(await redis_client.hget(name=key, key="counter"))
-            if current_counter <= 0:
-                raise RateLimitError(message=f"Request limit exceeded for this quota: '{self.rate}'.")
-
-        pipe = redis_client.pipeline(transaction=False)
-        pipe.hincrby(name=key, key="counter", amount=-1)
-        pipe.expire(name=key, time=self.expiration(now=now))
-        await pipe.execute()
-        # === Redis Logic ends ===
+        if remaining < 0:
+            raise RateLimitError(message=f"Request limit exceeded for this quota: '{self.rate}'.")
+
+
+async def load_rate_limiters_scripts(redis_client: aioredis.Redis) -> None:
+    """Register Lua scripts of all rate limiters in Redis, so requests go straight to EVALSHA.
+
+    Args:
+        redis_client (aioredis.Redis): Async client instance for Redis.
+    """
+    for limiter_class in BaseRedisRateLimiter.__subclasses__():
+        sha = await limiter_class.load_script(redis_client=redis_client)
+        logger.debug(f"{limiter_class.__name__} | load_script | sha: {sha}")
@@ -13,6 +13,14 @@ class DependenciesSettings(BaseSettings):
     )
 
     DEPENDENCIES_DEBUG: bool = Field(default=False)
+    DEPENDENCIES_PAGINATION_SECRET_KEY: str = Field(default="TEST", description="HMAC key for `nextToken` signing.")
+    DEPENDENCIES_SEARCHING_TRIGRAM_THRESHOLD: float = Field(
+        default=0.3,
+        ge=0,
+        le=1,
+        description="Minimal `similarity()` for `TRIGRAM` search. Values below `pg_trgm.similarity_threshold` (0.3 by "
+        "default) don't add results, because the `%` operator filters rows first.",
+    )
 
 
 @functools.lru_cache
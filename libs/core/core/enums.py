@@ -59,3 +59,19 @@ class RatePeriod(str, enum.Enum):
     HOUR = "hours"
     DAY = "days"
     WEEK = "weeks"
+
+
+class CountStrategy(str, enum.Enum):
+    """Strategies for counting the total number of objects in paginated queries."""
+
+    EXACT = "exact"  # SELECT count(*) on every request.
+    CACHED = "cached"  # Exact count, cached in Redis for the same query.
+    ESTIMATED = "estimated"  # Planner estimate (pg_class.reltuples or EXPLAIN rows).
+    FIRST_PAGE = "first_page"  # Exact count only for the first page (without `nextToken`).
+
+
+class ReplicaBalancing(str, enum.Enum):
+    """Strategies for choosing a read replica for read-only sessions."""
+
+    ROUND_ROBIN = "round_robin"  # Replicas in turn.
+    LEAST_CONNECTIONS = "least_connections"  # Replica with the least connections checked out of its pool.
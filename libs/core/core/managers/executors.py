@@ -0,0 +1,95 @@
+__all__ = ("BoundedExecutor",)
+
+import asyncio
+import concurrent.futures
+import threading
+import typing
+
+from fastapi import status
+
+from core.custom_logging import get_logger
+from core.enums import JSENDStatus
+from core.exceptions import BackendError
+
+logger = get_logger(name=__name__)
+
+T = typing.TypeVar("T")
+
+
+class BoundedExecutor:
+    """Size-limited thread pool for blocking (CPU heavy, GIL releasing) calls with back-pressure.
+
+    No more than `max_workers` calls run at once and no more than `max_queue` wait for a free worker, everything
+    above is rejected immediately with 503, instead of stalling the event loop or piling up unbounded work. A call
+    holds its slot until it finishes in the pool, even if the awaiting request is cancelled (thread can't be stopped).
+
+    Examples:
+        >>> executor = BoundedExecutor(max_workers=2, max_queue=8)
+        >>> await executor.run(bcrypt.gensalt)
+        b'$2b$12$...'
+    """
+
+    def __init__(self, *, max_workers: int = 4, max_queue: int = 32, thread_name_prefix: str = "bounded") -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_workers + max_queue
+        self._thread_name_prefix = thread_name_prefix
+        self._pending = 0
+        self._lock = threading.Lock()  # `_pending` is decremented in pool's threads.
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of running and queued calls."""
+        return self._pending
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Lazily created ThreadPoolExecutor (created inside the worker process, after fork)."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix=self._thread_name_prefix,
+            )
+        return self._executor
+
+    async def run(self, func: typing.Callable[..., T], /, *args: typing.Any, **kwargs: typing.Any) -> T:  # noqa: ANN401
+        """Run function in the pool and await its result.
+
+        Args:
+            func (Callable[..., T]): Blocking function.
+            *args: Positional arguments for function.
+            **kwargs: Keyword arguments for function.
+
+        Returns:
+            (T): Result of function.
+
+        Raises:
+            BackendError: In case of pool saturation (503).
+        """
+        with self._lock:
+            saturated = self._pending >= self._max_pending
+            self._pending += not saturated
+        if saturated:
+            logger.warning(msg=f"{self.__class__.__name__} | run | saturated: {self._pending} pending calls.")
+            raise BackendError(
+                status=JSENDStatus.ERROR,
+                message="Server is busy, try again later.",
+                code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        try:
+            future = self.executor.submit(func, *args, **kwargs)
+        except RuntimeError:  # The pool is shut down.
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _: concurrent.futures.Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shutdown the pool (if it was created)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
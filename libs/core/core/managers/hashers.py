@@ -0,0 +1,220 @@
+__all__ = (
+    "Argon2Hasher",
+    "BCryptHasher",
+    "BaseHasher",
+    "HashersRegistry",
+    "ScryptHasher",
+)
+
+import abc
+import base64
+import hashlib
+import hmac
+import secrets
+import typing
+from collections.abc import Iterable
+
+import argon2
+import bcrypt
+
+
+class BaseHasher(abc.ABC):
+    """Base class for password hashing algorithm with tunable cost."""
+
+    algorithm: typing.ClassVar[str]
+    prefixes: typing.ClassVar[tuple[str, ...]]
+
+    def identify(self, *, password_hash: str) -> bool:
+        """Check that password hash produced by this algorithm (by prefix of hash)."""
+        return password_hash.startswith(self.prefixes)
+
+    @abc.abstractmethod
+    def hash(self, *, password: str) -> str:
+        """Hash raw password value."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def verify(self, *, password: str, password_hash: str) -> bool:
+        """Check raw password against password hash."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        """Check that password hash produced with outdated (weaker than current) parameters, see `_is_weaker`."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _is_weaker(*, params: dict[str, int], current: dict[str, int]) -> bool:
+        """Check that any of hash parameters is lower than current one (stronger ones aren't downgraded)."""
+        return any(params[name] < value for name, value in current.items())
+
+
+class BCryptHasher(BaseHasher):
+    """BCrypt, hash format: `$2b$<rounds>$<salt+hash>`."""
+
+    algorithm = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, *, rounds: int = 12) -> None:
+        self.rounds = rounds
+
+    def hash(self, *, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password=password.encode(encoding="utf-8"), salt=salt).decode(encoding="utf-8")
+
+    def verify(self, *, password: str, password_hash: str) -> bool:
+        try:
+            return bcrypt.checkpw(
+                password=password.encode(encoding="utf-8"),
+                hashed_password=password_hash.encode(encoding="utf-8"),
+            )
+        except ValueError:
+            return False
+
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        return self._is_weaker(params={"rounds": int(password_hash.split("$")[2])}, current={"rounds": self.rounds})
+
+
+class Argon2Hasher(BaseHasher):
+    """Argon2id, hash format: `$argon2id$v=19$m=<memory KiB>,t=<time>,p=<parallelism>$<salt>$<hash>`."""
+
+    algorithm = "argon2id"
+    prefixes = ("$argon2id$", "$argon2i$", "$argon2d$")
+
+    def __init__(self, *, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4) -> None:
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
+
+    def hash(self, *, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, *, password: str, password_hash: str) -> bool:
+        try:
+            return self._hasher.verify(password_hash, password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        params = argon2.extract_parameters(password_hash)
+        if params.type is not self._hasher.type:
+            return True
+        return self._is_weaker(
+            params={
+                "version": params.version,
+                "time_cost": params.time_cost,
+                "memory_cost": params.memory_cost,
+                "parallelism": params.parallelism,
+                "hash_len": params.hash_len,
+                "salt_len": params.salt_len,
+            },
+            current={
+                "version": argon2.low_level.ARGON2_VERSION,
+                "time_cost": self._hasher.time_cost,
+                "memory_cost": self._hasher.memory_cost,
+                "parallelism": self._hasher.parallelism,
+                "hash_len": self._hasher.hash_len,
+                "salt_len": self._hasher.salt_len,
+            },
+        )
+
+
+class ScryptHasher(BaseHasher):
+    """Scrypt (hashlib), hash format: `$scrypt$ln=<log2 N>,r=<block size>,p=<parallelism>$<salt>$<hash>`."""
+
+    algorithm = "scrypt"
+    prefixes = ("$scrypt$",)
+
+    def __init__(self, *, ln: int = 15, r: int = 8, p: int = 1, salt_size: int = 16, hash_size: int = 32) -> None:
+        self.ln = ln
+        self.r = r
+        self.p = p
+        self.salt_size = salt_size
+        self.hash_size = hash_size
+
+    @staticmethod
+    def _b64encode(value: bytes) -> str:
+        return base64.b64encode(value).decode(encoding="ascii").rstrip("=")
+
+    @staticmethod
+    def _b64decode(value: str) -> bytes:
+        return base64.b64decode(value + "=" * (-len(value) % 4))
+
+    @staticmethod
+    def _derive(*, password: str, salt: bytes, ln: int, r: int, p: int, size: int) -> bytes:
+        n = 2**ln
+        return hashlib.scrypt(
+            password.encode(encoding="utf-8"),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r * p,  # 2x of required memory (128 * N * r * p)
+            dklen=size,
+        )
+
+    def _parse(self, *, password_hash: str) -> tuple[dict[str, int], bytes, bytes]:
+        _, _, params, salt, value = password_hash.split("$")
+        parsed = {key: int(val) for key, val in (param.split("=") for param in params.split(","))}
+        return parsed, self._b64decode(salt), self._b64decode(value)
+
+    def hash(self, *, password: str) -> str:
+        salt = secrets.token_bytes(nbytes=self.salt_size)
+        value = self._derive(password=password, salt=salt, ln=self.ln, r=self.r, p=self.p, size=self.hash_size)
+        return f"$scrypt$ln={self.ln},r={self.r},p={self.p}${self._b64encode(salt)}${self._b64encode(value)}"
+
+    def verify(self, *, password: str, password_hash: str) -> bool:
+        try:
+            params, salt, expected = self._parse(password_hash=password_hash)
+            value = self._derive(password=password, salt=salt, size=len(expected), **params)
+        except (ValueError, KeyError, TypeError):
+            return False
+        return hmac.compare_digest(value, expected)
+
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        params, _, value = self._parse(password_hash=password_hash)
+        return self._is_weaker(
+            params={**params, "size": len(value)},
+            current={"ln": self.ln, "r": self.r, "p": self.p, "size": self.hash_size},
+        )
+
+
+class HashersRegistry:
+    """Registry of hashers, detects algorithm of stored hash and tells when it should be rehashed.
+
+    Examples:
+        >>> registry = HashersRegistry(hashers=[Argon2Hasher(), BCryptHasher()], default="argon2id")
+        >>> registry.identify(password_hash="$2b$12$...").algorithm
+        'bcrypt'
+    """
+
+    def __init__(self, *, hashers: Iterable[BaseHasher], default: str) -> None:
+        self._hashers: dict[str, BaseHasher] = {hasher.algorithm: hasher for hasher in hashers}
+        if default not in self._hashers:
+            msg = f"Default hasher '{default}' is not registered."
+            raise ValueError(msg)
+        self._default = self._hashers[default]
+
+    @property
+    def default(self) -> BaseHasher:
+        """Hasher that used for new hashes."""
+        return self._default
+
+    def get(self, *, algorithm: str) -> BaseHasher:
+        """Get hasher by algorithm name."""
+        return self._hashers[algorithm]
+
+    def identify(self, *, password_hash: str) -> BaseHasher | None:
+        """Detect hasher from stored password hash prefix."""
+        for hasher in self._hashers.values():
+            if hasher.identify(password_hash=password_hash):
+                return hasher
+        return None
+
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        """Hash should be replaced if produced by non default algorithm or with weaker parameters."""
+        hasher = self.identify(password_hash=password_hash)
+        return hasher is not self._default or hasher.needs_rehash(password_hash=password_hash)
@@ -1,13 +1,49 @@
 import secrets
 
-import bcrypt
+from core.managers.executors import BoundedExecutor
+from core.managers.hashers import Argon2Hasher, BCryptHasher, HashersRegistry, ScryptHasher
+from core.managers.settings import managers_settings
+
+passwords_executor = BoundedExecutor(
+    max_workers=managers_settings.PASSWORDS_EXECUTOR_MAX_WORKERS,
+    max_queue=managers_settings.PASSWORDS_EXECUTOR_MAX_QUEUE,
+    thread_name_prefix="passwords",
+)
+hashers_registry = HashersRegistry(
+    hashers=[
+        BCryptHasher(rounds=managers_settings.PASSWORDS_BCRYPT_ROUNDS),
+        Argon2Hasher(
+            time_cost=managers_settings.PASSWORDS_ARGON2_TIME_COST,
+            memory_cost=managers_settings.PASSWORDS_ARGON2_MEMORY_COST,
+            parallelism=managers_settings.PASSWORDS_ARGON2_PARALLELISM,
+        ),
+        ScryptHasher(
+            ln=managers_settings.PASSWORDS_SCRYPT_LN,
+            r=managers_settings.PASSWORDS_SCRYPT_R,
+            p=managers_settings.PASSWORDS_SCRYPT_P,
+        ),
+    ],
+    default=managers_settings.PASSWORDS_HASHER,
+)
 
 
 class PasswordsManager:
-    """Manager that working with passwords."""
+    """Manager that working with passwords.
 
-    @staticmethod
-    def make_password(*, password: str) -> str:
+    New hashes produced by default hasher of registry, existing ones verified by algorithm detected from hash prefix.
+    Hashing is intentionally slow, so inside async code use `*_async` variants, that run on the bounded executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        executor: BoundedExecutor = passwords_executor,
+        registry: HashersRegistry = hashers_registry,
+    ) -> None:
+        self._executor = executor
+        self._registry = registry
+
+    def make_password(self, *, password: str) -> str:
         """Hashing string password value and returns password hash.
 
         Args:
@@ -19,12 +55,11 @@ class PasswordsManager:
         Examples:
             >>> pm = PasswordsManager()
             >>> pm.make_password(password="SuperSecurePassword")
-            '$2b$12$z9Vb9dw7jz/X9RrU4fLAMuFzzYv1e5Y5T/EvQmdA6gruZ3DUUEJR2'
+            '$argon2id$v=19$m=65536,t=3,p=4$JLEW2ZCEszTw2nnsAfBpVw$cy8TPHq/1lNmMqZhnJGkMlJsWixMi+UD3qQUYypZXrc'
         """
-        return bcrypt.hashpw(password=password.encode(encoding="utf-8"), salt=bcrypt.gensalt()).decode(encoding="utf-8")
+        return self._registry.default.hash(password=password)
 
-    @staticmethod
-    def check_password(*, password: str, password_hash: str) -> bool:
+    def check_password(self, *, password: str, password_hash: str) -> bool:
         """Check password and password hash then returns boolean result.
 
         Args:
@@ -43,9 +78,52 @@ class PasswordsManager:
             >>> pm.check_password(password="NotSecurePassword", password_hash=password_hash)
             False
         """
-        return bcrypt.checkpw(
-            password=password.encode(encoding="utf-8"), hashed_password=password_hash.encode(encoding="utf-8")
-        )
+        hasher = self._registry.identify(password_hash=password_hash)
+        return hasher is not None and hasher.verify(password=password, password_hash=password_hash)
+
+    def needs_rehash(self, *, password_hash: str) -> bool:
+        """Check that password hash made by non default algorithm or with outdated cost parameters."""
+        return self._registry.needs_rehash(password_hash=password_hash)
+
+    def verify_and_update(self, *, password: str, password_hash: str) -> tuple[bool, str | None]:
+        """Check password and produce the new hash in case if stored one is outdated.
+
+        Args:
+            password (str): Raw password to check.
+            password_hash (str): Stored password hash.
+
+        Returns:
+            - (tuple[bool, str | None]): Result of check and the new password hash (None if rehash is not needed).
+        """
+        if not self.check_password(password=password, password_hash=password_hash):
+            return False, None
+        if self.needs_rehash(password_hash=password_hash):
+            return True, self.make_password(password=password)
+        return True, None
+
+    async def make_password_async(self, *, password: str) -> str:
+        """Async variant of `make_password`, executed in bounded executor.
+
+        Raises:
+            BackendError: In case of executor saturation (503).
+        """
+        return await self._executor.run(self.make_password, password=password)
+
+    async def check_password_async(self, *, password: str, password_hash: str) -> bool:
+        """Async variant of `check_password`, executed in bounded executor.
+
+        Raises:
+            BackendError: In case of executor saturation (503).
+        """
+        return await self._executor.run(self.check_password, password=password, password_hash=password_hash)
+
+    async def verify_and_update_async(self, *, password: str, password_hash: str) -> tuple[bool, str | None]:
+        """Async variant of `verify_and_update`, executed in bounded executor (as a single job).
+
+        Raises:
+            BackendError: In case of executor saturation (503).
+        """
+        return await self._executor.run(self.verify_and_update, password=password, password_hash=password_hash)
 
     @staticmethod
     def generate_password(*, length: int = 8) -> str:
@@ -1,4 +1,5 @@
 import functools
+import typing
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +18,17 @@ class ManagersSettings(BaseSettings):
     TOKENS_ISSUER: str = Field(default="FastAPI Quickstart")
     TOKENS_SECRET_KEY: str = Field(default="TEST")
 
+    PASSWORDS_EXECUTOR_MAX_WORKERS: int = Field(default=4)
+    PASSWORDS_EXECUTOR_MAX_QUEUE: int = Field(default=32)
+    PASSWORDS_HASHER: typing.Literal["argon2id", "bcrypt", "scrypt"] = Field(default="argon2id")
+    PASSWORDS_BCRYPT_ROUNDS: int = Field(default=12)
+    PASSWORDS_ARGON2_TIME_COST: int = Field(default=3)
+    PASSWORDS_ARGON2_MEMORY_COST: int = Field(default=65536)  # KiB
+    PASSWORDS_ARGON2_PARALLELISM: int = Field(default=4)
+    PASSWORDS_SCRYPT_LN: int = Field(default=15)  # N = 2 ** LN
+    PASSWORDS_SCRYPT_R: int = Field(default=8)
+    PASSWORDS_SCRYPT_P: int = Field(default=1)
+
 
 @functools.lru_cache
 def get_managers_settings() -> ManagersSettings:
@@ -0,0 +1,105 @@
+"""Streaming responses for large result sets."""
+
+__all__ = (
+    "JSONArrayStreamingResponse",
+    "NDJSONStreamingResponse",
+    "iter_json_array",
+    "iter_ndjson",
+)
+
+import typing
+from collections.abc import AsyncIterable, AsyncIterator
+
+from starlette.responses import StreamingResponse
+
+from core.annotations import ModelInstance, SchemaType
+
+
+async def _iter_batches(
+    objects: AsyncIterable[ModelInstance],
+    schema: SchemaType,
+    chunk_size: int,
+) -> AsyncIterator[list[bytes]]:
+    batch: list[bytes] = []
+    async for obj in objects:
+        batch.append(schema.model_validate(obj, from_attributes=True).model_dump_json(by_alias=True).encode())
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def iter_ndjson(
+    objects: AsyncIterable[ModelInstance],
+    schema: SchemaType,
+    *,
+    chunk_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """Serializes objects through `schema` into NDJSON, flushing every `chunk_size` rows.
+
+    Args:
+        objects: async iterable of objects, e.g. `BaseRepository.stream_many`.
+        schema: response schema used to serialize each object.
+        chunk_size: number of rows sent in one chunk.
+
+    Yields:
+        bytes: chunk with up to `chunk_size` newline-terminated JSON documents.
+    """
+    async for batch in _iter_batches(objects=objects, schema=schema, chunk_size=chunk_size):
+        yield b"\n".join(batch) + b"\n"
+
+
+async def iter_json_array(
+    objects: AsyncIterable[ModelInstance],
+    schema: SchemaType,
+    *,
+    chunk_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """Serializes objects through `schema` into one JSON array, flushing every `chunk_size` rows.
+
+    Args:
+        objects: async iterable of objects, e.g. `BaseRepository.stream_many`.
+        schema: response schema used to serialize each object.
+        chunk_size: number of rows sent in one chunk.
+
+    Yields:
+        bytes: part of the JSON array.
+    """
+    separator = b"["
+    async for batch in _iter_batches(objects=objects, schema=schema, chunk_size=chunk_size):
+        yield separator + b",".join(batch)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """Chunked response with newline-delimited JSON documents."""
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        objects: AsyncIterable[ModelInstance],
+        schema: SchemaType,
+        *,
+        chunk_size: int = 100,
+        **kwargs: typing.Any,  # noqa: ANN401
+    ) -> None:
+        super().__init__(content=iter_ndjson(objects=objects, schema=schema, chunk_size=chunk_size), **kwargs)
+
+
+class JSONArrayStreamingResponse(StreamingResponse):
+    """Chunked response with one JSON array, built row by row."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        objects: AsyncIterable[ModelInstance],
+        schema: SchemaType,
+        *,
+        chunk_size: int = 100,
+        **kwargs: typing.Any,  # noqa: ANN401
+    ) -> None:
+        super().__init__(content=iter_json_array(objects=objects, schema=schema, chunk_size=chunk_size), **kwargs)
@@ -4,7 +4,7 @@ from fastapi import status as http_status
 from pydantic import BaseModel, ConfigDict, Field
 
 from core.annotations import ModelInstance, ResultObject, SchemaInstance, StrOrNone
-from core.enums import JSENDStatus
+from core.enums import CountStrategy, JSENDStatus
 from core.schemas.requests import BaseRequestSchema
 
 
@@ -107,18 +107,31 @@ class PaginationResponseSchema(BaseModel, Generic[ResultObject]):
     objects: list[ResultObject]
     offset: int | None = Field(default=None, description="Number of objects to skip.")
     limit: int = Field(default=100, description="Number of objects returned per one page.")
-    total_count: int = Field(
-        default=...,
+    total_count: int | None = Field(
+        default=None,
         alias="totalCount",
-        description="Numbed of objects counted inside db for this query.",
+        description="Numbed of objects counted inside db for this query (`null` if it wasn't counted).",
+    )
+    total_count_strategy: CountStrategy = Field(
+        default=CountStrategy.EXACT,
+        alias="totalCountStrategy",
+        title="Total Count Strategy",
+        description="Strategy used for `totalCount`: `exact`, `cached` (may be stale up to TTL), `estimated` "
+        "(planner estimate) or `first_page` (counted only on the first page).",
     )
     next_token: StrOrNone = Field(
         default=None,
         alias="nextToken",
         title="Next Token",
-        description="This is the latest `id` of previous result.",
+        description="Cursor of the latest object, to request the next page (`null` on the last page).",
+    )
+    prev_token: StrOrNone = Field(
+        default=None,
+        alias="prevToken",
+        title="Previous Token",
+        description="Cursor of the first object, to request the previous page (`null` on the first page).",
     )
-    page: int | None = Field(default=None, title="Page", description="Current page (depends on offset, limit).")
+    page: int | None = Field(default=None, title="Page", description="Requested page (when seeking by `page`).")
     pages: int | None = Field(
         default=None,
         title="Pages",
@@ -0,0 +1,185 @@
+__all__ = (
+    "PrincipalsCache",
+    "principals_cache",
+)
+
+import asyncio
+import functools
+
+from core.annotations import StrOrUUID
+from core.caches.memory import TTLCache
+from core.caches.near import NearCache, near_cache
+from core.custom_logging import get_logger
+from core.db.bases import redis_engine
+from core.db.hooks import after_commit
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import redis.asyncio as aioredis
+import redis.exceptions
+from domain.authorization.settings import authorization_settings
+from domain.users.schemas import UserPrincipal
+
+logger = get_logger(name=__name__)
+
+
+class PrincipalsCache:
+    """Two-tier cache of authenticated users (UserPrincipal), keyed by user's id and token's id.
+
+    1) In-process TTL + LRU cache, checked first and never leaves the worker.
+    2) Optional Redis tier (hash per user, field per token), shared between workers. Its reads are served from
+    worker's memory, if its keys are in `near` cache.
+
+    Invalidation removes user (or all users) from both tiers and publishes message to Redis channel, so other workers
+    evict their in-process copies as well (see `listen`).
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: aioredis.Redis,
+        near: NearCache | None = None,
+        enabled: bool = True,
+        maxsize: int = 10_000,
+        ttl: float = 30.0,
+        use_redis: bool = False,
+        redis_ttl: int = 300,
+        channel: str = "authorization:principals:invalidate",
+        key_prefix: str = "authorization:principals",
+    ) -> None:
+        self._redis = redis_client
+        self._near = near
+        self._enabled = enabled
+        self._local: TTLCache[tuple[str, str], UserPrincipal] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._use_redis = use_redis
+        self._redis_ttl = redis_ttl
+        self._channel = channel
+        self._key_prefix = key_prefix
+        self._all = "*"
+
+    def key(self, *, user_id: StrOrUUID) -> str:
+        """Construct Redis key for user's hash of principals."""
+        return f"{self._key_prefix}:{user_id}"
+
+    async def get(self, *, user_id: StrOrUUID, token_id: str | None) -> UserPrincipal | None:
+        """Retrieve principal from in-process cache, then from Redis tier (if enabled).
+
+        Keyword Args:
+            user_id (StrOrUUID): User's id from token payload.
+            token_id (str | None): Token's id from token payload.
+
+        Returns:
+            (UserPrincipal | None): Cached snapshot of User or None in case of miss.
+        """
+        if not self._enabled:
+            return None
+        local_key = (str(user_id), token_id or "")
+        if (principal := self._local.get(key=local_key)) is not None:
+            return principal
+        if not self._use_redis:
+            return None
+        try:
+            name, key = self.key(user_id=user_id), token_id or ""
+            raw = await (self._near.hget(name=name, key=key) if self._near else self._redis.hget(name=name, key=key))
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | get | {error}")
+            return None
+        if raw is None:
+            return None
+        principal = UserPrincipal.model_validate_json(raw)
+        self._local.set(key=local_key, value=principal)
+        return principal
+
+    async def set(self, *, principal: UserPrincipal) -> None:
+        """Store principal in both tiers.
+
+        Keyword Args:
+            principal (UserPrincipal): Snapshot of User.
+        """
+        if not self._enabled:
+            return
+        self._local.set(key=(str(principal.id), principal.token_id or ""), value=principal)
+        if not self._use_redis:
+            return
+        key = self.key(user_id=principal.id)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(name=key, key=principal.token_id or "", value=principal.model_dump_json())
+                pipe.expire(name=key, time=self._redis_ttl)
+                await pipe.execute()
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | set | {error}")
+
+    async def invalidate_user(self, *, user_id: StrOrUUID) -> None:
+        """Remove all cached principals of User (e.g. on User's update).
+
+        Keyword Args:
+            user_id (StrOrUUID): User's id.
+        """
+        self._evict(user_id=str(user_id))
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                if self._use_redis:
+                    pipe.delete(self.key(user_id=user_id))
+                pipe.publish(channel=self._channel, message=str(user_id))
+                await pipe.execute()
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | invalidate_user | {error}")
+
+    def invalidate_after_commit(self, *, session: AsyncSession, user_id: StrOrUUID | None = None) -> None:
+        """Remove cached principals of User (or all principals) after the session is committed.
+
+        Keyword Args:
+            session (AsyncSession): Session, that changes User (or Groups, Roles, Permissions).
+            user_id (StrOrUUID | None): User's id, None to remove all principals.
+        """
+        if user_id is None:
+            after_commit(session=session, callback=self.invalidate_all)
+        else:
+            after_commit(session=session, callback=functools.partial(self.invalidate_user, user_id=user_id))
+
+    async def invalidate_all(self) -> None:
+        """Remove all cached principals (e.g. on Group, Role or Permission changes)."""
+        self._evict(user_id=self._all)
+        try:
+            if self._use_redis:
+                keys = [key async for key in self._redis.scan_iter(match=f"{self._key_prefix}:*", count=1000)]
+                if keys:
+                    await self._redis.delete(*keys)
+            await self._redis.publish(channel=self._channel, message=self._all)
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | invalidate_all | {error}")
+
+    async def listen(self) -> None:
+        """Subscribe to invalidation channel and evict in-process entries (run as background task per worker)."""
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        data = message["data"]
+                        self._evict(user_id=data.decode() if isinstance(data, bytes) else str(data))
+            except asyncio.CancelledError:
+                raise
+            except redis.exceptions.RedisError as error:
+                logger.warning(msg=f"{self.__class__.__name__} | listen | {error}")
+                # Messages could be lost while disconnected, so drop everything cached locally.
+                self._local.clear()
+                await asyncio.sleep(1)
+
+    def _evict(self, *, user_id: str) -> None:
+        if user_id == self._all:
+            self._local.clear()
+        else:
+            self._local.delete_where(predicate=lambda key: key[0] == user_id)
+
+
+principals_cache = PrincipalsCache(
+    redis_client=redis_engine,
+    near=near_cache,
+    enabled=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_ENABLED,
+    maxsize=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_MAXSIZE,
+    ttl=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_TTL_SECONDS,
+    use_redis=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_USE_REDIS,
+    redis_ttl=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_REDIS_TTL_SECONDS,
+    channel=authorization_settings.AUTHORIZATION_PRINCIPALS_CACHE_CHANNEL,
+)
@@ -0,0 +1,192 @@
+__all__ = (
+    "PolicyEnforcer",
+    "policy_enforcer",
+)
+
+import asyncio
+import pathlib
+import typing
+import uuid
+
+import casbin
+import casbin_async_sqlalchemy_adapter
+import orjson
+from casbin.model.policy_op import PolicyOp
+from core.caches.memory import TTLCache
+from core.custom_logging import get_logger
+from core.db.bases import redis_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import redis.asyncio as aioredis
+import redis.exceptions
+from domain.authorization.settings import authorization_settings
+from domain.authorization.tables import CasbinRule
+
+logger = get_logger(name=__name__)
+
+MODEL_PATH = pathlib.Path(__file__).resolve().parent / "model.conf"
+
+
+class PolicyEnforcer:
+    """Casbin enforcer shared by all requests of the worker.
+
+    1) Built once (`setup` in lifespan) from `casbin_rule` table and `model.conf`, then enforces in memory.
+    2) Decisions for (subject, object, action) kept in bounded LRU, that is dropped on every policy change.
+    3) Policy changes made through this class persisted by adapter and published to Redis channel, other workers
+       apply them incrementally to in-memory model (see `listen`), without reloading the whole policy.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: aioredis.Redis,
+        model_path: pathlib.Path = MODEL_PATH,
+        decisions_maxsize: int = 10_000,
+        channel: str = "authorization:policies:updates",
+    ) -> None:
+        self._redis = redis_client
+        self._model_path = model_path
+        self._decisions: TTLCache[tuple[str, str, str], bool] = TTLCache(maxsize=decisions_maxsize, ttl=None)
+        self._channel = channel
+        self._worker_id = uuid.uuid4().hex
+        self._enforcer: casbin.AsyncEnforcer | None = None
+
+    @property
+    def enforcer(self) -> casbin.AsyncEnforcer:
+        """Casbin AsyncEnforcer instance."""
+        if self._enforcer is None:
+            msg = f"{self.__class__.__name__} is not set up, call `await setup(engine=...)` on startup."
+            raise RuntimeError(msg)
+        return self._enforcer
+
+    async def setup(self, *, engine: AsyncEngine) -> None:
+        """Create adapter and enforcer, load policy from DB.
+
+        Keyword Args:
+            engine (AsyncEngine): SQLAlchemy AsyncEngine instance.
+        """
+        adapter = casbin_async_sqlalchemy_adapter.Adapter(engine=engine, db_class=CasbinRule)
+        enforcer = casbin.AsyncEnforcer(model=f"{self._model_path}", adapter=adapter)
+        await enforcer.load_policy()
+        self._enforcer = enforcer
+        self._decisions.clear()
+        logger.debug(msg=f"{self.__class__.__name__} | setup | policy loaded.")
+
+    def enforce(self, subject: str, obj: str, action: str) -> bool:
+        """Decide whether subject can perform action on object (LRU cached).
+
+        Denies everything while enforcer is not set up (e.g. policy wasn't loaded on startup), so clients get 403
+        instead of 500.
+
+        Args:
+            subject (str): Subject (e.g. user's identity).
+            obj (str): Object (e.g. URL path).
+            action (str): Action (e.g. HTTP method).
+
+        Returns:
+            (bool): True if allowed.
+        """
+        if self._enforcer is None:
+            logger.error(msg=f"{self.__class__.__name__} | enforce | not set up, access denied.")
+            return False
+        key = (subject, obj, action)
+        decision = self._decisions.get(key=key)
+        if decision is None:
+            decision = self.enforcer.enforce(subject, obj, action)
+            self._decisions.set(key=key, value=decision)
+        return decision
+
+    async def add_policy(self, *, rule: list[str], ptype: str = "p") -> bool:
+        """Add policy ("p", "p2") or grouping policy ("g", "g2") rule, persist it and notify other workers.
+
+        Keyword Args:
+            rule (list[str]): Rule values (e.g. ["Admins", "/data/{id}/*", "*"]).
+            ptype (str): Policy type from model.conf.
+
+        Returns:
+            (bool): True if rule was added.
+        """
+        if ptype.startswith("g"):
+            changed = await self.enforcer.add_named_grouping_policy(ptype, rule)
+        else:
+            changed = await self.enforcer.add_named_policy(ptype, rule)
+        if changed:
+            self._decisions.clear()
+            await self._publish(op=PolicyOp.Policy_add, ptype=ptype, rule=rule)
+        return changed
+
+    async def remove_policy(self, *, rule: list[str], ptype: str = "p") -> bool:
+        """Remove policy ("p", "p2") or grouping policy ("g", "g2") rule, persist it and notify other workers.
+
+        Keyword Args:
+            rule (list[str]): Rule values.
+            ptype (str): Policy type from model.conf.
+
+        Returns:
+            (bool): True if rule was removed.
+        """
+        if ptype.startswith("g"):
+            changed = await self.enforcer.remove_named_grouping_policy(ptype, rule)
+        else:
+            changed = await self.enforcer.remove_named_policy(ptype, rule)
+        if changed:
+            self._decisions.clear()
+            await self._publish(op=PolicyOp.Policy_remove, ptype=ptype, rule=rule)
+        return changed
+
+    def apply(self, *, op: PolicyOp, ptype: str, rule: list[str]) -> bool:
+        """Apply policy change to in-memory model only (incremental update, without adapter and reload).
+
+        Keyword Args:
+            op (PolicyOp): Add or remove operation.
+            ptype (str): Policy type from model.conf.
+            rule (list[str]): Rule values.
+
+        Returns:
+            (bool): True if model was changed.
+        """
+        sec = ptype[0]
+        model = self.enforcer.model
+        if op == PolicyOp.Policy_add:
+            changed = model.add_policy(sec, ptype, rule)
+        else:
+            changed = model.remove_policy(sec, ptype, rule)
+        if changed and sec == "g":
+            model.build_incremental_role_links(self.enforcer.rm_map[ptype], op, sec, ptype, [rule])
+        self._decisions.clear()
+        return changed
+
+    async def listen(self) -> None:
+        """Subscribe to policy updates channel and apply changes from other workers (run as background task)."""
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        data: dict[str, typing.Any] = orjson.loads(message["data"])
+                        if data["worker"] == self._worker_id or self._enforcer is None:
+                            continue
+                        self.apply(op=PolicyOp(data["op"]), ptype=data["ptype"], rule=data["rule"])
+            except asyncio.CancelledError:
+                raise
+            except redis.exceptions.RedisError as error:
+                logger.warning(msg=f"{self.__class__.__name__} | listen | {error}")
+                await asyncio.sleep(1)
+                # Updates could be lost while disconnected, so the only case for the full reload.
+                if self._enforcer is not None:
+                    await self._enforcer.load_policy()
+                    self._decisions.clear()
+
+    async def _publish(self, *, op: PolicyOp, ptype: str, rule: list[str]) -> None:
+        message = orjson.dumps({"worker": self._worker_id, "op": op.value, "ptype": ptype, "rule": rule})
+        try:
+            await self._redis.publish(channel=self._channel, message=message)
+        except redis.exceptions.RedisError as error:
+            logger.warning(msg=f"{self.__class__.__name__} | publish | {error}")
+
+
+policy_enforcer = PolicyEnforcer(
+    redis_client=redis_engine,
+    decisions_maxsize=authorization_settings.AUTHORIZATION_POLICY_DECISIONS_MAXSIZE,
+    channel=authorization_settings.AUTHORIZATION_POLICY_CHANNEL,
+)
@@ -11,6 +11,7 @@ from fastapi import Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
 
+from domain.authorization.caches import principals_cache
 from domain.authorization.schemas import GroupCreateToDBSchema, RoleCreateToDBSchema
 from domain.authorization.schemas.requests import GroupCreateRequest, GroupUpdateRequest, RoleCreateRequest
 from domain.authorization.schemas.responses import GroupResponse, PermissionResponse, RoleResponse
@@ -93,12 +94,14 @@ class GroupsHandler:
         for k, v in values.items():
             setattr(group, k, v)
         await session.flush()
+        principals_cache.invalidate_after_commit(session=session)
         return group
 
     async def delete_group(self, *, request: Request, session: AsyncSession, id: StrOrUUID, safe: bool = False) -> None:
         result: CursorResult = await groups_service.delete_by_id(session=session, id=id)
         if not result.rowcount and not safe:
             raise BackendError(message="Group not found.", code=status.HTTP_404_NOT_FOUND)
+        principals_cache.invalidate_after_commit(session=session)
 
 
 class RolesHandler:
@@ -151,6 +154,7 @@ class RolesHandler:
         result: CursorResult = await roles_service.delete_by_id(session=session, id=id)
         if not result.rowcount and not safe:
             raise BackendError(message="Role not found.", code=status.HTTP_404_NOT_FOUND)
+        principals_cache.invalidate_after_commit(session=session)
 
 
 class PermissionsHandler:
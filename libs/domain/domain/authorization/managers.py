@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.authorization.enums import PermissionActions
 from domain.authorization.tables import Group, Permission, Role
+from domain.users.schemas import UserPrincipal
 from domain.users.tables import User
 
 logger = get_logger(name=__name__)
@@ -159,15 +160,17 @@ class AuthorizationManager:
         )
         return result_set
 
-    def get_permissions_set_from_user(self, *, user: User) -> set[tuple[str, str]]:
+    def get_permissions_set_from_user(self, *, user: User | UserPrincipal) -> set[tuple[str, str]]:
         """Grab all users groups, roles and permissions then produce result set of permissions.
 
         Keyword Args:
-            user (User): User instance
+            user (User | UserPrincipal): User instance or its cached snapshot (with already flattened permissions).
 
         Returns:
             set[tuple[str, str]]: set of permissions (e.g. {("user", "read"), ("user", "update")}
         """
+        if isinstance(user, UserPrincipal):
+            return set(user.permissions)
         return self.get_permissions_set(groups=user.groups, roles=user.roles, permissions=user.permissions)
 
     @staticmethod
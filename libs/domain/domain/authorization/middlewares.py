@@ -1,10 +1,11 @@
-from core.db.bases import async_session_factory
+from core.db.bases import async_read_session_factory
 from core.exceptions import BackendError
 from fastapi import status
 from starlette.authentication import AuthCredentials, AuthenticationBackend, AuthenticationError, BaseUser
 from starlette.requests import HTTPConnection
 
-from domain.users.schemas import UserTokenPayloadSchema
+from domain.authorization.caches import principals_cache
+from domain.users.schemas import UserPrincipal, UserTokenPayloadSchema
 from domain.users.services import users_service
 
 
@@ -50,7 +51,7 @@ class JWTTokenBackend(AuthenticationBackend):
         1) Read `Authorization` header.
         2) Parse check schema and parse JWT code.
         3) Validate JWT code and retrieve user's `id` from it.
-        4) Try to get user from DB (should be active).
+        4) Try to get user from principals cache, otherwise from DB (should be active) and cache it.
         5) Provide `request.auth` and `request.user` to HTTPConnection (Request).
 
         Args:
@@ -59,7 +60,7 @@ class JWTTokenBackend(AuthenticationBackend):
         Returns:
             - (None): In case `Authorization` header is missing.
             - (tuple[AuthCredentials, None]): In case of user not found or user not active.
-            - (tuple[AuthCredentials, User]): In case of user found and active.
+            - (tuple[AuthCredentials, UserPrincipal]): In case of user found and active.
 
         Raises:
             AuthenticationError: In case invalid JWT token value.
@@ -75,11 +76,20 @@ class JWTTokenBackend(AuthenticationBackend):
                 code=token,
                 response_schema=UserTokenPayloadSchema,
             )
-            async with async_session_factory() as session:
-                user = await users_service.get_with_grp(session=session, id=payload_schema.id)
-
+            user = await principals_cache.get(user_id=payload_schema.id, token_id=payload_schema.token_id)
             if user is None:
-                return AuthCredentials(), None
+                async with async_read_session_factory() as session:
+                    db_user = await users_service.get_with_grp(session=session, id=payload_schema.id)
+
+                if db_user is None:
+                    return AuthCredentials(), None
+
+                user = UserPrincipal.from_user(
+                    user=db_user,
+                    permissions=conn.app.state.authorization_manager.get_permissions_set_from_user(user=db_user),
+                    token_id=payload_schema.token_id,
+                )
+                await principals_cache.set(principal=user)
         except BackendError as error:
             raise AuthenticationError(error.message) from error
 
@@ -0,0 +1,91 @@
+__all__ = (
+    "PermissionsRegistry",
+    "permissions_registry",
+)
+
+from collections.abc import Iterable
+
+from core.custom_logging import get_logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.authorization.tables import Permission
+
+logger = get_logger(name=__name__)
+
+
+class PermissionsRegistry:
+    """Interned registry of permissions, where every (object_name, action) pair owns a bit index.
+
+    Indexes are assigned once and never change during worker's lifetime, so masks compiled earlier (e.g. by
+    HasPermissions at import time) remain valid after `load`. Masks are local to the worker and must not be shared.
+
+    Examples:
+        >>> registry = PermissionsRegistry()
+        >>> registry.mask(permissions=[("user", "read"), ("user", "update")])
+        3
+        >>> registry.permissions(mask=2)
+        {('user', 'update')}
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[tuple[str, str], int] = {}
+        self._permissions: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        """Number of interned permissions."""
+        return len(self._permissions)
+
+    def bit(self, *, permission: tuple[str, str]) -> int:
+        """Get (or assign) bit of permission.
+
+        Keyword Args:
+            permission (tuple[str, str]): Permission as a tuple (object_name, action).
+
+        Returns:
+            (int): Integer with the single bit set.
+        """
+        index = self._indexes.get(permission)
+        if index is None:
+            index = self._indexes[permission] = len(self._permissions)
+            self._permissions.append(permission)
+        return 1 << index
+
+    def mask(self, *, permissions: Iterable[tuple[str, str]]) -> int:
+        """Compile permissions to the bitmask.
+
+        Keyword Args:
+            permissions (Iterable[tuple[str, str]]): Permissions as tuples (object_name, action).
+
+        Returns:
+            (int): Bitmask of permissions.
+        """
+        result = 0
+        for permission in permissions:
+            result |= self.bit(permission=permission)
+        return result
+
+    def permissions(self, *, mask: int) -> set[tuple[str, str]]:
+        """Decode bitmask back to the set of permissions."""
+        return {permission for index, permission in enumerate(self._permissions) if mask >> index & 1}
+
+    async def load(self, *, session: AsyncSession) -> int:
+        """Intern all permissions from `permission` table.
+
+        Keyword Args:
+            session (AsyncSession): SQLAlchemy AsyncSession instance.
+
+        Returns:
+            (int): Number of interned permissions.
+        """
+        statement = select(Permission.object_name, Permission.action).order_by(
+            Permission.object_name,
+            Permission.action,
+        )
+        result = await session.execute(statement=statement)
+        self.mask(permissions=(tuple(row) for row in result.all()))
+        logger.debug(msg=f"{self.__class__.__name__} | load | interned permissions: {len(self)}")
+        return len(self)
+
+
+permissions_registry = PermissionsRegistry()
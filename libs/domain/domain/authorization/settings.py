@@ -0,0 +1,31 @@
+import functools
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AuthorizationSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        extra="ignore",
+        env_file_encoding="utf-8",
+        env_prefix="",
+        env_nested_delimiter="__",
+    )
+
+    AUTHORIZATION_PRINCIPALS_CACHE_ENABLED: bool = Field(default=True)
+    AUTHORIZATION_PRINCIPALS_CACHE_MAXSIZE: int = Field(default=10_000)
+    AUTHORIZATION_PRINCIPALS_CACHE_TTL_SECONDS: float = Field(default=30.0)
+    AUTHORIZATION_PRINCIPALS_CACHE_USE_REDIS: bool = Field(default=False)
+    AUTHORIZATION_PRINCIPALS_CACHE_REDIS_TTL_SECONDS: int = Field(default=300)
+    AUTHORIZATION_PRINCIPALS_CACHE_CHANNEL: str = Field(default="authorization:principals:invalidate")
+    AUTHORIZATION_POLICY_DECISIONS_MAXSIZE: int = Field(default=10_000)
+    AUTHORIZATION_POLICY_CHANNEL: str = Field(default="authorization:policies:updates")
+
+
+@functools.lru_cache
+def get_authorization_settings() -> AuthorizationSettings:
+    """Default getter with cache for AuthorizationSettings."""
+    return AuthorizationSettings()
+
+
+authorization_settings: AuthorizationSettings = get_authorization_settings()
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from core.db.bases import CASCADES, Base
 from core.db.mixins import CreatedAtMixin, CreatedUpdatedMixin, UUIDMixin
+from core.db.search import trigram_index
 from sqlalchemy import BIGINT, VARCHAR, Column, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -36,6 +37,8 @@ class CasbinRule(Base):
 class Group(Base, CreatedUpdatedMixin, UUIDMixin):
     """Group class and `group` table declaration."""
 
+    __table_args__ = (trigram_index("group", "title"),)
+
     title: Mapped[str] = mapped_column(VARCHAR(length=255), nullable=False, unique=True, index=True)
 
     roles: Mapped[list["Role"]] = relationship(
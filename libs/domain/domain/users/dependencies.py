@@ -0,0 +1,43 @@
+__all__ = (
+    "users_filtration",
+    "users_pagination",
+    "users_projection",
+    "users_searching",
+    "users_sorting",
+)
+from core.dependencies.body.filtration import F, Filtration
+from core.dependencies.body.pagination import Pagination
+from core.dependencies.body.projection import Projection
+from core.dependencies.body.searching import Searching
+from core.dependencies.body.sorting import Sorting
+from core.enums import FOps
+
+from domain.users.enums import UserStatuses
+from domain.users.schemas.responses import UserResponseSchema
+from domain.users.tables import User
+
+users_sorting = Sorting(
+    model=User,
+    schema=UserResponseSchema,
+    available_columns=[User.id, User.email, User.first_name, User.last_name, User.created_at, User.updated_at],
+    verify_index=True,
+)
+users_pagination = Pagination(model=User, schema=UserResponseSchema)
+users_filtration = Filtration(
+    model=User,
+    schema=UserResponseSchema,
+    filters=[
+        F(
+            query_field_name="status",
+            possible_operations=[FOps.EQ, FOps.NE, FOps.IN],
+            value_type=list[UserStatuses] | UserStatuses,
+        ),
+        F(query_field_name="email", possible_operations=[FOps.EQ, FOps.ILIKE, FOps.STARTSWITH], value_type=str),
+    ],
+)
+users_projection = Projection(model=User, schema=UserResponseSchema)
+users_searching = Searching(
+    model=User,
+    schema=UserResponseSchema,
+    available_columns=[User.first_name, User.last_name, User.email],
+)
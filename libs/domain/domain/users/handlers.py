@@ -5,13 +5,20 @@ import uuid
 from typing import TYPE_CHECKING
 
 from core.annotations import StrOrUUID
+from core.dependencies.body.filtration import Filtration
+from core.dependencies.body.pagination import Pagination
+from core.dependencies.body.projection import Projection
+from core.dependencies.body.searching import Searching
+from core.dependencies.body.sorting import Sorting
 from core.enums import TokenAudience
 from core.exceptions import BackendError
 from core.helpers import utc_now
 from core.managers.passwords import PasswordsManager
+from core.schemas.responses import PaginationResponseSchema
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.authorization.caches import principals_cache
 from domain.users.enums import UserStatuses
 from domain.users.schemas import UserCreateToDBSchema, UserToDBBaseSchema, UserTokenPayloadSchema
 from domain.users.schemas.requests import LoginSchema, TokenRefreshSchema, UserCreateSchema, UserUpdateSchema
@@ -36,11 +43,32 @@ class UsersHandler:
     ) -> UserResponseSchema:
         create_to_db = UserCreateToDBSchema(
             **data.model_dump(by_alias=True, exclude={"password"}),
-            password_hash=self.passwords_manager.make_password(password=data.password),
+            password_hash=await self.passwords_manager.make_password_async(password=data.password),
         )
         user: User = await users_service.create(session=session, obj=create_to_db)
         return UserResponseSchema.from_model(obj=user)
 
+    async def list_users(
+        self,
+        *,
+        request: Request,
+        session: AsyncSession,
+        sorting: Sorting,
+        pagination: Pagination,
+        filtration: Filtration,
+        projection: Projection,
+        searching: Searching,
+    ) -> PaginationResponseSchema[UserResponseSchema]:
+        total, count_strategy, users = await users_service.count_and_get_many(
+            session=session,
+            sorting=sorting,
+            pagination=pagination,
+            filtration=filtration,
+            projection=projection,
+            searching=searching,
+        )
+        return pagination.paginate(objects=users, total=total, count_strategy=count_strategy)
+
     async def update_user(
         self,
         *,
@@ -52,17 +80,20 @@ class UsersHandler:
         if not values:
             raise BackendError(message="Nothing to update.")
         if data.old_password:
-            if not self.passwords_manager.check_password(
+            # `request.user` is a cached snapshot without password hash, so the actual one retrieved from DB.
+            current_user: User = await users_service.get_one(session=session, id=request.user.id)
+            if not await self.passwords_manager.check_password_async(
                 password=data.old_password,
-                password_hash=request.user.password_hash,
+                password_hash=current_user.password_hash,
             ):
                 raise BackendError(message="Invalid credentials.")
             values = data.model_dump(exclude_unset=True, exclude={"old_password", "new_password"})
             values |= {
-                "password_hash": self.passwords_manager.make_password(password=data.new_password),
+                "password_hash": await self.passwords_manager.make_password_async(password=data.new_password),
                 "status": UserStatuses.CONFIRMED.value,
             }
         user = await users_service.update(session=session, id=request.user.id, obj=UserToDBBaseSchema(**values))
+        principals_cache.invalidate_after_commit(session=session, user_id=request.user.id)
         return UserResponseSchema.from_model(obj=user)
 
     @staticmethod
@@ -96,18 +127,27 @@ class UsersHandler:
             data (LoginSchema): user's credentials (email, password).
 
         Returns:
-            LoginOutSchema: a pair of tokens (access & refresh) - success flow.
+            LoginOutSchema: a pair of tokens (access & refresh) - success flow. Password hash is upgraded in place
+                if it was produced by an outdated algorithm or cost parameters.
 
         Raises:
             BackendException: In case of invalid credentials, invalid user's status, or inactive user.
         """
         user: User | None = await users_service.get_by_email(session=session, email=data.email)
-        if (
-            user
-            and users_handler.passwords_manager.check_password(password=data.password, password_hash=user.password_hash)
-            and user.status == UserStatuses.CONFIRMED.value
-        ):
-            return users_handler.generate_tokens(request=request, id=user.id)
+        if user and user.status == UserStatuses.CONFIRMED.value:
+            is_valid, new_password_hash = await self.passwords_manager.verify_and_update_async(
+                password=data.password,
+                password_hash=user.password_hash,
+            )
+            if is_valid:
+                if new_password_hash:
+                    # Outdated algorithm or cost, rehashed within the same transaction.
+                    await users_service.update_one(
+                        session=session,
+                        id=user.id,
+                        data={"password_hash": new_password_hash},
+                    )
+                return self.generate_tokens(request=request, id=user.id)
         raise BackendError(message="Invalid credentials.")
 
     async def refresh(self, *, request: Request, session: AsyncSession, data: TokenRefreshSchema) -> LoginOutSchema:
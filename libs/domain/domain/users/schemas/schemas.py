@@ -1,11 +1,21 @@
+import datetime
+import functools
+import typing
+
 from core.annotations import DatetimeOrNone, StrOrNone
 from core.custom_types import Email, StrUUID
 from core.managers.schemas import TokenPayloadSchema
 from core.schemas.requests import BaseRequestSchema
+from core.schemas.responses import BaseResponseSchema
 from pydantic import Field
+from starlette.authentication import BaseUser
 
+from domain.authorization.registries import permissions_registry
 from domain.users.enums import UserStatuses
 
+if typing.TYPE_CHECKING:
+    from domain.users.tables import User
+
 
 class UserToDBBaseSchema(BaseRequestSchema):
     id: StrUUID | None = None
@@ -25,3 +35,74 @@ class UserCreateToDBSchema(UserToDBBaseSchema):
 class UserTokenPayloadSchema(TokenPayloadSchema):
     id: StrUUID = Field(default=...)
     token_id: StrOrNone = Field(default=None)
+
+
+class UserPrincipal(BaseResponseSchema, BaseUser):
+    """Compact snapshot of authenticated User with flattened permissions set (`request.user`).
+
+    Cached between requests (in-process and in Redis) instead of SQLAlchemy User instance.
+    """
+
+    id: StrUUID
+    first_name: str = Field(default=..., alias="firstName")
+    last_name: str = Field(default=..., alias="lastName")
+    email: Email
+    status: UserStatuses = Field(default=UserStatuses.UNCONFIRMED)
+    created_at: datetime.datetime = Field(default=..., alias="createdAt")
+    updated_at: datetime.datetime = Field(default=..., alias="updatedAt")
+    token_id: StrOrNone = Field(default=None, alias="tokenId")
+    groups: tuple[str, ...] = Field(default=(), title="Titles of user's groups")
+    roles: tuple[str, ...] = Field(default=(), title="Titles of user's roles")
+    permissions: frozenset[tuple[str, str]] = Field(default=frozenset(), title="Flattened permissions set")
+
+    @classmethod
+    def from_user(
+        cls,
+        *,
+        user: "User",
+        permissions: typing.Iterable[tuple[str, str]],
+        token_id: str | None = None,
+    ) -> typing.Self:
+        """Construct snapshot from User instance (with loaded groups, roles and permissions).
+
+        Keyword Args:
+            user (User): User instance.
+            permissions (Iterable[tuple[str, str]]): Flattened permissions set of User.
+            token_id (str | None): ID of token pair that was used for authentication.
+
+        Returns:
+            (UserPrincipal): Snapshot of User.
+        """
+        return cls(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            status=user.status,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            token_id=token_id,
+            groups=tuple(group.title for group in user.groups),
+            roles=tuple(role.title for role in user.roles),
+            permissions=frozenset(permissions),
+        )
+
+    @functools.cached_property
+    def permissions_mask(self) -> int:
+        """Bitmask of permissions from worker's PermissionsRegistry (computed once per snapshot)."""
+        return permissions_registry.mask(permissions=self.permissions)
+
+    @property
+    def is_authenticated(self) -> bool:
+        """User is authenticated automatically."""
+        return True
+
+    @property
+    def display_name(self) -> str:
+        """Concatenate full name of user."""
+        return f"{self.first_name} {self.last_name}"
+
+    @property
+    def identity(self) -> str:
+        """Get user UUID and convert it to string."""
+        return str(self.id)
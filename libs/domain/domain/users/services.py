@@ -24,21 +24,26 @@ class UsersService(BaseRepository):
         async with session.begin_nested():
             statement = insert(self.model).values(**to_db_encoder(obj=obj)).returning(self.model)
             result: CursorResult = await session.execute(statement=statement)
+            self._mark_written(session=session)
             return result.scalar_one()
             # return await self.get_with_grp(session=session, id=result.inserted_primary_key[0])
 
     async def get_with_grp(self, *, session: AsyncSession, id: uuid.UUID) -> User | None:
-        statement = (
-            select(self.model)
-            .where(self.model.id == id)
-            .where(self.model.status.in_((UserStatuses.CONFIRMED, UserStatuses.FORCE_CHANGE_PASSWORD)))
-            .join(Group, isouter=True)
-            .join(Role, isouter=True)
-            .join(Permission, isouter=True)
-            .options(contains_eager(User.groups), contains_eager(User.roles), contains_eager(User.permissions))
-        )
-        result: ChunkedIteratorResult = await session.execute(statement=statement)
-        return result.unique().scalar_one_or_none()
+        async def read() -> User | None:
+            statement = (
+                select(self.model)
+                .where(self.model.id == id)
+                .where(self.model.status.in_((UserStatuses.CONFIRMED, UserStatuses.FORCE_CHANGE_PASSWORD)))
+                .join(Group, isouter=True)
+                .join(Role, isouter=True)
+                .join(Permission, isouter=True)
+                .options(contains_eager(User.groups), contains_eager(User.roles), contains_eager(User.permissions))
+            )
+            result: ChunkedIteratorResult = await session.execute(statement=statement)
+            return result.unique().scalar_one_or_none()
+
+        # Middleware loads the same user for each concurrent request of it (e.g. a hot service account).
+        return await self.coalesce(session=session, method="get_with_grp", args=str(id), func=read)
 
     async def get_by_email(self, *, session: AsyncSession, email: str) -> User | None:
         statement = select(self.model).where(self.model.email == email)
@@ -46,4 +51,4 @@ class UsersService(BaseRepository):
         return result.scalar_one_or_none()
 
 
-users_service = UsersService(model=User)
+users_service = UsersService(model=User, use_single_flight=True)
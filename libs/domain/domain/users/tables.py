@@ -1,6 +1,7 @@
 from core.db.bases import Base
 from core.db.mixins import CreatedUpdatedMixin, UUIDMixin
-from sqlalchemy import VARCHAR
+from core.db.search import search_vector_column, trigram_index
+from sqlalchemy import VARCHAR, Index
 from sqlalchemy.dialects.postgresql import JSONB, TEXT
 from sqlalchemy.orm import Mapped, mapped_column
 from starlette.authentication import BaseUser
@@ -22,8 +23,16 @@ class User(Base, UUIDMixin, CreatedUpdatedMixin, BaseUser):
         groups (list[Group]): Groups that are assigned to user.
         roles (list[Role]): Roles that assigned to user.
         permissions (list[Role]): Permissions that assigned to user.
+
+        search_vector (TSVECTOR): Generated vector for full-text search (not loaded with objects).
     """
 
+    __table_args__ = (
+        Index("ix_user_search_vector", "search_vector", postgresql_using="gin"),
+        trigram_index("user", "email"),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}  # noqa: RUF012
+
     first_name: Mapped[str] = mapped_column(VARCHAR(length=128), nullable=False)
     last_name: Mapped[str] = mapped_column(VARCHAR(length=128), nullable=False)
     email: Mapped[str] = mapped_column(VARCHAR(length=320), nullable=False, index=True, unique=True)
@@ -36,6 +45,7 @@ class User(Base, UUIDMixin, CreatedUpdatedMixin, BaseUser):
         doc="User's settings.",
         comment="TEST COMMENT.",
     )
+    search_vector = search_vector_column(weights={"first_name": "A", "last_name": "B", "email": "C"})
 
     def __repr__(self) -> str:
         """Representation of User."""
@@ -0,0 +1,27 @@
+"""Revision message: User search vector.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+
+from core.db.migrations import create_search_vector, drop_search_vector
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_search_vector(
+        table_name="user",
+        column_name="search_vector",
+        weights={"first_name": "A", "last_name": "B", "email": "C"},
+    )
+
+
+def downgrade() -> None:
+    drop_search_vector(table_name="user", column_name="search_vector")
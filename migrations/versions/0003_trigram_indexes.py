@@ -0,0 +1,23 @@
+"""Revision message: Trigram indexes.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+
+from core.db.migrations import create_trigram_index, drop_trigram_index
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_trigram_index(table_name="user", column_name="email")
+
+
+def downgrade() -> None:
+    drop_trigram_index(table_name="user", column_name="email")
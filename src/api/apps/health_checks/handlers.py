@@ -1,5 +1,7 @@
 __all__ = ("healthcheck",)
-from core.dependencies import AsyncSessionDependency, RedisDependency
+from core.db.bases import async_engine, redis_engine, replica_set
+from core.db.pools import pools_snapshot
+from core.dependencies import AsyncReadSessionDependency, RedisDependency
 from core.enums import JSENDStatus
 from fastapi import Request, status
 from fastapi.responses import ORJSONResponse
@@ -11,7 +13,7 @@ from src.settings import Settings
 async def healthcheck(
     request: Request,
     redis: RedisDependency,
-    async_session: AsyncSessionDependency,
+    async_session: AsyncReadSessionDependency,
 ) -> ORJSONResponse:
     """Check that API endpoints work properly.
 
@@ -23,6 +25,7 @@ async def healthcheck(
         data = {
             "redis": await redis.ping(),
             "postgresql_async": async_result.scalar_one(),
+            "postgresql_pools": pools_snapshot(engines=[async_engine, *replica_set.engines], redis_client=redis_engine),
         }
     else:
         data = None
@@ -1,15 +1,28 @@
 __all__ = (
+    "list_users",
     "registration",
     "whoami",
 )
 from typing import Annotated
 
-from core.dependencies import AsyncSessionDependency
-from core.schemas.responses import JSENDResponseSchema
+from core.dependencies import AsyncReadSessionDependency, AsyncSessionDependency
+from core.dependencies.body.filtration import Filtration
+from core.dependencies.body.pagination import Pagination
+from core.dependencies.body.projection import Projection
+from core.dependencies.body.searching import Searching
+from core.dependencies.body.sorting import Sorting
+from core.schemas.responses import JSENDResponseSchema, PaginationResponseSchema
+from domain.users.dependencies import (
+    users_filtration,
+    users_pagination,
+    users_projection,
+    users_searching,
+    users_sorting,
+)
 from domain.users.handlers import users_handler
 from domain.users.schemas.requests import UserCreateSchema
 from domain.users.schemas.responses import UserResponseSchema
-from fastapi import Body, Request, status
+from fastapi import Body, Depends, Request, status
 
 
 async def registration(
@@ -48,3 +61,27 @@ async def registration(
 async def whoami(request: Request) -> JSENDResponseSchema[UserResponseSchema]:
     """Gets information about user from authorization."""
     return JSENDResponseSchema[UserResponseSchema](data=request.user, message="User's data from authorization.")
+
+
+async def list_users(
+    request: Request,
+    session: AsyncReadSessionDependency,
+    sorting: Annotated[Sorting, Depends(users_sorting)],
+    pagination: Annotated[Pagination, Depends(users_pagination)],
+    filtration: Annotated[Filtration, Depends(users_filtration)],
+    projection: Annotated[Projection, Depends(users_projection)],
+    searching: Annotated[Searching, Depends(users_searching)],
+) -> JSENDResponseSchema[PaginationResponseSchema[UserResponseSchema]]:
+    """Lists users page by page."""
+    return JSENDResponseSchema[PaginationResponseSchema[UserResponseSchema]](
+        data=await users_handler.list_users(
+            request=request,
+            session=session,
+            sorting=sorting,
+            pagination=pagination,
+            filtration=filtration,
+            projection=projection,
+            searching=searching,
+        ),
+        message="Users.",
+    )
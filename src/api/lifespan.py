@@ -1,10 +1,20 @@
+import asyncio
 import contextlib
 import typing
 
+from core.caches.near import near_cache
 from core.custom_logging import get_logger, setup_logging
-from core.db.bases import async_engine, async_session_factory, redis_engine
+from core.db.bases import async_engine, async_session_factory, redis_engine, replica_set
+from core.db.pools import log_pools_metrics, pools_snapshot
+from core.db.settings import db_settings
+from core.dependencies.limiters import load_rate_limiters_scripts
+from core.managers.passwords import passwords_executor
+from domain.authorization.caches import principals_cache
+from domain.authorization.enforcers import policy_enforcer
+from domain.authorization.registries import permissions_registry
 from fastapi import FastAPI
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 
 import redis.exceptions
 
@@ -26,35 +36,101 @@ async def _check_async_engine() -> None:
     logger.success(f"Result of async 'SELECT current_timestamp;' is: {result.isoformat() if result else result}")
 
 
+async def _load_permissions_registry() -> None:
+    """Interns permissions from DB, so users' permission bitmasks use stable bits."""
+    logger.debug("Loading permissions registry...")
+    try:
+        async with async_session_factory() as async_session:
+            count = await permissions_registry.load(session=async_session)
+    except DBAPIError as e:
+        logger.error(e)
+    else:
+        logger.success(f"Permissions registry loaded: {count} permissions.")
+
+
+async def _setup_policy_enforcer() -> None:
+    """Builds worker's Casbin enforcer from `casbin_rule` table."""
+    logger.debug("Setting up policy enforcer...")
+    try:
+        await policy_enforcer.setup(engine=async_engine)
+    except DBAPIError as e:
+        logger.error(e)
+    else:
+        logger.success("Policy enforcer loaded.")
+
+
 async def _setup_redis(app: FastAPI) -> None:
-    """Initialize global connection to Redis."""
+    """Initialize global connection to Redis and warm up its pool."""
     logger.debug("Setting up global Redis `app.redis`...")
     # proxy Redis client to request.app.state.redis
     app.redis = redis_engine
     logger.debug("Checking connection with Redis...")
     try:
-        async with app.redis.client() as conn:
-            result = await conn.ping()
-            if result is not True:
-                msg = "Connection to Redis failed."
-                logger.error(msg)
-                raise RuntimeError(msg)
-            logger.success(f"Result of Redis 'PING' command: {result}")
+        # Concurrent PINGs open connections in the pool, so the first requests don't wait for them.
+        results = await asyncio.gather(
+            *(app.redis.ping() for _ in range(max(1, db_settings.REDIS_POOL_WARMUP_CONNECTIONS))),
+        )
+        if not all(result is True for result in results):
+            msg = "Connection to Redis failed."
+            logger.error(msg)
+            raise RuntimeError(msg)
+        logger.success(f"Result of Redis 'PING' command: {results[0]} ({len(results)} connections opened)")
     except redis.exceptions.ConnectionError as e:
         logger.error(e)
 
 
+async def _load_redis_scripts() -> None:
+    """Registers Lua scripts (rate limiters) in Redis, so requests use EVALSHA from the first call."""
+    logger.debug("Loading Lua scripts into Redis...")
+    try:
+        await load_rate_limiters_scripts(redis_client=redis_engine)
+    except redis.exceptions.ConnectionError as e:
+        logger.error(e)
+    else:
+        logger.success("Lua scripts loaded into Redis.")
+
+
+def _start_background_tasks(app: FastAPI) -> None:
+    """Starts worker's background tasks (e.g. cache invalidation listeners)."""
+    app.state.background_tasks = [
+        asyncio.create_task(coro=principals_cache.listen(), name="principals_cache_listener"),
+        asyncio.create_task(coro=policy_enforcer.listen(), name="policy_enforcer_listener"),
+        asyncio.create_task(coro=replica_set.monitor(), name="replicas_lag_monitor"),
+        asyncio.create_task(coro=near_cache.listen(), name="near_cache_listener"),
+        asyncio.create_task(
+            coro=log_pools_metrics(
+                engines=[async_engine, *replica_set.engines],
+                redis_client=redis_engine,
+                interval=db_settings.APP_RDMS_POOL_METRICS_INTERVAL_SECONDS,
+            ),
+            name="pools_metrics_logger",
+        ),
+    ]
+    logger.debug(f"Background tasks started: {[task.get_name() for task in app.state.background_tasks]}")
+
+
+async def _stop_background_tasks(app: FastAPI) -> None:
+    """Cancels worker's background tasks."""
+    for task in app.state.background_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.background_tasks, return_exceptions=True)
+    logger.debug("Background tasks stopped.")
+
+
 async def _dispose_all_connections() -> None:
     """Closes connections to PostgreSQL."""
     logger.debug("Closing PostgreSQL connections...")
+    snapshot = pools_snapshot(engines=[async_engine, *replica_set.engines], redis_client=redis_engine)
+    logger.info(f"Pools metrics | {snapshot}")
     await async_engine.dispose()  # Close sessions to async engine
+    await replica_set.dispose()
     logger.success("All PostgreSQL connections closed.")
 
 
 async def _close_redis(app: FastAPI) -> None:
     """Closes connection to a Redis client."""
     logger.debug("Closing Redis connection...")
-    await app.redis.close(close_connection_pool=True)
+    await app.redis.aclose(close_connection_pool=True)
     logger.success("Redis connection closed.")
 
 
@@ -64,6 +140,14 @@ async def lifespan(app: FastAPI) -> typing.AsyncGenerator[None, None]:
     enable_logging()
     logger.info("Lifespan started.")
     await _check_async_engine()
+    await _setup_redis(app=app)
+    await _load_permissions_registry()
+    await _setup_policy_enforcer()
+    await _load_redis_scripts()
+    _start_background_tasks(app=app)
     yield
+    await _stop_background_tasks(app=app)
+    passwords_executor.shutdown(wait=False)
     await _dispose_all_connections()
+    await _close_redis(app=app)
     logger.info("Lifespan ended.")
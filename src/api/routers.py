@@ -1,11 +1,13 @@
 __all__ = ("register_routers",)
+from core.caches.responses import response_cache
 from core.schemas.responses import JSENDResponseSchema
 from domain.authorization.dependencies import IsAuthenticated, bearer_auth
+from domain.users.tables import User
 from fastapi import APIRouter, Depends, FastAPI, status
 
 from src.api.apps.health_checks.handlers import healthcheck
 from src.api.apps.tokens.handlers import login, refresh
-from src.api.apps.users.handlers import registration, whoami
+from src.api.apps.users.handlers import list_users, registration, whoami
 from src.api.responses import Responses
 
 API_PREFIX = "/api/v1"
@@ -45,6 +47,16 @@ def _users_router() -> APIRouter:
         description="Get user's data from authorization.",
         status_code=status.HTTP_200_OK,
     )
+    router.add_api_route(
+        path="/list/",
+        endpoint=response_cache.cached(tags=[User.__tablename__])(list_users),
+        methods=["POST"],
+        name="list_users",
+        summary="List users",
+        description="List users with sorting, filtration, searching, projection and pagination (by `nextToken`, "
+        "`prevToken` or `page`).",
+        status_code=status.HTTP_200_OK,
+    )
     return router
 
 
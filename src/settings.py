@@ -1,10 +1,12 @@
 import functools
 import pathlib
 
+from core.caches.settings import CachesSettings
 from core.custom_logging.settings import LogSettings
 from core.db.settings import DBSettings
 from core.dependencies.settings import DependenciesSettings
 from core.managers.settings import ManagersSettings
+from domain.authorization.settings import AuthorizationSettings
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
@@ -14,7 +16,14 @@ PROJECT_ROOT_DIR = PROJECT_SRC_DIR.parent
 load_dotenv(dotenv_path=PROJECT_ROOT_DIR / ".env", override=True)
 
 
-class MainSettings(LogSettings, DBSettings, ManagersSettings, DependenciesSettings):
+class MainSettings(
+    LogSettings,
+    DBSettings,
+    ManagersSettings,
+    DependenciesSettings,
+    CachesSettings,
+    AuthorizationSettings,
+):
     """Main settings class definition."""
 
     model_config = SettingsConfigDict(
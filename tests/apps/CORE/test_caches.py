@@ -0,0 +1,327 @@
+import asyncio
+import datetime
+import types
+import uuid
+
+import pytest
+from core.caches.memory import TTLCache
+from core.caches.near import NearCache
+from core.caches.responses import CACHE_TAGS_INFO_KEY, ResponseCache, mark_written
+from core.caches.single_flight import SingleFlight
+from core.enums import CountStrategy
+from faker import Faker
+from fastapi import Request
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import redis.exceptions
+
+
+class TestTTLCache:
+    def test_set_get(self, faker: Faker) -> None:
+        cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+        key, value = faker.pystr(), faker.pystr()
+
+        cache.set(key=key, value=value)
+
+        assert cache.get(key=key) == value
+        assert key in cache
+        assert cache.get(key=faker.pystr()) is None
+
+    def test_lru_eviction(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=None)
+        cache.set(key="a", value=1)
+        cache.set(key="b", value=2)
+        cache.get(key="a")  # "b" becomes the least recently used
+
+        cache.set(key="c", value=3)
+
+        assert len(cache) == 2
+        assert cache.get(key="a") == 1
+        assert cache.get(key="b") is None
+        assert cache.get(key="c") == 3
+
+    def test_expiration(self, mocker: MockerFixture, faker: Faker) -> None:
+        monotonic_mock = mocker.patch("core.caches.memory.time.monotonic", return_value=100.0)
+        cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=5)
+        key = faker.pystr()
+        cache.set(key=key, value=faker.pystr())
+
+        monotonic_mock.return_value = 105.0
+
+        assert cache.get(key=key) is None
+        assert len(cache) == 0
+
+    def test_delete_where(self) -> None:
+        cache: TTLCache[tuple[str, str], int] = TTLCache(maxsize=10, ttl=60)
+        cache.set(key=("user_1", "token_1"), value=1)
+        cache.set(key=("user_1", "token_2"), value=2)
+        cache.set(key=("user_2", "token_3"), value=3)
+
+        result = cache.delete_where(predicate=lambda key: key[0] == "user_1")
+
+        assert result == 2
+        assert len(cache) == 1
+        assert cache.get(key=("user_2", "token_3")) == 3
+
+
+class TestSingleFlight:
+    async def test_coalesces_calls(self, faker: Faker) -> None:
+        flight: SingleFlight[str, str] = SingleFlight()
+        key, value = faker.pystr(), faker.pystr()
+        calls = 0
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(*(flight.do(key=key, func=compute) for _ in range(10)))
+
+        assert results == [value] * 10
+        assert calls == 1
+        assert key not in flight
+
+    async def test_propagates_error(self, faker: Faker) -> None:
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        async def compute() -> str:
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        key = faker.pystr()
+
+        results = await asyncio.gather(*(flight.do(key=key, func=compute) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    async def test_leader_cancelled(self, faker: Faker) -> None:
+        flight: SingleFlight[str, str] = SingleFlight()
+        key, value = faker.pystr(), faker.pystr()
+        calls = 0
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return value
+
+        leader = asyncio.create_task(flight.do(key=key, func=compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do(key=key, func=compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == [value] * 3
+        assert leader.cancelled()
+        assert calls == 2
+        assert key not in flight
+
+
+class TestResponseCache:
+    @staticmethod
+    def _cache(mocker: MockerFixture, cached: str | None = None) -> tuple[ResponseCache, types.SimpleNamespace]:
+        redis_client = types.SimpleNamespace(
+            get=mocker.AsyncMock(return_value=cached),
+            set=mocker.AsyncMock(return_value=True),
+            delete=mocker.AsyncMock(),
+        )
+        return ResponseCache(redis_client=redis_client, ttl=10, stale=10), redis_client
+
+    async def test_miss(self, mocker: MockerFixture, faker: Faker) -> None:
+        cache, redis_client = self._cache(mocker=mocker)
+        key, body = faker.pystr(), faker.json()
+
+        async def _compute() -> str:
+            await asyncio.sleep(0.01)
+            return body
+
+        compute = mocker.AsyncMock(side_effect=_compute)
+
+        results = await asyncio.gather(*(cache.get_or_compute(key=key, compute=compute) for _ in range(5)))
+
+        assert results == [(body, "MISS")] * 5
+        compute.assert_awaited_once()
+        assert redis_client.set.await_args_list[-1].kwargs["value"].endswith(f"\n{body}")
+
+    @pytest.mark.parametrize(("offset", "expected"), [(5, "HIT"), (-5, "MISS")])
+    async def test_hit_and_refresh(self, mocker: MockerFixture, faker: Faker, offset: int, expected: str) -> None:
+        mocker.patch("core.caches.responses.time.time", return_value=100.0)
+        body = faker.json()
+        cache, _ = self._cache(mocker=mocker, cached=f"{100.0 + offset}\n{body}")
+        compute = mocker.AsyncMock(return_value=body)
+
+        result = await cache.get_or_compute(key=faker.pystr(), compute=compute)
+
+        assert result == (body, expected)
+        assert compute.await_count == (expected == "MISS")
+
+    async def test_stale(self, mocker: MockerFixture, faker: Faker) -> None:
+        mocker.patch("core.caches.responses.time.time", return_value=100.0)
+        body = faker.json()
+        cache, redis_client = self._cache(mocker=mocker, cached=f"95.0\n{body}")
+        redis_client.set.return_value = None  # refresh lock is held by another request
+        compute = mocker.AsyncMock()
+
+        result = await cache.get_or_compute(key=faker.pystr(), compute=compute)
+
+        assert result == (body, "STALE")
+        compute.assert_not_awaited()
+
+    @staticmethod
+    def _request() -> types.SimpleNamespace:
+        return types.SimpleNamespace(
+            url=types.SimpleNamespace(path="/api/v1/users/"),
+            query_params=types.SimpleNamespace(multi_items=lambda: [("b", "2"), ("a", "1")]),
+        )
+
+    def test_key(self, mocker: MockerFixture) -> None:
+        cache = ResponseCache(redis_client=None)
+        request = self._request()
+        sorting = types.SimpleNamespace(shape=(("id", "desc"),))
+        pagination = types.SimpleNamespace(shape=(), params={"pagination_limit": 10})
+        session = mocker.MagicMock(spec=AsyncSession)
+        values = cache.canonical_values(kwargs={"pagination": pagination, "sorting": sorting, "session": session})
+
+        key = cache.key(request=request, scope="public", versions=[1, 2], values=values)
+
+        assert key.startswith("cache:responses:public:1.2:")
+        assert key == cache.key(
+            request=request,
+            scope="public",
+            versions=[1, 2],
+            values=cache.canonical_values(kwargs={"sorting": sorting, "pagination": pagination}),
+        )
+
+    def test_canonical_values(self) -> None:
+        first_page = types.SimpleNamespace(shape=(), params={"pagination_limit": 10}, page=None)
+        third_page = types.SimpleNamespace(shape=(), params={"pagination_limit": 10}, page=3)
+        created_at = datetime.datetime.now(tz=datetime.UTC)
+
+        values = ResponseCache.canonical_values(
+            kwargs={
+                "ids": [uuid.UUID(int=1)],
+                "since": created_at,
+                "strategy": CountStrategy.CACHED,
+                "tags": {"b", "a"},
+            },
+        )
+
+        assert values == [
+            ["ids", [uuid.UUID(int=1)]],
+            ["since", created_at],
+            ["strategy", "cached"],
+            ["tags", ["a", "b"]],
+        ]
+        assert ResponseCache.canonical_values(kwargs={"pagination": first_page}) != ResponseCache.canonical_values(
+            kwargs={"pagination": third_page},
+        )
+        with pytest.raises(TypeError):
+            ResponseCache.canonical_values(kwargs={"filters": {"value": object()}})
+
+    async def test_cached(self, mocker: MockerFixture) -> None:
+        class Public(BaseModel):
+            id: int
+
+        class Private(Public):
+            password_hash: str
+
+        redis_client = types.SimpleNamespace(
+            mget=mocker.AsyncMock(return_value=[None]),
+            get=mocker.AsyncMock(return_value=None),
+            set=mocker.AsyncMock(return_value=True),
+            delete=mocker.AsyncMock(),
+        )
+        cache = ResponseCache(redis_client=redis_client)
+        calls = []
+
+        @cache.cached(tags=["user"])
+        async def endpoint(request: Request, value: object) -> Public:
+            calls.append(value)
+            return Private(id=1, password_hash="secret")
+
+        request = Request(scope={"type": "http", "path": "/api/v1/users/", "query_string": b"", "headers": []})
+        response = await endpoint(request=request, value=1)
+        result = await endpoint(request=request, value=object())
+
+        assert response.body == b'{"id":1}'
+        assert isinstance(result, Private)  # not cached, as the argument can't be a part of the key
+        assert len(calls) == 2
+        assert redis_client.set.await_args.kwargs["value"].endswith('\n{"id":1}')
+
+    def test_mark_written(self) -> None:
+        session = types.SimpleNamespace(info={})
+
+        mark_written(session=session, tags=["user"])
+        mark_written(session=session, tags=["user", "group"])
+
+        assert session.info[CACHE_TAGS_INFO_KEY] == {"user", "group"}
+
+
+class TestNearCache:
+    @staticmethod
+    def _cache(mocker: MockerFixture) -> tuple[NearCache, types.SimpleNamespace]:
+        redis_client = types.SimpleNamespace(
+            get=mocker.AsyncMock(return_value="1"),
+            mget=mocker.AsyncMock(side_effect=lambda names: [f"v:{name}" for name in names]),
+        )
+        cache = NearCache(redis_client=redis_client, prefixes=["tags:"])
+        cache._tracking = True
+        return cache, redis_client
+
+    async def test_get(self, mocker: MockerFixture) -> None:
+        cache, redis_client = self._cache(mocker=mocker)
+
+        assert [await cache.get(name="tags:user") for _ in range(3)] == ["1"] * 3
+        await cache.get(name="other")
+        await cache.get(name="other")
+
+        assert redis_client.get.await_count == 3  # tracked key once, not tracked key each time
+
+        cache.invalidate(names=["tags:user"])
+        await cache.get(name="tags:user")
+
+        assert redis_client.get.await_count == 4
+
+    async def test_mget(self, mocker: MockerFixture) -> None:
+        cache, redis_client = self._cache(mocker=mocker)
+        await cache.mget(names=["tags:a"])
+
+        result = await cache.mget(names=["tags:a", "tags:b"])
+
+        assert result == ["v:tags:a", "v:tags:b"]
+        assert redis_client.mget.await_args.args == (["tags:b"],)
+
+    async def test_invalidation_during_read(self, mocker: MockerFixture) -> None:
+        cache, redis_client = self._cache(mocker=mocker)
+
+        async def _get(name: str) -> str:
+            cache.invalidate(names=[name])  # key changed while read is in flight
+            return "1"
+
+        redis_client.get.side_effect = _get
+        await cache.get(name="tags:user")
+        await cache.get(name="tags:user")
+
+        assert redis_client.get.await_count == 2
+
+    async def test_consume(self, mocker: MockerFixture) -> None:
+        cache, _ = self._cache(mocker=mocker)
+        cache._local.set(key="tags:user", value={None: "1"})
+        connection = mocker.AsyncMock()
+        connection.read_response.side_effect = [
+            None,
+            [b"pong", b""],
+            [b"message", b"__redis__:invalidate", [b"tags:user"]],
+            None,
+            None,
+        ]
+
+        with pytest.raises(redis.exceptions.TimeoutError):
+            await cache._consume(connection=connection)
+
+        assert "tags:user" not in cache._local
+        assert connection.send_command.await_count == 2  # PINGs
@@ -1,5 +1,32 @@
+import asyncio
+import types
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
 from core.db.bases import BaseTableModelMixin
+from core.db.hooks import AFTER_COMMIT_INFO_KEY, after_commit, run_after_commit
+from core.db.pools import InstrumentedAsyncQueuePool, InstrumentedRedis, InstrumentedRedisPool
+from core.db.repositories import BaseRepository, ExtendedRepository
+from core.db.routing import READ_ONLY_INFO_KEY, ReplicaSet, RoutingSession
+from core.db.settings import db_settings
+from core.db.statements import Explain
+from core.dependencies.body.sorting import Sorting
+from core.enums import CountStrategy, ReplicaBalancing
+from core.exceptions import BackendError
+from domain.users.enums import UserStatuses
+from domain.users.schemas.responses import UserResponseSchema
+from domain.users.tables import User
 from faker import Faker
+from pytest_mock import MockerFixture
+from sqlalchemy import column, create_engine, insert, select, table, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+import redis.asyncio as aioredis
+import redis.exceptions
 
 
 class TestTableNameMixin:
@@ -10,3 +37,309 @@ class TestTableNameMixin:
         result = my_class.__tablename__
 
         assert result == f"{first_part.lower()}_{second_part.lower()}"
+
+
+class TestExplain:
+    def test_compile(self, faker: Faker) -> None:
+        email = faker.email()
+        user_table = table("user", column("id"), column("email"))
+        statement = select(user_table.c.id).where(user_table.c.email == email)
+
+        compiled = Explain(statement=statement).compile(dialect=postgresql.dialect())
+
+        assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert list(compiled.params.values()) == [email]
+
+
+class TestRepositoryCount:
+    async def test_first_page_strategy(self) -> None:
+        repository = BaseRepository(model=BaseTableModelMixin, count_strategy=CountStrategy.FIRST_PAGE)
+
+        result = await repository.count(session=None, filtration=[], is_first_page=False)
+
+        assert result == (None, CountStrategy.FIRST_PAGE)
+
+    async def test_estimated_fallback(self, mocker: MockerFixture) -> None:
+        repository = BaseRepository(model=User, count_strategy=CountStrategy.ESTIMATED)
+        result = mocker.MagicMock(**{"scalar_one_or_none.return_value": -1, "scalar_one.return_value": 7})
+        session = mocker.MagicMock(execute=mocker.AsyncMock(return_value=result))
+
+        assert await repository.count(session=session, filtration=[]) == (7, CountStrategy.EXACT)
+        reltuples_statement = session.execute.await_args_list[0].kwargs["statement"]
+        assert str(reltuples_statement.compile(dialect=postgresql.dialect())).startswith(
+            "SELECT CAST(pg_catalog.pg_class.reltuples AS BIGINT) AS reltuples",
+        )
+
+
+class TestRepositoryPageBoundaries:
+    async def test_build_boundaries_statement(self) -> None:
+        repository = BaseRepository(model=User)
+        sorting = await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.email])(
+            request=types.SimpleNamespace(state=types.SimpleNamespace()),
+            sorting=["email"],
+        )
+
+        statement = repository._build_boundaries_statement(sorting=sorting, filtration=[], searching=[])
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "row_number() OVER (ORDER BY" in compiled
+        assert "anon_1.row_number %% %(pagination_limit)s" in compiled
+        assert "LIMIT %(pagination_max_pages)s" in compiled
+
+    async def test_beyond_max_pages(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(db_settings, "APP_RDMS_PAGINATION_MAX_PAGES", 2)
+        boundaries = mocker.patch.object(BaseRepository, "_get_page_boundaries", return_value=["first", "second"])
+        repository = BaseRepository(model=User)
+
+        async def seek_page(page: int) -> str | None:
+            pagination = types.SimpleNamespace(page=page)
+            return await repository.seek_page(
+                session=None, sorting=None, pagination=pagination, filtration=None, searching=None
+            )
+
+        assert await seek_page(page=3) == "second"
+        with pytest.raises(BackendError):
+            await seek_page(page=4)
+        assert boundaries.await_count == 1
+
+
+class TestRepositoryCoalesce:
+    @staticmethod
+    def _session(mocker: MockerFixture, bind: str = "primary", **info: object) -> MagicMock:
+        session = mocker.MagicMock(info={READ_ONLY_INFO_KEY: True, **info}, new=(), dirty=())
+        session.get_bind.return_value = bind
+        session.__contains__.return_value = False
+        session.merge = mocker.AsyncMock(side_effect=lambda obj, load: obj)
+        return session
+
+    async def test_coalesce(self, mocker: MockerFixture) -> None:
+        repository = BaseRepository(model=User, use_single_flight=True)
+        sessions = [self._session(mocker=mocker) for _ in range(3)]
+
+        async def read() -> str:
+            await asyncio.sleep(0.01)
+            return "user"
+
+        func = mocker.AsyncMock(side_effect=read)
+
+        result = await asyncio.gather(
+            *(repository.coalesce(session=session, method="get", args="id", func=func) for session in sessions),
+        )
+
+        assert result == ["user"] * 3
+        func.assert_awaited_once()
+        assert all(session.merge.await_count == 1 for session in sessions)
+
+    async def test_bypass(self, mocker: MockerFixture) -> None:
+        repository = BaseRepository(model=User, use_single_flight=True)
+        sessions = [self._session(mocker=mocker, cache_tags={"user"}), self._session(mocker=mocker)]
+        func = mocker.AsyncMock(return_value=None)
+
+        await asyncio.gather(
+            *(repository.coalesce(session=session, method="get", args="id", func=func) for session in sessions),
+        )
+        await BaseRepository(model=User).coalesce(session=sessions[1], method="get", args="id", func=func)
+
+        assert func.await_count == 3
+
+    async def test_bypass_by_bind(self, mocker: MockerFixture) -> None:
+        repository = BaseRepository(model=User, use_single_flight=True)
+        sessions = [
+            self._session(mocker=mocker, bind="replica"),
+            self._session(mocker=mocker, bind="primary"),
+            self._session(mocker=mocker, bind="primary", **{READ_ONLY_INFO_KEY: False}),
+        ]
+
+        async def read() -> None:
+            await asyncio.sleep(0.01)
+
+        func = mocker.AsyncMock(side_effect=read)
+
+        await asyncio.gather(
+            *(repository.coalesce(session=session, method="get", args="id", func=func) for session in sessions),
+        )
+
+        assert func.await_count == 3
+
+
+class TestAfterCommit:
+    async def test_run_after_commit(self, mocker: MockerFixture) -> None:
+        session = mocker.MagicMock(info={})
+        callbacks = [mocker.AsyncMock(), mocker.AsyncMock()]
+        for callback in callbacks:
+            after_commit(session=session, callback=callback)
+
+        assert all(callback.await_count == 0 for callback in callbacks)
+        await run_after_commit(session=session)
+        await run_after_commit(session=session)
+
+        assert all(callback.await_count == 1 for callback in callbacks)
+        assert AFTER_COMMIT_INFO_KEY not in session.info
+
+
+class TestReplicaRouting:
+    @staticmethod
+    def _replica(checkedout: int = 0) -> MagicMock:
+        replica = MagicMock()
+        replica.sync_engine.pool.checkedout.return_value = checkedout
+        return replica
+
+    def test_choose(self) -> None:
+        replicas = [self._replica(checkedout=2), self._replica(checkedout=1), self._replica()]
+        replica_set = ReplicaSet(engines=replicas, max_lag=5)
+        replica_set.lags.update(zip(replicas, [1.0, 0.0, 10.0], strict=True))
+
+        assert [replica_set.choose() for _ in range(3)] == [replicas[0], replicas[1], replicas[0]]
+
+        replica_set = ReplicaSet(engines=replicas, balancing=ReplicaBalancing.LEAST_CONNECTIONS)
+        assert replica_set.choose() is None  # lags are unknown
+        replica_set.lags.update(dict.fromkeys(replicas, 0.0))
+        assert replica_set.choose() is replicas[2]
+
+    def test_get_bind(self) -> None:
+        primary, replica = create_engine("sqlite://"), self._replica()
+        replica_set = ReplicaSet(engines=[replica])
+        replica_set.lags[replica] = 0.0
+        session_class = RoutingSession.with_replicas(replicas=replica_set)
+
+        assert session_class(bind=primary).get_bind(clause=select(User)) is primary
+
+        session = session_class(bind=primary, info={READ_ONLY_INFO_KEY: True})
+        assert session.get_bind(clause=select(User)) is replica.sync_engine
+        assert session.get_bind(clause=insert(User)) is primary
+        assert session.get_bind(clause=select(User)) is primary  # sticks to the primary after write
+
+        session = session_class(bind=primary, info={READ_ONLY_INFO_KEY: True})
+        statement = select(User).from_statement(insert(User).values(email="email").returning(User))
+        assert session.get_bind(clause=statement) is primary
+        assert session.has_writes is True
+
+        replica_set.lags[replica] = None
+        assert session_class(bind=primary, info={READ_ONLY_INFO_KEY: True}).get_bind(clause=select(User)) is primary
+
+    def test_has_writes(self) -> None:
+        session = RoutingSession(bind=create_engine("sqlite://"))
+        session.get_bind(clause=select(User))
+
+        assert session.has_writes is False
+
+        session.get_bind(clause=text("SELECT 1"))
+
+        assert session.has_writes is True
+
+    def test_get_bind_without_clause(self) -> None:
+        primary, replica = create_engine("sqlite://"), self._replica()
+        replica_set = ReplicaSet(engines=[replica])
+        replica_set.lags[replica] = 0.0
+        session = RoutingSession.with_replicas(replicas=replica_set)(bind=primary, info={READ_ONLY_INFO_KEY: True})
+
+        assert session.get_bind() is replica.sync_engine  # e.g. for the dialect, not a write
+        assert session.has_writes is False
+        session.connection()
+        assert session.has_writes is True
+        assert session.get_bind(clause=select(User)) is primary
+
+
+class TestInstrumentedPool:
+    def test_metrics(self, mocker: MockerFixture) -> None:
+        pool = InstrumentedAsyncQueuePool(creator=mocker.MagicMock(), pool_size=2, max_overflow=1)
+        mocker.patch.object(AsyncAdaptedQueuePool, "_do_get", side_effect=[mocker.MagicMock(), PoolTimeoutError()])
+
+        pool._do_get()
+        with pytest.raises(PoolTimeoutError):
+            pool._do_get()
+
+        snapshot = pool.recreate().snapshot()
+        assert snapshot["size"] == 2
+        assert (snapshot["checkouts"], snapshot["timeouts"]) == (1, 1)
+        assert snapshot["wait_seconds_max"] <= snapshot["wait_seconds_total"]
+
+
+class TestInstrumentedRedis:
+    async def test_metrics(self, mocker: MockerFixture) -> None:
+        pool = InstrumentedRedisPool(max_connections=1, timeout=0.01)
+        mocker.patch.object(pool, "ensure_connection")
+        mocker.patch.object(aioredis.Redis, "execute_command", return_value=True)
+
+        await InstrumentedRedis(connection_pool=pool).ping()
+        await pool.get_connection()
+        with pytest.raises(redis.exceptions.ConnectionError):
+            await pool.get_connection()
+
+        snapshot = pool.snapshot()
+        assert (snapshot["in_use"], snapshot["in_use_max"], snapshot["checkouts"], snapshot["timeouts"]) == (1, 1, 1, 1)
+        assert snapshot["commands"]["PING"]["count"] == 1
+
+
+class TestRepositoryBatched:
+    def test_batched(self) -> None:
+        repository = BaseRepository(model=BaseTableModelMixin)
+        repository.max_query_parameters = 5
+        data = [{"id": index, "name": str(index)} for index in range(5)] + [{"id": 5}]
+
+        result = list(repository.batched(data=data))
+
+        assert [len(batch) for batch in result] == [2, 2, 1, 1]
+        assert [row["id"] for batch in result for row in batch] == list(range(6))
+
+
+class TestRepositoryCopy:
+    def test_merge_statement(self) -> None:
+        repository = BaseRepository(model=User)
+        columns = repository._copy_columns(first_row={"email": "email", "first_name": "first_name"}, columns=None)
+
+        statement = repository._copy_merge_statement(
+            temporary_name="copy_rows",
+            columns=columns,
+            conflict_target=["email"],
+            update_fields=None,
+        )
+        compiled = statement.compile(dialect=postgresql.dialect())
+
+        assert columns == ["first_name", "email", "status", "settings", "id"]
+        assert compiled.params == {}  # Python-side defaults are copied per row, not bound once for all rows.
+        assert str(compiled).startswith('INSERT INTO "user" (first_name, email, status, settings, id) SELECT DISTINCT')
+        assert "ON CONFLICT (email) DO UPDATE SET first_name = excluded.first_name" in str(compiled)
+
+    def test_record_defaults(self) -> None:
+        repository = BaseRepository(model=User)
+        columns = repository._copy_columns(first_row={"email": "email"}, columns=["email", "settings"])
+        record = repository._copy_record(columns=columns, dialect=asyncpg.dialect())
+        user_id = uuid.uuid4()
+
+        first, second = record({"email": "first"}), record({"email": "second", "id": user_id, "settings": {"a": 1}})
+
+        assert columns == ["email", "settings", "status", "id"]
+        assert first[:3] == ("first", "{}", UserStatuses.UNCONFIRMED.value)
+        assert isinstance(first[3], uuid.UUID)
+        assert second == ("second", '{"a": 1}', UserStatuses.UNCONFIRMED.value, user_id)
+        assert record({"email": "third"})[3] not in (first[3], user_id)
+
+
+class TestExtendedRepositoryUpsert:
+    @pytest.mark.parametrize(
+        argnames=("update_fields", "expected"),
+        argvalues=[
+            (None, "ON CONFLICT (email) DO UPDATE SET first_name = excluded.first_name"),
+            (["last_name"], "ON CONFLICT (email) DO UPDATE SET last_name = excluded.last_name"),
+            ([], "ON CONFLICT (email) DO NOTHING"),
+        ],
+    )
+    async def test_create_or_update_many(
+        self,
+        mocker: MockerFixture,
+        update_fields: list[str] | None,
+        expected: str,
+    ) -> None:
+        session = mocker.MagicMock(info={}, execute=mocker.AsyncMock(return_value=mocker.MagicMock(rowcount=1)))
+
+        rowcount = await ExtendedRepository(model=User, use_flush=False).create_or_update_many(
+            session=session,
+            data=[{"email": "email", "first_name": "first_name"}],
+            conflict_target=["email"],
+            update_fields=update_fields,
+        )
+
+        statement = session.execute.await_args.kwargs["statement"]
+        assert rowcount == 1
+        assert expected in str(statement.compile(dialect=postgresql.dialect()))
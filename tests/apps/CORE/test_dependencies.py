@@ -0,0 +1,352 @@
+import datetime
+import math
+import types
+import uuid
+
+import pytest
+from core.db.statements import StatementCache
+from core.dependencies.body.cursors import decode_cursor, encode_cursor
+from core.dependencies.body.filtration import F, Filtration
+from core.dependencies.body.pagination import Pagination, PaginationRequestSchema
+from core.dependencies.body.projection import Projection, ProjectionMode, ProjectionRequest
+from core.dependencies.body.searching import Searching, SearchingMode, SearchingRequest
+from core.dependencies.body.sorting import Sorting
+from core.enums import CountStrategy, FOps
+from core.exceptions import BackendError
+from domain.users.enums import UserStatuses
+from domain.users.schemas.responses import UserResponseSchema
+from domain.users.tables import User
+from faker import Faker
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import result_tuple
+
+
+def _request() -> types.SimpleNamespace:
+    return types.SimpleNamespace(state=types.SimpleNamespace())
+
+
+class TestFiltrationShape:
+    async def test_shape_and_params(self, faker: Faker) -> None:
+        filtration = Filtration(
+            model=User,
+            schema=UserResponseSchema,
+            filters=[F(query_field_name="first_name", possible_operations=list(FOps), value_type=str | None)],
+        )
+        statements = []
+        for name in (faker.first_name(), faker.last_name()):
+            filters = [
+                {"f": "first_name", "o": "ilike", "v": name},
+                {"field": "first_name", "operation": "notnull", "value": None},
+            ]
+            result = await filtration(request=_request(), filtration=filters)
+            compiled = select(User.id).where(*result).compile(dialect=postgresql.dialect())
+
+            assert result.shape == (("first_name", FOps.ILIKE), ("first_name", FOps.NOT_NULL))
+            assert result.params == {"filtration_0": name}
+            assert compiled.params == {"filtration_0": name}
+            assert "IS NOT NULL" in str(compiled)
+            statements.append(str(compiled))
+
+        assert statements[0] == statements[1]
+
+    def test_parse_query_filters(self, faker: Faker) -> None:
+        filtration = Filtration(
+            model=User,
+            schema=UserResponseSchema,
+            filters=[F(query_field_name="first_name", possible_operations=list(FOps), value_type=str)],
+        )
+        name = faker.first_name()
+
+        result = filtration.parse_query_filters(
+            filters_list=[
+                {"f": "first_name", "o": "=", "v": name},
+                {"f": faker.pystr(), "o": "=", "v": name},
+            ],
+        )
+
+        assert [(f.field, f.operation, f.value) for f in result] == [("first_name", FOps.EQ, name)]
+        with pytest.raises(BackendError, match="Can't parse filter value of 'last_name'"):
+            filtration.parse_query_filters(filters_list=[{"f": "last_name", "v": name}])
+        with pytest.raises(BackendError, match="Can't parse filter value of 'first_name'"):
+            filtration.parse_query_filters(filters_list=[{"f": "first_name", "v": [name]}])
+        with pytest.raises(BackendError, match="Can't parse filter value of 'first_name'"):
+            filtration.parse_query_filters(filters_list=[{"f": "first_name", "o": "~", "v": name}])
+        with pytest.raises(BackendError, match="Can't parse filter value of 'None'"):
+            filtration.parse_query_filters(filters_list=[name])
+
+
+class TestSortingShape:
+    async def test_per_request(self) -> None:
+        sorting = Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.first_name])
+
+        first, second = await sorting(request=_request(), sorting=["first_name"]), await sorting(request=_request())
+
+        assert first is not sorting
+        assert first.shape == (("first_name", "asc"), ("id", "desc"))
+        assert second.shape == (("id", "desc"),)
+
+    async def test_shape(self) -> None:
+        sorting = Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.first_name])
+
+        result = await sorting(request=_request(), sorting=["first_name", "-unknown"])
+
+        assert result.shape == (("first_name", "asc"), ("id", "desc"))
+        assert result.raw_sorting == ["first_name", "id"]
+
+
+class TestSearching:
+    @pytest.mark.parametrize(
+        ("fields", "language", "expected"),
+        [
+            (["first_name", "last_name", "email"], "simple", '"user".search_vector @@ plainto_tsquery'),
+            (["first_name", "email"], "simple", """ts_filter("user".search_vector, '{A,C}'::"char"[]) @@"""),
+            (["first_name"], "english", "to_tsvector("),
+        ],
+    )
+    async def test_document(self, faker: Faker, fields: list[str], language: str, expected: str) -> None:
+        searching = Searching(
+            model=User,
+            schema=UserResponseSchema,
+            available_columns=[User.first_name, User.last_name, User.email],
+        )
+        text = faker.word()
+
+        result = await searching(
+            request=_request(),
+            searching=SearchingRequest(text=text, fields=fields, language=language, rank=True),
+        )
+        compiled = select(User.id).where(*result).order_by(result.rank).compile(dialect=postgresql.dialect())
+
+        assert expected in str(compiled)
+        assert "ts_rank(" in str(compiled)
+        assert result.params == {"searching_query": text, "searching_language": language}
+
+    async def test_trigram(self, faker: Faker) -> None:
+        searching = Searching(model=User, schema=UserResponseSchema, available_columns=[User.email])
+        text = faker.word()
+
+        result = await searching(
+            request=_request(),
+            searching=SearchingRequest(text=text, fields=["email"], mode=SearchingMode.TRIGRAM, threshold=0.5),
+        )
+        compiled = str(select(User.id).where(*result).compile(dialect=postgresql.dialect()))
+
+        assert '"user".email %% %(searching_text)s' in compiled
+        assert "similarity(" in compiled
+        assert result.rank is not None
+        assert result.params == {"searching_text": text, "searching_threshold": 0.5}
+
+    async def test_prefix(self) -> None:
+        searching = Searching(model=User, schema=UserResponseSchema, available_columns=[User.email])
+
+        result = await searching(
+            request=_request(),
+            searching=SearchingRequest(text="a_b%", fields=["email"], mode=SearchingMode.PREFIX),
+        )
+        compiled = str(select(User.id).where(*result).compile(dialect=postgresql.dialect()))
+
+        assert "ILIKE" in compiled
+        assert result.rank is None
+        assert result.params["searching_pattern"] == "a\\_b\\%%"
+
+
+class TestCursor:
+    def test_roundtrip(self, faker: Faker) -> None:
+        shape = (("created_at", "desc"), ("email", "asc"), ("id", "desc"))
+        values = [faker.date_time(tzinfo=datetime.UTC), faker.email(), uuid.uuid4()]
+
+        token = encode_cursor(values=values, shape=shape)
+
+        assert decode_cursor(token=token, shape=shape) == values
+
+    @pytest.mark.parametrize("shape", [(("id", "asc"),), (("email", "desc"), ("id", "desc"))])
+    def test_shape_mismatch(self, shape: tuple[tuple[str, str], ...]) -> None:
+        token = encode_cursor(values=[uuid.uuid4()], shape=(("id", "desc"),))
+
+        with pytest.raises(BackendError):
+            decode_cursor(token=token, shape=shape)
+
+    def test_tampered(self) -> None:
+        shape = (("id", "desc"),)
+        token = encode_cursor(values=[uuid.uuid4()], shape=shape)
+
+        with pytest.raises(BackendError):
+            decode_cursor(token=token[:-2] + ("AA" if token[-2:] != "AA" else "BB"), shape=shape)
+        with pytest.raises(BackendError):
+            decode_cursor(token=token, shape=shape, secret_key="ANOTHER")
+
+
+class TestPagination:
+    async def test_next_token(self, faker: Faker) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.email])(
+            request=request,
+            sorting=["email"],
+        )
+        dependency = Pagination(model=User, schema=UserResponseSchema)
+        first_page = await dependency(request=request, pagination=PaginationRequestSchema(limit=1))
+        latest = User(id=uuid.uuid4(), email=faker.email())
+
+        next_token = first_page.create_next_token(latest_object=latest, objects_count=1)
+        pagination = await dependency(
+            request=request, pagination=PaginationRequestSchema(next_token=next_token, limit=1)
+        )
+
+        assert first_page.shape == ()
+        assert pagination.shape == (("email", "asc"), ("id", "desc"))
+        assert pagination.params == {"pagination_0": latest.email, "pagination_1": latest.id, "pagination_limit": 1}
+        assert pagination.get_query(next_token=next_token) is not None
+
+    async def test_prev_token(self, faker: Faker) -> None:
+        request = _request()
+        sorting = await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.email])(
+            request=request,
+            sorting=["-email"],
+        )
+        dependency = Pagination(model=User, schema=UserResponseSchema)
+        pagination = await dependency(request=request, pagination=PaginationRequestSchema(limit=2))
+        first, latest = (
+            User(
+                id=uuid.uuid4(),
+                email=faker.email(),
+                first_name=faker.first_name(),
+                last_name=faker.last_name(),
+                status=UserStatuses.CONFIRMED,
+                created_at=faker.date_time(tzinfo=datetime.UTC),
+                updated_at=faker.date_time(tzinfo=datetime.UTC),
+            )
+            for _ in range(2)
+        )
+        total = 5
+        prev_token = pagination.create_token(obj=first)
+
+        pagination = await dependency(
+            request=request, pagination=PaginationRequestSchema(prev_token=prev_token, limit=2)
+        )
+        response = pagination.paginate(objects=[first, latest], total=total, count_strategy=CountStrategy.CACHED)
+
+        assert pagination.backward is True
+        assert pagination.shape == (("email", "asc"), ("id", "asc"))
+        assert [str(ordering) for ordering in sorting.reversed_query] == ['"user".email ASC', '"user".id ASC']
+        assert response.next_token == pagination.create_token(obj=latest)
+        assert response.prev_token == pagination.create_token(obj=first)
+        assert response.pages == math.ceil(total / pagination.limit)
+        assert response.total_count_strategy == CountStrategy.CACHED
+
+    async def test_seek(self, faker: Faker) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id])(request=request, sorting=None)
+        pagination = await Pagination(model=User, schema=UserResponseSchema)(
+            request=request,
+            pagination=PaginationRequestSchema(page=3, limit=1),
+        )
+        token = pagination.create_token(obj=User(id=uuid.uuid4()))
+
+        positioned = pagination.seek(token=token)
+
+        assert (pagination.next_token, pagination.shape) == (None, ())
+        assert (positioned.next_token, positioned.shape, positioned.page) == (token, (("id", "desc"),), 3)
+
+    async def test_paginate_rows(self, faker: Faker) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id])(request=request, sorting=None)
+        pagination = await Pagination(model=User, schema=UserResponseSchema)(
+            request=request,
+            pagination=PaginationRequestSchema(limit=1),
+        )
+        row = result_tuple(["id", "first_name"])((uuid.uuid4(), faker.first_name()))
+        first_name_alias = UserResponseSchema.model_fields["first_name"].alias or "first_name"
+
+        response = pagination.paginate_rows(rows=[row], total=None, count_strategy=CountStrategy.FIRST_PAGE)
+
+        assert response.objects == [{"id": row.id, first_name_alias: row.first_name}]
+        assert response.next_token == pagination.create_token(obj=row)
+
+    async def test_only_one_position(self, faker: Faker) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id])(request=request, sorting=None)
+
+        with pytest.raises(BackendError):
+            await Pagination(model=User, schema=UserResponseSchema)(
+                request=request,
+                pagination=PaginationRequestSchema(next_token=faker.pystr(), page=2),
+            )
+
+    @pytest.mark.parametrize(
+        ("sorting", "expected"),
+        [
+            (["-email"], '("user".email, "user".id) < (%(pagination_0)s'),
+            (["email"], '"user".email > %(pagination_0)s'),
+        ],
+    )
+    async def test_get_query(self, faker: Faker, sorting: list[str], expected: str) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.email])(
+            request=request,
+            sorting=sorting,
+        )
+        pagination = await Pagination(model=User, schema=UserResponseSchema)(
+            request=request,
+            pagination=PaginationRequestSchema(limit=1),
+        )
+        next_token = pagination.create_next_token(
+            latest_object=User(id=uuid.uuid4(), email=faker.email()), objects_count=1
+        )
+
+        query = pagination.get_query(next_token=next_token)
+
+        assert expected in str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestProjectionColumns:
+    @pytest.mark.parametrize(
+        ("projection", "expected"),
+        [
+            (ProjectionRequest(fields=["email"]), ["id", "email", "last_name"]),
+            (ProjectionRequest(fields="*", mode=ProjectionMode.EXCLUDE), ["id", "last_name"]),
+            (
+                ProjectionRequest(fields=["email", "lastName", "id"], mode=ProjectionMode.EXCLUDE),
+                ["first_name", "last_name", "password_hash", "status", "settings", "id", "created_at", "updated_at"],
+            ),
+        ],
+    )
+    async def test_columns(self, projection: ProjectionRequest, expected: list[str]) -> None:
+        request = _request()
+        await Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.last_name])(
+            request=request,
+            sorting=["last_name"],
+        )
+
+        result = await Projection(model=User, schema=UserResponseSchema)(request=request, projection=projection)
+
+        assert sorted(column.key for column in result.columns) == sorted(expected)
+
+
+class TestSortingIndex:
+    @pytest.mark.parametrize(
+        ("shape", "expected"),
+        [
+            ((("id", "desc"),), "pk_user"),
+            ((("email", "asc"), ("id", "desc")), "ix_user_email"),
+            ((("first_name", "asc"), ("id", "desc")), None),
+        ],
+    )
+    def test_find_index(self, shape: tuple[tuple[str, str], ...], expected: str | None) -> None:
+        sorting = Sorting(model=User, schema=UserResponseSchema, available_columns=[User.id, User.email])
+
+        index = sorting.find_index(shape=shape)
+
+        assert (index.name if index is not None else None) == expected
+
+
+class TestStatementCache:
+    def test_get_or_build(self, faker: Faker) -> None:
+        cache = StatementCache(maxsize=1)
+        first_key, second_key = faker.pystr(), faker.pystr()
+
+        first = cache.get_or_build(key=first_key, builder=object)
+        assert cache.get_or_build(key=first_key, builder=object) is first
+        assert cache.get_or_build(key=second_key, builder=object) is not first
+        assert cache.get_or_build(key=first_key, builder=object) is not first  # evicted by `maxsize`
+        assert cache.info() == {"hits": 1, "misses": 3, "size": 1, "maxsize": 1}
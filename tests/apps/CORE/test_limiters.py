@@ -0,0 +1,149 @@
+import datetime
+import hashlib
+import types
+
+import pendulum
+import pytest
+from core.dependencies.limiters import (
+    BaseRedisRateLimiter,
+    FixedWindowRateLimiter,
+    Rate,
+    SlidingWindowRateLimiter,
+    TokenBucketRateLimiter,
+    load_rate_limiters_scripts,
+)
+from core.enums import RatePeriod
+from core.exceptions import RateLimitError
+from fakeredis import FakeAsyncRedis, FakeServer
+from pytest_mock import MockerFixture
+
+import redis.asyncio as aioredis
+
+# Captured at collection, before `_mock_limiters` (tests/conftest.py) replaces `SlidingWindowRateLimiter.__call__`.
+LIMITER_CALLS = {cls: cls.__call__ for cls in BaseRedisRateLimiter.__subclasses__()}
+WINDOW_START = pendulum.datetime(2025, 1, 1, 12)
+# Seconds from `WINDOW_START`: a burst over the limit, then calls across the next windows (at 80 seconds the sliding
+# window weight is exactly at the limit).
+OFFSETS = (1, 2, 3, 4, 5, 20, 61, 62, 80, 100, 110, 130)
+
+
+async def _fixed_window(limiter: BaseRedisRateLimiter, redis_client: aioredis.Redis, now: pendulum.DateTime) -> bool:
+    """Redis logic of `FixedWindowRateLimiter` before Lua scripts."""
+    key = limiter.key(request=_request(), now=now)
+    counter = await redis_client.incr(name=key)
+    if counter == 1:
+        await redis_client.expire(name=key, time=limiter.expiration(now=now))
+    return counter <= limiter.rate.number
+
+
+async def _sliding_window(limiter: BaseRedisRateLimiter, redis_client: aioredis.Redis, now: pendulum.DateTime) -> bool:
+    """Redis logic of `SlidingWindowRateLimiter` before Lua scripts."""
+    key = limiter.key(request=_request(), now=now)
+    count = int(await redis_client.get(name=key) or 0)
+    if count >= limiter.rate.number:
+        return False
+    prev_count = int(await redis_client.get(name=limiter.key(request=_request(), now=now, previous=True)) or 0)
+    prev_percentage = (now.timestamp() % limiter.rate.seconds) / limiter.rate.seconds
+    if prev_count * (1 - prev_percentage) + count >= limiter.rate.number:
+        return False
+    expiration = (limiter.current_window_start(now=now) + datetime.timedelta(seconds=limiter.rate.seconds * 2)) - now
+    await redis_client.incr(name=key)
+    await redis_client.expire(name=key, time=expiration.seconds)
+    return True
+
+
+async def _token_bucket(limiter: BaseRedisRateLimiter, redis_client: aioredis.Redis, now: pendulum.DateTime) -> bool:
+    """Redis logic of `TokenBucketRateLimiter` before Lua scripts."""
+    key = limiter.key(request=_request(), now=now)
+    data = await redis_client.hgetall(name=key)
+    latest_reset_time = data.get(
+        "latest_reset_time",
+        (now - datetime.timedelta(seconds=limiter.rate.seconds)).timestamp(),
+    )
+    if (now - pendulum.from_timestamp(timestamp=int(latest_reset_time))).seconds >= limiter.rate.seconds:
+        await redis_client.hset(
+            name=key, mapping={"counter": limiter.rate.number, "latest_reset_time": int(now.timestamp())}
+        )
+    elif int(await redis_client.hget(name=key, key="counter")) <= 0:
+        return False
+    await redis_client.hincrby(name=key, key="counter", amount=-1)
+    await redis_client.expire(name=key, time=limiter.expiration(now=now))
+    return True
+
+
+def _request() -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        url=types.SimpleNamespace(path="/api/v1/login/"), client=types.SimpleNamespace(host="127.0.0.1")
+    )
+
+
+def _redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis(server=FakeServer(), decode_responses=True)
+
+
+async def _call(limiter: BaseRedisRateLimiter, redis_client: aioredis.Redis) -> bool:
+    try:
+        await LIMITER_CALLS[type(limiter)](
+            limiter,
+            request=_request(),
+            response=types.SimpleNamespace(headers={}),
+            redis_client=redis_client,
+        )
+    except RateLimitError:
+        return False
+    return True
+
+
+class TestRateLimiters:
+    async def test_load_scripts(self) -> None:
+        redis_client = _redis()
+        shas = [hashlib.sha1(cls.lua_script.encode()).hexdigest() for cls in LIMITER_CALLS]  # noqa: S324
+
+        assert await redis_client.script_exists(*shas) == [False] * len(shas)
+        await load_rate_limiters_scripts(redis_client=redis_client)
+
+        assert await redis_client.script_exists(*shas) == [True] * len(shas)
+
+    @pytest.mark.parametrize(
+        "limiter_class", [FixedWindowRateLimiter, SlidingWindowRateLimiter, TokenBucketRateLimiter]
+    )
+    async def test_noscript_fallback(self, mocker: MockerFixture, limiter_class: type[BaseRedisRateLimiter]) -> None:
+        redis_client = _redis()
+        limiter = limiter_class(rate=Rate(number=3, period=RatePeriod.MINUTE))
+        mocker.patch.object(limiter, "now", return_value=WINDOW_START.add(seconds=1))
+        evalsha = mocker.spy(redis_client, "evalsha")
+        script_load = mocker.spy(redis_client, "script_load")
+
+        assert await _call(limiter=limiter, redis_client=redis_client)
+        assert await _call(limiter=limiter, redis_client=redis_client)
+
+        # NOSCRIPT on the first EVALSHA loads the script once, the next calls go straight to EVALSHA.
+        script_load.assert_called_once_with(limiter_class.lua_script)
+        assert evalsha.call_count == 3  # noqa: PLR2004
+        assert {call.args[0] for call in evalsha.call_args_list} == {limiter._script.sha}
+
+    @pytest.mark.parametrize(
+        ("limiter_class", "previous"),
+        [
+            (FixedWindowRateLimiter, _fixed_window),
+            (SlidingWindowRateLimiter, _sliding_window),
+            (TokenBucketRateLimiter, _token_bucket),
+        ],
+    )
+    async def test_decisions(self, mocker: MockerFixture, limiter_class: type[BaseRedisRateLimiter], previous) -> None:
+        limiter = limiter_class(rate=Rate(number=3, period=RatePeriod.MINUTE))
+        now_mock = mocker.patch.object(limiter, "now")
+        redis_client, previous_redis_client = _redis(), _redis()
+        expected, result = [], []
+
+        for offset in OFFSETS:
+            now = now_mock.return_value = WINDOW_START.add(seconds=offset)
+            expected.append(await previous(limiter=limiter, redis_client=previous_redis_client, now=now))
+            result.append(await _call(limiter=limiter, redis_client=redis_client))
+
+        assert result == expected
+        assert True in result
+        assert False in result
+        keys = sorted(await redis_client.keys())
+        assert keys == sorted(await previous_redis_client.keys())
+        assert all(ttl > 0 for ttl in [await redis_client.ttl(key) for key in keys])
@@ -1,13 +1,18 @@
+import asyncio
 import datetime
+import threading
 
 import pytest
 from core.enums import TokenAudience
 from core.exceptions import BackendError
 from core.helpers import utc_now
+from core.managers.executors import BoundedExecutor
+from core.managers.hashers import Argon2Hasher, BaseHasher, BCryptHasher, HashersRegistry, ScryptHasher
 from core.managers.passwords import PasswordsManager
 from core.managers.schemas import TokenOptionsSchema, TokenPayloadSchema
 from core.managers.tokens import TokensManager
 from faker import Faker
+from fastapi import status
 
 
 class TestPasswordsManager:
@@ -24,6 +29,116 @@ class TestPasswordsManager:
         assert self.passwords_manager.check_password(password=password, password_hash=password_hash) is True
         assert self.passwords_manager.check_password(password="fail", password_hash=password_hash) is False
 
+    async def test_manager_async(self, faker: Faker) -> None:
+        password = self.passwords_manager.generate_password(length=faker.pyint(min_value=8, max_value=32))
+
+        password_hash = await self.passwords_manager.make_password_async(password=password)
+
+        assert await self.passwords_manager.check_password_async(password=password, password_hash=password_hash)
+        assert not await self.passwords_manager.check_password_async(password="fail", password_hash=password_hash)
+
+
+class TestHashers:
+    @pytest.mark.parametrize(
+        argnames="hasher",
+        argvalues=[
+            BCryptHasher(rounds=4),
+            Argon2Hasher(time_cost=1, memory_cost=1024, parallelism=1),
+            ScryptHasher(ln=4),
+        ],
+    )
+    def test_hash_verify(self, hasher: BaseHasher, faker: Faker) -> None:
+        password = faker.password()
+
+        password_hash = hasher.hash(password=password)
+
+        assert hasher.identify(password_hash=password_hash) is True
+        assert hasher.verify(password=password, password_hash=password_hash) is True
+        assert hasher.verify(password=faker.password(), password_hash=password_hash) is False
+        assert hasher.needs_rehash(password_hash=password_hash) is False
+
+    def test_needs_rehash(self, faker: Faker) -> None:
+        password = faker.password()
+        scrypt_hash = ScryptHasher(ln=5, r=4).hash(password=password)
+        argon2_hash = Argon2Hasher(time_cost=1, memory_cost=2048, parallelism=1).hash(password=password)
+
+        # Each parameter is compared on its own: stronger one doesn't make up for weaker one.
+        assert ScryptHasher(ln=4, r=8).needs_rehash(password_hash=scrypt_hash) is True
+        assert ScryptHasher(ln=4, r=4).needs_rehash(password_hash=scrypt_hash) is False
+        assert Argon2Hasher(time_cost=2, memory_cost=1024, parallelism=1).needs_rehash(password_hash=argon2_hash)
+        assert not Argon2Hasher(time_cost=1, memory_cost=1024, parallelism=1).needs_rehash(password_hash=argon2_hash)
+        assert not BCryptHasher(rounds=4).needs_rehash(password_hash=BCryptHasher(rounds=5).hash(password=password))
+
+    def test_registry_rehash(self, faker: Faker) -> None:
+        password = faker.password()
+        weak_scrypt, bcrypt_hasher = ScryptHasher(ln=4), BCryptHasher(rounds=4)
+        registry = HashersRegistry(hashers=[bcrypt_hasher, ScryptHasher(ln=5)], default="scrypt")
+        passwords_manager = PasswordsManager(registry=registry)
+
+        assert registry.identify(password_hash=bcrypt_hasher.hash(password=password)) is bcrypt_hasher
+        assert passwords_manager.verify_and_update(
+            password=faker.password(),
+            password_hash=weak_scrypt.hash(password=password),
+        ) == (False, None)
+        for password_hash in (bcrypt_hasher.hash(password=password), weak_scrypt.hash(password=password)):
+            is_valid, new_password_hash = passwords_manager.verify_and_update(
+                password=password,
+                password_hash=password_hash,
+            )
+            assert is_valid is True
+            assert new_password_hash.startswith("$scrypt$ln=5,")
+            assert passwords_manager.verify_and_update(
+                password=password,
+                password_hash=new_password_hash,
+            ) == (True, None)
+
+    def test_unknown_hash(self, faker: Faker) -> None:
+        passwords_manager = PasswordsManager()
+
+        assert passwords_manager.check_password(password=faker.password(), password_hash=faker.pystr()) is False
+
+
+class TestBoundedExecutor:
+    async def test_run(self, faker: Faker) -> None:
+        executor = BoundedExecutor(max_workers=1, max_queue=0)
+        value = faker.pystr()
+
+        result = await executor.run(str.upper, value)
+
+        assert result == value.upper()
+        assert executor.pending == 0
+        executor.shutdown()
+
+    async def test_saturated(self) -> None:
+        executor = BoundedExecutor(max_workers=1, max_queue=0)
+        event = threading.Event()
+        running = asyncio.ensure_future(executor.run(event.wait, 5))
+        await asyncio.sleep(0)
+
+        with pytest.raises(BackendError) as exception_context:
+            await executor.run(str.upper, "value")
+
+        event.set()
+        assert await running is True
+        assert exception_context.value.code == status.HTTP_503_SERVICE_UNAVAILABLE
+        executor.shutdown()
+
+    async def test_cancelled(self) -> None:
+        executor = BoundedExecutor(max_workers=1, max_queue=0)
+        event = threading.Event()
+        running = asyncio.ensure_future(executor.run(event.wait, 5))
+        await asyncio.sleep(0)
+
+        running.cancel()
+        await asyncio.gather(running, return_exceptions=True)
+
+        assert executor.pending == 1  # The call still occupies the worker.
+        with pytest.raises(BackendError):
+            await executor.run(str.upper, "value")
+        event.set()
+        executor.shutdown()
+        assert executor.pending == 0
+
 
 class TestTokensManager:
     @classmethod
@@ -0,0 +1,37 @@
+import types
+from collections.abc import AsyncIterator
+
+import orjson
+import pytest
+from core.responses import iter_json_array, iter_ndjson
+from core.schemas.responses import BaseResponseSchema
+from faker import Faker
+from pydantic import Field
+
+
+class ItemResponse(BaseResponseSchema):
+    first_name: str = Field(alias="firstName")
+
+
+async def _objects(names: list[str]) -> AsyncIterator[types.SimpleNamespace]:
+    for name in names:
+        yield types.SimpleNamespace(first_name=name)
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("count", [0, 1, 5])
+    async def test_iter_ndjson(self, faker: Faker, count: int) -> None:
+        names = [faker.first_name() for _ in range(count)]
+
+        chunks = [chunk async for chunk in iter_ndjson(objects=_objects(names), schema=ItemResponse, chunk_size=2)]
+
+        assert len(chunks) == (count + 1) // 2
+        assert [orjson.loads(line) for line in b"".join(chunks).splitlines()] == [{"firstName": n} for n in names]
+
+    @pytest.mark.parametrize("count", [0, 1, 5])
+    async def test_iter_json_array(self, faker: Faker, count: int) -> None:
+        names = [faker.first_name() for _ in range(count)]
+
+        chunks = [chunk async for chunk in iter_json_array(objects=_objects(names), schema=ItemResponse, chunk_size=2)]
+
+        assert orjson.loads(b"".join(chunks)) == [{"firstName": n} for n in names]
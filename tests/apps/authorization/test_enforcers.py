@@ -0,0 +1,124 @@
+import asyncio
+import pathlib
+import types
+import typing
+
+import orjson
+import pytest
+from casbin.model.policy_op import PolicyOp
+from casbin.persist.adapters.asyncio import AsyncFileAdapter
+from domain.authorization.dependencies import IsAuthorized
+from domain.authorization.enforcers import PolicyEnforcer
+from domain.authorization.exceptions import BackendPermissionError
+from domain.authorization.tables import CasbinRule
+from fakeredis import FakeAsyncRedis, FakeServer
+from pytest_mock import MockerFixture
+
+import redis.exceptions
+
+POLICY = "p, Admins, /api/v1/users/*, GET\ng, alice, Admins\n"
+
+
+async def _enforcer(mocker: MockerFixture, tmp_path: pathlib.Path, redis_client: object = None) -> PolicyEnforcer:
+    policy_path = tmp_path / "policy.csv"
+    policy_path.write_text(POLICY)
+    adapter_mock = mocker.patch(
+        "domain.authorization.enforcers.casbin_async_sqlalchemy_adapter.Adapter",
+        return_value=AsyncFileAdapter(file_path=f"{policy_path}"),
+    )
+    enforcer = PolicyEnforcer(redis_client=redis_client)
+    engine = mocker.sentinel.engine
+
+    await enforcer.setup(engine=engine)
+
+    adapter_mock.assert_called_once_with(engine=engine, db_class=CasbinRule)
+    return enforcer
+
+
+async def _wait_for(condition: typing.Callable[[], bool]) -> None:
+    async def _poll() -> None:
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_poll(), timeout=5)
+
+
+class TestPolicyEnforcer:
+    async def test_not_set_up(self) -> None:
+        enforcer = PolicyEnforcer(redis_client=None)
+        request = types.SimpleNamespace(
+            user=types.SimpleNamespace(identity="alice"),
+            url=types.SimpleNamespace(path="/api/v1/users/1"),
+            method="GET",
+        )
+
+        assert enforcer.enforce("alice", "/api/v1/users/1", "GET") is False
+        with pytest.raises(BackendPermissionError) as error:
+            await IsAuthorized(enforcer=enforcer)(request=request)
+        assert error.value.code == 403  # noqa: PLR2004
+
+    async def test_enforce(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        enforcer = await _enforcer(mocker=mocker, tmp_path=tmp_path)
+        casbin_enforce = mocker.spy(enforcer.enforcer, "enforce")
+
+        assert enforcer.enforce("alice", "/api/v1/users/1", "GET") is True
+        assert enforcer.enforce("alice", "/api/v1/users/1", "GET") is True
+        assert enforcer.enforce("alice", "/api/v1/users/1", "DELETE") is False
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is False
+        # Repeated decision is taken from cache.
+        assert casbin_enforce.call_count == 3  # noqa: PLR2004
+
+    async def test_apply(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        enforcer = await _enforcer(mocker=mocker, tmp_path=tmp_path)
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is False
+
+        assert enforcer.apply(op=PolicyOp.Policy_add, ptype="g", rule=["bob", "Admins"]) is True
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is True
+
+        assert enforcer.apply(op=PolicyOp.Policy_remove, ptype="p", rule=["Admins", "/api/v1/users/*", "GET"]) is True
+        assert enforcer.enforce("alice", "/api/v1/users/1", "GET") is False
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is False
+
+    async def test_listen(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        redis_client = FakeAsyncRedis(server=FakeServer())
+        enforcer = await _enforcer(mocker=mocker, tmp_path=tmp_path, redis_client=redis_client)
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is False
+        own = {
+            "worker": enforcer._worker_id,
+            "op": PolicyOp.Policy_add.value,
+            "ptype": "g",
+            "rule": ["carol", "Admins"],
+        }
+        other = {"worker": "other", "op": PolicyOp.Policy_add.value, "ptype": "g", "rule": ["bob", "Admins"]}
+        listener = asyncio.create_task(enforcer.listen())
+
+        try:
+            # Until subscribed, nobody receives the message.
+            while not await redis_client.publish(channel=enforcer._channel, message=orjson.dumps(own)):
+                await asyncio.sleep(0.01)
+            await redis_client.publish(channel=enforcer._channel, message=orjson.dumps(other))
+            await _wait_for(lambda: enforcer.enforce("bob", "/api/v1/users/1", "GET"))
+        finally:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+        # Own changes are already applied by the worker that made them.
+        assert enforcer.enforce("carol", "/api/v1/users/1", "GET") is False
+
+    async def test_listen_reconnect(self, mocker: MockerFixture, tmp_path: pathlib.Path) -> None:
+        redis_client = types.SimpleNamespace(
+            pubsub=mocker.Mock(side_effect=[redis.exceptions.ConnectionError(), asyncio.CancelledError()]),
+        )
+        enforcer = await _enforcer(mocker=mocker, tmp_path=tmp_path, redis_client=redis_client)
+        enforcer.apply(op=PolicyOp.Policy_add, ptype="g", rule=["bob", "Admins"])
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is True
+        mocker.patch("domain.authorization.enforcers.asyncio.sleep", new_callable=mocker.AsyncMock)
+        load_policy = mocker.spy(enforcer.enforcer, "load_policy")
+
+        with pytest.raises(asyncio.CancelledError):
+            await enforcer.listen()
+
+        # Updates could be lost while disconnected, so the policy is reloaded from the adapter.
+        load_policy.assert_awaited_once()
+        assert enforcer.enforce("bob", "/api/v1/users/1", "GET") is False
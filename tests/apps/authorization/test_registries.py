@@ -0,0 +1,32 @@
+from domain.authorization.registries import PermissionsRegistry
+from faker import Faker
+
+
+class TestPermissionsRegistry:
+    def test_bit_interned(self, faker: Faker) -> None:
+        registry = PermissionsRegistry()
+        permission = (faker.pystr(), faker.pystr())
+
+        first_bit = registry.bit(permission=permission)
+        second_bit = registry.bit(permission=permission)
+
+        assert first_bit == second_bit == 1
+        assert len(registry) == 1
+
+    def test_mask(self) -> None:
+        registry = PermissionsRegistry()
+
+        result = registry.mask(permissions=[("user", "read"), ("user", "update"), ("user", "read")])
+
+        assert result == 0b11
+        assert registry.mask(permissions=[("group", "read")]) == 0b100
+        assert registry.mask(permissions=[]) == 0
+
+    def test_permissions(self) -> None:
+        registry = PermissionsRegistry()
+        permissions = {("user", "read"), ("user", "update"), ("__all__", "delete")}
+        mask = registry.mask(permissions=permissions)
+
+        result = registry.permissions(mask=mask)
+
+        assert result == permissions
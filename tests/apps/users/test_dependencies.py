@@ -0,0 +1,38 @@
+import types
+
+import pytest
+from core.enums import FOps
+from core.exceptions import BackendError
+from domain.users.dependencies import users_filtration
+from domain.users.enums import UserStatuses
+from domain.users.tables import User
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+
+def _request() -> types.SimpleNamespace:
+    return types.SimpleNamespace(state=types.SimpleNamespace())
+
+
+class TestUsersFiltration:
+    async def test_status(self) -> None:
+        filters = [
+            {"f": "status", "o": "in", "v": [UserStatuses.CONFIRMED.value, UserStatuses.ARCHIVED.value]},
+            {"f": "status", "o": "!=", "v": UserStatuses.UNCONFIRMED.value},
+        ]
+
+        filtration = await users_filtration(request=_request(), filtration=filters)
+        compiled = select(User.id).where(*filtration).compile(dialect=postgresql.dialect())
+
+        assert filtration.shape == (("status", FOps.IN), ("status", FOps.NE))
+        assert filtration.params == {
+            "filtration_0": [UserStatuses.CONFIRMED, UserStatuses.ARCHIVED],
+            "filtration_1": UserStatuses.UNCONFIRMED,
+        }
+        assert 'WHERE "user".status IN (__[POSTCOMPILE_filtration_0]) AND "user".status != %(filtration_1)s' in str(
+            compiled
+        )
+
+    async def test_status_invalid(self) -> None:
+        with pytest.raises(BackendError):
+            await users_filtration(request=_request(), filtration=[{"f": "status", "o": "in", "v": ["X"]}])
@@ -0,0 +1,59 @@
+"""Micro-benchmark for `Filtration.parse_query_filters` (not collected by pytest).
+
+Compares the previous pipeline (FastAPI builds `FiltrationRequest`, then each filter is re-validated by its per-field
+model) with the current one (raw body is validated once by `Filtration.filters_adapter`).
+
+Usage:
+    python -m tests.benchmarks.bench_filtration
+"""
+
+import timeit
+
+from core.annotations import DictStrOfAny
+from core.dependencies.body.filtration import F, Filtration, FiltrationRequest, QueryFilter
+from core.enums import FOps
+from domain.users.schemas.responses import UserResponseSchema
+from domain.users.tables import User
+from pydantic import TypeAdapter
+
+NUMBER = 2_000
+FILTERS = [
+    {"f": "first_name", "o": "ilike", "v": "John"},
+    {"f": "last_name", "o": "in", "v": ["Doe", "Smith"]},
+    {"f": "email", "o": "notnull", "v": None},
+]
+
+
+REQUEST_ADAPTER = TypeAdapter(list[FiltrationRequest] | None)
+
+
+def previous_parse_query_filters(filtration: Filtration, filters_list: list[DictStrOfAny]) -> list[QueryFilter]:
+    result = []
+    for fltr in REQUEST_ADAPTER.validate_python(filters_list):
+        if fltr.field in filtration.filters_mapping:
+            data = {"field": fltr.field, "operation": fltr.operation, "value": fltr.value}
+            result.append(filtration.filters_mapping[fltr.field].model_validate(data))
+    return result
+
+
+def main() -> None:
+    filtration = Filtration(
+        model=User,
+        schema=UserResponseSchema,
+        filters=[
+            F(query_field_name="first_name", possible_operations=list(FOps), value_type=str),
+            F(query_field_name="last_name", possible_operations=list(FOps), value_type=list[str] | str),
+            F(query_field_name="email", possible_operations=list(FOps), value_type=str | None),
+        ],
+    )
+    benchmarks = {
+        "previous": lambda: previous_parse_query_filters(filtration=filtration, filters_list=FILTERS),
+        "current": lambda: filtration.parse_query_filters(filters_list=FILTERS),
+    }
+    for name, func in benchmarks.items():
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>8}: {seconds / NUMBER / len(FILTERS) * 1_000_000:.2f} us per filter")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark of Redis dependency: per-request `client()` context vs the shared pooled client (not collected by pytest).
+
+Each "request" runs one `PING`, requests run concurrently in batches (like concurrent requests of a worker).
+Requires Redis from settings (`REDIS_*`).
+
+Usage:
+    python -m tests.benchmarks.bench_redis_client
+"""
+
+import asyncio
+import time
+import typing
+
+from core.db.bases import redis_engine
+
+REQUESTS = 10_000
+CONCURRENCY = 50
+
+
+async def previous_request() -> None:
+    async with redis_engine.client() as conn:
+        try:
+            await conn.ping()
+        finally:
+            await conn.aclose()
+
+
+async def current_request() -> None:
+    await redis_engine.ping()
+
+
+async def run(request: typing.Callable[[], typing.Awaitable[None]]) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS // CONCURRENCY):
+        await asyncio.gather(*(request() for _ in range(CONCURRENCY)))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    await current_request()  # Warm up the pool.
+    for name, request in {"previous": previous_request, "current": current_request}.items():
+        seconds = await run(request=request)
+        print(f"{name:>8}: {seconds / REQUESTS * 1_000_000:.2f} us per request, {REQUESTS / seconds:.0f} rps")  # noqa: T201
+    print(f"    pool: {redis_engine.connection_pool.snapshot()}")  # noqa: T201
+    await redis_engine.aclose(close_connection_pool=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())